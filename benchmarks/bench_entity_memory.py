@@ -0,0 +1,57 @@
+"""
+Замер памяти, занимаемой сущностями (байт на объект): создается count сообщений (TxMessage) и count заголовков
+(BlockHeader), занятая память считается через tracemalloc.
+
+Запуск (из корня репозитория): python -m benchmarks.bench_entity_memory [--count 1000000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from src.entities import block_header
+from src.entities import tx_message
+
+
+# region Константы
+DEFAULT_COUNT: int = 1_000_000
+""" Количество объектов каждого вида по умолчанию """
+# endregion
+
+
+def bytes_per_object(factory, count: int) -> float:
+    """ Средний объем памяти (в байтах), занимаемый одним объектом, созданным через factory """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def make_message() -> tx_message.TxMessage:
+    """ Сообщение с заполненными полями """
+    msg = tx_message.TxMessage()
+    msg.sender = 'sender'
+    msg.acceptor = 'acceptor'
+    msg.content = 'content'
+    return msg
+
+
+def make_header() -> block_header.BlockHeader:
+    """ Заголовок генезис-блока """
+    return block_header.BlockHeader(True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Memory used by TxMessage and BlockHeader instances')
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT, help='number of objects of each kind')
+    args = parser.parse_args()
+    print(f'TxMessage:   {bytes_per_object(make_message, args.count):8.1f} bytes per object ({args.count} objects)')
+    print(f'BlockHeader: {bytes_per_object(make_header, args.count):8.1f} bytes per object ({args.count} objects)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Замер пропускной способности пула транзакций (Mempool): добавление count транзакций (с вытеснением при переполнении),
+выборка лучших транзакций и удаление.
+
+Запуск (из корня репозитория): python -m benchmarks.bench_mempool [--count 200000]
+"""
+
+import argparse
+import time
+
+from src.engines import mempool
+from src.entities import tx_message
+from src.frontier import chronos
+
+
+# region Константы
+DEFAULT_COUNT: int = 200_000
+""" Количество транзакций по умолчанию """
+# endregion
+
+
+def make_messages(count: int) -> list[tx_message.TxMessage]:
+    """ Различные сообщения (хэши вычисляются заранее, чтобы не входить в замер) """
+    moment = chronos.this_moment()
+    messages = [tx_message.TxMessage.from_fields(moment, f'sender {i % 1000}', 'acceptor', f'content {i}', '')
+                for i in range(count)]
+    for msg in messages:
+        msg.hash_bytes()
+    return messages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Mempool insert/take/remove throughput')
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT, help='number of transactions')
+    args = parser.parse_args()
+    messages = make_messages(args.count)
+    pool = mempool.Mempool(max_bytes=args.count * 64, priority=lambda tx: len(tx.content))
+    started = time.perf_counter()
+    pool.add_many(messages)
+    added = time.perf_counter() - started
+    kept = len(pool)
+    started = time.perf_counter()
+    taken = pool.take(pool.size_in_bytes // 2)
+    took = time.perf_counter() - started
+    started = time.perf_counter()
+    pool.remove_many(messages)
+    removed = time.perf_counter() - started
+    print(f'add:    {args.count / added:12,.0f} tx/s ({kept} kept within the size limit)')
+    print(f'take:   {len(taken) / took:12,.0f} tx/s ({len(taken)} taken)')
+    print(f'remove: {args.count / removed:12,.0f} tx/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Сравнение форматов сериализации блоков (JSON и MessagePack, см. jsonifier): размер потока и время записи/чтения
+последовательности блоков (от объектов Block до потока и обратно, см. block.pack_blocks / block.unpack_blocks).
+
+Запуск (из корня репозитория): python -m benchmarks.bench_serializers [--blocks 200] [--txs 500]
+"""
+
+import argparse
+import io
+import time
+
+from src.entities import block
+from src.entities import tx_message
+from src.frontier import chronos
+from src.frontier import jsonifier
+
+
+# region Константы
+DEFAULT_BLOCKS: int = 200
+""" Количество блоков по умолчанию """
+
+DEFAULT_TXS: int = 500
+""" Количество транзакций в блоке по умолчанию """
+# endregion
+
+
+def make_blocks(count: int, txs: int) -> list[block.Block]:
+    """ Связанная последовательность блоков с транзакциями """
+    moment = chronos.this_moment()
+    blocks = []
+    for height in range(count):
+        b = block.Block(height == 0)
+        if height:
+            b.header.height = height
+            b.header.prev_hash = blocks[-1].header.hash()
+        b.extend(tx_message.TxMessage.from_fields(moment, f'sender {i % 50}', 'acceptor', f'content {height}/{i}', '')
+                 for i in range(txs))
+        blocks.append(b)
+    return blocks
+
+
+def measure(serializer: jsonifier.Serializer, blocks: list[block.Block]) -> tuple[int, float, float]:
+    """ Размер потока, время записи и время чтения (с восстановлением блоков) """
+    stream = io.BytesIO()
+    started = time.perf_counter()
+    block.pack_blocks(blocks, stream, serializer)
+    packed = time.perf_counter() - started
+    stream.seek(0)
+    started = time.perf_counter()
+    for _ in block.unpack_blocks(stream, serializer):
+        pass
+    unpacked = time.perf_counter() - started
+    return len(stream.getvalue()), packed, unpacked
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='JSON vs MessagePack block stream size and speed')
+    parser.add_argument('--blocks', type=int, default=DEFAULT_BLOCKS, help='number of blocks')
+    parser.add_argument('--txs', type=int, default=DEFAULT_TXS, help='number of transactions per block')
+    args = parser.parse_args()
+    blocks = make_blocks(args.blocks, args.txs)
+    for serializer in (jsonifier.JSON, jsonifier.MSGPACK):
+        size, packed, unpacked = measure(serializer, blocks)
+        print(f'{serializer.name:8} {size:12,} bytes; pack {packed * 1000:8.1f} ms; unpack {unpacked * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""
+Сборка шаблона блока из пула неподтвержденных транзакций: лучшие транзакции пула (см. Mempool.best) добавляются
+в блок одним пакетом, пока размер блока в двоичном представлении не достигнет ограничения (размеры транзакций
+известны заранее, поэтому блок не кодируется для проверки). Заголовок нового блока продолжает цепочку: высота
+на единицу больше высоты вершины, prev_hash — хэш ее заголовка, корень дерева Меркла — по добавленным транзакциям.
+
+Транзакции остаются в пуле: после того, как блок найден и принят, их следует удалить (Mempool.remove_many)
+"""
+
+from src.engines import mempool as mpl
+from src.entities import block as blk
+from src.entities import block_wire
+from src.ground import cnst
+from src.ground import errs
+
+
+def assemble(pool: mpl.Mempool, tip=None, max_bytes: int = cnst.MAX_BLOCK_SIZE,
+             difficulty: int | None = None) -> blk.Block:
+    """ Шаблон блока, продолжающего цепочку после tip (BlockHeader или BlockHeaderView; None — генезис-блок),
+    размером не более max_bytes; сложность по умолчанию наследуется от вершины """
+    budget = max_bytes - block_wire.EMPTY_BLOCK_SIZE
+    if budget < 0:
+        raise ValueError(errs.BLOCK_SIZE_LIMIT_TOO_SMALL)
+    block = blk.Block(tip is None)
+    header = block.header
+    if tip is not None:
+        header.height = tip.height + 1
+        header.prev_hash = tip.hash()
+        header.difficulty = tip.difficulty
+    if difficulty is not None:
+        header.difficulty = difficulty
+    block.extend(pool.best(budget))
+    return block
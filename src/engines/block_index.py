@@ -0,0 +1,260 @@
+"""
+Постоянные (хранящиеся на диске) индексы блоков:
+ ▪️ HeightIndex — высота → расположение блока (номер сегмента, смещение, длина): плотный массив записей фиксированной
+   длины, запись номер h соответствует высоте h;
+ ▪️ HashIndex — хэш блока → высота: хэш-таблица с открытой адресацией (линейное пробирование) в отображенном в память
+   файле;
+ ▪️ BloomIndex — высота → фильтр Блума блока (см. bloom_filter): фильтры переменной длины подряд в файле данных
+   и плотный массив смещений их концов.
+
+Все индексы обновляются при каждом добавлении блока, а при открытии не читаются целиком (файл просто отображается
+в память), поэтому загрузка занимает O(1)
+"""
+
+import mmap
+import os
+import struct
+
+from src.ground import cnst
+from src.ground import errs
+
+
+# region Константы
+HEIGHT_RECORD_STRUCT = struct.Struct('>IQI')
+""" Запись индекса высот: номер сегмента, смещение блока в сегменте, длина блока """
+
+HASH_TABLE_HEADER_STRUCT = struct.Struct('>QQ')
+""" Заголовок файла хэш-таблицы: количество ячеек (степень двойки) и количество занятых ячеек """
+
+HASH_SLOT_VALUE_STRUCT = struct.Struct('>Q')
+""" Значение в ячейке хэш-таблицы: высота + 1 (ноль означает пустую ячейку) """
+
+HASH_SLOT_SIZE: int = cnst.HASH_BYTE_LENGTH + HASH_SLOT_VALUE_STRUCT.size
+""" Размер ячейки хэш-таблицы (ключ — «сырые» байты хэша, значение — высота + 1) """
+
+HASH_TABLE_INITIAL_CAPACITY: int = 1024
+""" Начальное количество ячеек хэш-таблицы """
+
+HASH_TABLE_MAX_LOAD: float = 0.5
+""" Максимальная доля занятых ячеек (при превышении таблица увеличивается вдвое) """
+
+EMPTY_SLOT: int = 0
+""" Значение пустой ячейки """
+
+BLOOM_END_STRUCT = struct.Struct('>Q')
+""" Запись индекса фильтров Блума: смещение конца фильтра в файле данных """
+# endregion
+
+
+class HeightIndex:
+    """ Индекс высота → расположение блока (плотный массив записей фиксированной длины в файле) """
+
+    def __init__(self, path: str) -> None:
+        self._path: str = path
+        self._writer = open(path, 'ab')
+        self._count: int = os.path.getsize(path) // HEIGHT_RECORD_STRUCT.size
+        if self._count * HEIGHT_RECORD_STRUCT.size != os.path.getsize(path):
+            self._writer.truncate(self._count * HEIGHT_RECORD_STRUCT.size)  # незавершенная запись (например, при сбое)
+        self._map: mmap.mmap | None = None
+
+    def __len__(self) -> int:
+        """ Количество записей (высота следующего блока) """
+        return self._count
+
+    def append(self, segment: int, offset: int, length: int) -> None:
+        """ Добавление расположения очередного блока """
+        self._writer.write(HEIGHT_RECORD_STRUCT.pack(segment, offset, length))
+        self._writer.flush()
+        self._count += 1
+
+    def location(self, height: int) -> tuple[int, int, int]:
+        """ Расположение блока с указанной высотой: номер сегмента, смещение и длина """
+        if not 0 <= height < self._count:
+            raise IndexError(errs.BLOCK_NOT_IN_STORE)
+        end = (height + 1) * HEIGHT_RECORD_STRUCT.size
+        if self._map is None or len(self._map) < end:
+            self._unmap()
+            with open(self._path, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return HEIGHT_RECORD_STRUCT.unpack_from(self._map, height * HEIGHT_RECORD_STRUCT.size)
+
+    def _unmap(self) -> None:
+        """ Закрытие отображения файла в память """
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def sync(self) -> None:
+        """ Сброс записанных данных на диск """
+        self._writer.flush()
+        os.fsync(self._writer.fileno())
+
+    def close(self) -> None:
+        """ Закрытие индекса """
+        self._unmap()
+        self._writer.close()
+
+
+class HashIndex:
+    """ Индекс хэш блока → высота (хэш-таблица с открытой адресацией в отображенном в память файле) """
+
+    def __init__(self, path: str) -> None:
+        self._path: str = path
+        if not os.path.exists(path) or os.path.getsize(path) < HASH_TABLE_HEADER_STRUCT.size:
+            _create_table(path, HASH_TABLE_INITIAL_CAPACITY)
+        self._open()
+
+    def _open(self) -> None:
+        """ Открытие файла таблицы и отображение его в память """
+        self._file = open(self._path, 'r+b')
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._capacity, self._count = HASH_TABLE_HEADER_STRUCT.unpack_from(self._map, 0)
+
+    def __len__(self) -> int:
+        """ Количество хэшей в индексе """
+        return self._count
+
+    def _slot_offset(self, slot: int) -> int:
+        """ Смещение ячейки в файле """
+        return HASH_TABLE_HEADER_STRUCT.size + slot * HASH_SLOT_SIZE
+
+    def _find(self, key: bytes) -> tuple[int, int]:
+        """ Поиск ключа: возвращает смещение ячейки (с этим ключом либо первой пустой) и сохраненное значение """
+        mask = self._capacity - 1
+        slot = int.from_bytes(key[:8], 'big') & mask
+        while True:
+            offset = self._slot_offset(slot)
+            value = HASH_SLOT_VALUE_STRUCT.unpack_from(self._map, offset + cnst.HASH_BYTE_LENGTH)[0]
+            if value == EMPTY_SLOT or self._map[offset:offset + cnst.HASH_BYTE_LENGTH] == key:
+                return offset, value
+            slot = (slot + 1) & mask
+
+    def get(self, key: bytes) -> int | None:
+        """ Высота блока с указанным хэшем («сырые» байты) или None, если такого блока нет """
+        value = self._find(key)[1]
+        return None if value == EMPTY_SLOT else value - 1
+
+    def put(self, key: bytes, height: int) -> None:
+        """ Запоминание высоты блока с указанным хэшем («сырые» байты) """
+        if (self._count + 1) > self._capacity * HASH_TABLE_MAX_LOAD:
+            self._grow()
+        offset, value = self._find(key)
+        self._map[offset:offset + cnst.HASH_BYTE_LENGTH] = key
+        HASH_SLOT_VALUE_STRUCT.pack_into(self._map, offset + cnst.HASH_BYTE_LENGTH, height + 1)
+        if value == EMPTY_SLOT:
+            self._count += 1
+            HASH_TABLE_HEADER_STRUCT.pack_into(self._map, 0, self._capacity, self._count)
+
+    def _grow(self) -> None:
+        """ Увеличение таблицы вдвое: все ключи переносятся во временный файл, который подменяет прежний, только когда
+        заполнен и сброшен на диск (при сбое на любом шаге на диске остается полная таблица) """
+        tmp_path = self._path + '.tmp'
+        _create_table(tmp_path, self._capacity * 2)
+        larger = HashIndex(tmp_path)
+        for slot in range(self._capacity):
+            offset = self._slot_offset(slot)
+            value = HASH_SLOT_VALUE_STRUCT.unpack_from(self._map, offset + cnst.HASH_BYTE_LENGTH)[0]
+            if value != EMPTY_SLOT:
+                larger.put(self._map[offset:offset + cnst.HASH_BYTE_LENGTH], value - 1)
+        larger.sync()
+        larger.close()
+        self.close()
+        os.replace(tmp_path, self._path)
+        self._open()
+
+    def sync(self) -> None:
+        """ Сброс записанных данных на диск """
+        self._map.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """ Закрытие индекса """
+        self._map.close()
+        self._file.close()
+
+
+class BloomIndex:
+    """ Индекс высота → фильтр Блума блока (файл данных с фильтрами и плотный массив смещений их концов) """
+
+    def __init__(self, data_path: str, ends_path: str) -> None:
+        self._data_path: str = data_path
+        self._ends_path: str = ends_path
+        self._data = open(data_path, 'ab')
+        self._ends = open(ends_path, 'ab')
+        self._count: int = os.path.getsize(ends_path) // BLOOM_END_STRUCT.size
+        self._data_map: mmap.mmap | None = None
+        self._ends_map: mmap.mmap | None = None
+        self.truncate(self._count)                             # незавершенная запись (например, при сбое)
+
+    def __len__(self) -> int:
+        """ Количество фильтров (высота следующего блока) """
+        return self._count
+
+    def _end(self, height: int) -> int:
+        """ Смещение конца фильтра блока с указанной высотой (-1 — начало файла данных) """
+        if height < 0:
+            return 0
+        if self._ends_map is None or len(self._ends_map) < (height + 1) * BLOOM_END_STRUCT.size:
+            _close_map(self._ends_map)
+            self._ends.flush()
+            with open(self._ends_path, 'rb') as f:
+                self._ends_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return BLOOM_END_STRUCT.unpack_from(self._ends_map, height * BLOOM_END_STRUCT.size)[0]
+
+    def append(self, bloom: bytes) -> None:
+        """ Добавление фильтра очередного блока """
+        self._data.write(bloom)
+        self._data.flush()
+        self._ends.write(BLOOM_END_STRUCT.pack(self._end(self._count - 1) + len(bloom)))
+        self._ends.flush()
+        self._count += 1
+
+    def bloom(self, height: int) -> memoryview:
+        """ Байты фильтра блока с указанной высотой (срез отображения файла данных в память) """
+        if not 0 <= height < self._count:
+            raise IndexError(errs.BLOCK_NOT_IN_STORE)
+        start, end = self._end(height - 1), self._end(height)
+        if self._data_map is None or len(self._data_map) < end:
+            _close_map(self._data_map)
+            with open(self._data_path, 'rb') as f:
+                self._data_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(self._data_map)[start:end]
+
+    def truncate(self, count: int) -> None:
+        """ Отбрасывание фильтров с высотой count и выше """
+        count = min(count, self._count)
+        size = self._end(count - 1)
+        self._data_map = _close_map(self._data_map)
+        self._ends_map = _close_map(self._ends_map)
+        self._data.truncate(size)
+        self._ends.truncate(count * BLOOM_END_STRUCT.size)
+        self._count = count
+
+    def sync(self) -> None:
+        """ Сброс записанных данных на диск """
+        for f in (self._data, self._ends):
+            f.flush()
+            os.fsync(f.fileno())
+
+    def close(self) -> None:
+        """ Закрытие индекса """
+        self._data_map = _close_map(self._data_map)
+        self._ends_map = _close_map(self._ends_map)
+        self._data.close()
+        self._ends.close()
+
+
+def _close_map(mapping: mmap.mmap | None) -> None:
+    """ Закрытие отображения файла в память (если на него еще есть ссылки, оно будет закрыто сборщиком мусора) """
+    if mapping is not None:
+        try:
+            mapping.close()
+        except BufferError:
+            pass
+
+
+def _create_table(path: str, capacity: int) -> None:
+    """ Создание файла пустой хэш-таблицы с указанным количеством ячеек """
+    with open(path, 'wb') as f:
+        f.write(HASH_TABLE_HEADER_STRUCT.pack(capacity, 0))
+        f.truncate(HASH_TABLE_HEADER_STRUCT.size + capacity * HASH_SLOT_SIZE)
@@ -0,0 +1,264 @@
+"""
+Хранилище блоков: блоки (в двоичном представлении, см. block_wire) дописываются в конец файлов-сегментов, а читаются
+через отображение сегментов в память (mmap), без промежуточного копирования в bytes.
+
+Запись в сегменте: длина блока (4 байта, старшие байты вперед) и сам блок. Когда сегмент достигает SEGMENT_MAX_SIZE,
+начинается следующий. Номер записи по порядку добавления совпадает с высотой блока.
+
+Расположение блоков по высоте, высоты по хэшу и фильтры Блума блоков (по отправителям, получателям и хэшам
+транзакций) хранятся в постоянных индексах (см. block_index). Поиск по диапазону высот проверяет сначала фильтр
+и разбирает только блоки, которые могут содержать искомое. При открытии
+просматривается только «хвост» сегментов после последнего проиндексированного блока (он мог не попасть в индексы,
+если запись прервалась)
+"""
+
+import mmap
+import os
+import struct
+
+from src.engines import block_index as bix
+from src.entities import block as blk
+from src.entities import block_header_wire as hdr_wire
+from src.entities import block_wire
+from src.entities import bloom_filter as bf
+from src.ground import errs
+
+
+# region Константы
+SEGMENT_MAX_SIZE: int = 256 * 1024 * 1024
+""" Размер сегмента, после которого начинается следующий (одна запись может выйти за эту границу) """
+
+SEGMENT_NAME_TEMPLATE: str = 'blocks_{:05d}.dat'
+""" Шаблон имени файла сегмента """
+
+RECORD_LENGTH_STRUCT = struct.Struct('>I')
+""" Длина записи (блока) в сегменте """
+
+HEIGHT_INDEX_NAME: str = 'heights.idx'
+""" Имя файла индекса высот """
+
+HASH_INDEX_NAME: str = 'hashes.idx'
+""" Имя файла индекса хэшей """
+
+BLOOM_DATA_NAME: str = 'blooms.dat'
+""" Имя файла фильтров Блума """
+
+BLOOM_INDEX_NAME: str = 'blooms.idx'
+""" Имя файла индекса фильтров Блума """
+# endregion
+
+
+class BlockStore:
+    """ Хранилище блоков в файлах-сегментах с чтением через mmap (используйте как контекстный менеджер) """
+
+    def __init__(self, path: str, segment_max_size: int = SEGMENT_MAX_SIZE) -> None:
+        """ Открытие (или создание) хранилища в каталоге path """
+        os.makedirs(path, exist_ok=True)
+        self._path: str = path
+        self._segment_max_size: int = segment_max_size
+        self._heights = bix.HeightIndex(os.path.join(path, HEIGHT_INDEX_NAME))
+        self._hashes = bix.HashIndex(os.path.join(path, HASH_INDEX_NAME))
+        self._blooms = bix.BloomIndex(os.path.join(path, BLOOM_DATA_NAME), os.path.join(path, BLOOM_INDEX_NAME))
+        self._maps: dict[int, mmap.mmap] = {}
+        self._segment: int = 0
+        self._segment_size: int = 0
+        self._writer = None
+        self._recover()
+        self._writer = open(self._segment_path(self._segment), 'ab')
+
+    def __enter__(self) -> 'BlockStore':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        """ Репрезентация (человеко-понятное описание объекта) """
+        descr = f'The append-only block store (instance of {__class__.__name__}) at {self._path}'
+        cnt = f'blocks: {len(self)}'
+        sgm = f'segments: {self._segment + 1}'
+        return f'{descr}:\n ▪️ {cnt};\n ▪️ {sgm}.\n'
+
+    def __len__(self) -> int:
+        """ Количество блоков в хранилище """
+        return len(self._heights)
+
+    def __iter__(self):
+        """ Последовательный перебор всех блоков """
+        for height in range(len(self)):
+            yield self.block_at(height)
+
+    def _segment_path(self, segment: int) -> str:
+        """ Путь к файлу сегмента """
+        return os.path.join(self._path, SEGMENT_NAME_TEMPLATE.format(segment))
+
+    def _recover(self) -> None:
+        """ Индексация записей, идущих после последнего проиндексированного блока (если индексов нет — всех) """
+        segment, pos = 0, 0
+        self._blooms.truncate(len(self._heights))
+        if len(self._heights):
+            segment, offset, length = self._heights.location(len(self._heights) - 1)
+            pos = offset + length
+        while os.path.exists(self._segment_path(segment)):
+            size = os.path.getsize(self._segment_path(segment))
+            self._segment, self._segment_size = segment, size
+            if size > pos:
+                buf = self._map(segment, size)
+                while pos + RECORD_LENGTH_STRUCT.size <= size:
+                    length = RECORD_LENGTH_STRUCT.unpack_from(buf, pos)[0]
+                    if pos + RECORD_LENGTH_STRUCT.size + length > size:
+                        break                                  # «хвост», не дописанный до конца (например, при сбое)
+                    offset = pos + RECORD_LENGTH_STRUCT.size
+                    self._register(segment, offset, length, blk.Block.from_buffer(buf, offset))
+                    pos = offset + length
+                if pos != size:
+                    self._truncate(segment, pos)
+            segment += 1
+            pos = 0
+
+    def _truncate(self, segment: int, size: int) -> None:
+        """ Отбрасывание незавершенной записи в конце сегмента """
+        self._unmap(segment)
+        os.truncate(self._segment_path(segment), size)
+        self._segment_size = size
+
+    def _register(self, segment: int, offset: int, length: int, block: blk.Block) -> None:
+        """ Запоминание расположения очередной записи, хэша заголовка и фильтра Блума блока в индексах (индекс высот
+        пополняется последним, поэтому по нему видно, какие записи проиндексированы полностью) """
+        self._hashes.put(block.header.hash_bytes(), len(self._heights))
+        self._blooms.append(bf.BloomFilter.for_block(block).as_bytes())
+        self._heights.append(segment, offset, length)
+
+    def _map(self, segment: int, needed: int) -> mmap.mmap:
+        """ Отображение сегмента в память (пере-отображается, если файл вырос больше текущего отображения) """
+        mapping = self._maps.get(segment)
+        if mapping is None or len(mapping) < needed:
+            self._unmap(segment)
+            with open(self._segment_path(segment), 'rb') as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = mapping
+        return mapping
+
+    def _unmap(self, segment: int) -> None:
+        """ Закрытие отображения сегмента (если на него еще есть ссылки, оно будет закрыто сборщиком мусора) """
+        mapping = self._maps.pop(segment, None)
+        if mapping is not None:
+            try:
+                mapping.close()
+            except BufferError:
+                pass
+
+    def append(self, block: blk.Block) -> int:
+        """ Добавление блока в конец хранилища (высота блока должна быть равна количеству блоков в хранилище);
+        возвращает высоту """
+        if block.header.height != len(self):
+            raise ValueError(errs.BLOCK_HEIGHT_OUT_OF_ORDER)
+        segment, offset, length = self._write(block)
+        self._writer.flush()
+        self._register(segment, offset, length, block)
+        return len(self) - 1
+
+    def extend(self, blocks) -> int:
+        """ Добавление блоков пакетом (буфер записи сбрасывается один раз на пакет); возвращает количество добавленных
+        блоков. Если очередной блок не подходит по высоте, блоки до него остаются добавленными """
+        pending = []
+        try:
+            for block in blocks:
+                if block.header.height != len(self) + len(pending):
+                    raise ValueError(errs.BLOCK_HEIGHT_OUT_OF_ORDER)
+                pending.append((*self._write(block), block))
+        finally:
+            self._writer.flush()
+            for segment, offset, length, block in pending:
+                self._register(segment, offset, length, block)
+        return len(pending)
+
+    def _write(self, block: blk.Block) -> tuple[int, int, int]:
+        """ Запись блока в конец текущего сегмента (без сброса буфера и индексации); возвращает номер сегмента,
+        смещение и длину блока """
+        raw = block.as_bytes()
+        if self._segment_size >= self._segment_max_size:
+            self._writer.close()
+            self._segment += 1
+            self._segment_size = 0
+            self._writer = open(self._segment_path(self._segment), 'ab')
+        self._writer.write(RECORD_LENGTH_STRUCT.pack(len(raw)))
+        self._writer.write(raw)
+        offset = self._segment_size + RECORD_LENGTH_STRUCT.size
+        self._segment_size = offset + len(raw)
+        return self._segment, offset, len(raw)
+
+    def raw_at(self, height: int) -> memoryview:
+        """ Двоичное представление блока — срез отображения сегмента в память (без копирования) """
+        segment, offset, length = self._heights.location(height)
+        return memoryview(self._map(segment, offset + length))[offset:offset + length]
+
+    def block_at(self, height: int) -> blk.Block:
+        """ Блок, восстановленный прямо из отображения сегмента в память """
+        segment, offset, length = self._heights.location(height)
+        return blk.Block.from_buffer(self._map(segment, offset + length), offset)
+
+    def header_at(self, height: int) -> hdr_wire.BlockHeaderView:
+        """ «Ленивое» представление заголовка блока (поверх отображения сегмента в память, без разбора транзакций) """
+        return hdr_wire.BlockHeaderView.from_buffer(self.raw_at(height), block_wire.HEADER_OFFSET)
+
+    def height_of(self, block_hash: str) -> int | None:
+        """ Высота блока с указанным хэшем заголовка или None, если такого блока нет """
+        return self._hashes.get(hdr_wire.hash_to_bytes(block_hash))
+
+    def block_by_hash(self, block_hash: str) -> blk.Block | None:
+        """ Блок с указанным хэшем заголовка или None, если такого блока нет """
+        height = self.height_of(block_hash)
+        return None if height is None else self.block_at(height)
+
+    def candidates(self, key: bytes, first: int = 0, last: int | None = None):
+        """ Высоты блоков из диапазона [first, last), фильтр Блума которых, возможно, содержит ключ (отправителя или
+        получателя в UTF-8 либо «сырые» байты хэша транзакции); остальные блоки пропускаются без чтения """
+        hashes = bf.key_hashes(key)
+        last = len(self) if last is None else min(last, len(self))
+        for height in range(max(first, 0), last):
+            if bf.might_contain(self._blooms.bloom(height), hashes):
+                yield height
+
+    def messages_of(self, party: str, first: int = 0, last: int | None = None):
+        """ Транзакции участника (отправителя или получателя) в блоках из диапазона [first, last): кортежи (высота,
+        номер транзакции в блоке, транзакция); разбираются только блоки, прошедшие проверку фильтром Блума """
+        for height in self.candidates(party.encode(), first, last):
+            columns = self.block_at(height).content.txs
+            for pos in columns.positions_of_party(party):
+                yield height, pos, columns.view(pos)
+
+    def find_tx(self, tx_hash: str, first: int = 0, last: int | None = None) -> tuple[int, int] | None:
+        """ Расположение (высота, номер транзакции в блоке) транзакции с указанным хэшем в блоках из диапазона
+        [first, last) или None, если ее там нет """
+        key = hdr_wire.hash_to_bytes(tx_hash)
+        for height in self.candidates(key, first, last):
+            tree = self.block_at(height).content.tree
+            for pos in range(len(tree)):
+                if tree.leaf(pos) == key:
+                    return height, pos
+        return None
+
+    def sync(self) -> None:
+        """ Сброс записанных данных на диск """
+        self._writer.flush()
+        os.fsync(self._writer.fileno())
+        self._heights.sync()
+        self._hashes.sync()
+        self._blooms.sync()
+
+    def close(self) -> None:
+        """ Закрытие хранилища """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        for segment in list(self._maps):
+            self._unmap(segment)
+        self._heights.close()
+        self._hashes.close()
+        self._blooms.close()
+
+    @property
+    def path(self) -> str:
+        """ Каталог хранилища """
+        return self._path
@@ -0,0 +1,72 @@
+"""
+Выгрузка цепочки в NDJSON (по одному объекту JSON в строке) и загрузка из него.
+
+Выгрузка построена на генераторах: блоки читаются из хранилища и записываются в поток по одному, поэтому расход
+памяти не зависит от длины цепочки. Выгружаются либо блоки целиком (словарное представление Block.as_dict), либо
+отдельные сообщения (словарное представление TxMessage с высотой блока и номером сообщения в нем). Выгрузку можно
+продолжить с любой высоты (см. first).
+
+Загрузка читает поток порциями по batch_size строк и добавляет блоки в хранилище пакетами (см. BlockStore.extend);
+блоки, которые уже есть в хранилище, пропускаются, поэтому прерванную загрузку можно просто повторить
+"""
+
+import itertools
+
+from src.engines import block_store as bst
+from src.entities import block as blk
+from src.frontier import jsonifier
+
+
+# region Константы
+DEFAULT_BATCH_SIZE: int = 256
+""" Количество блоков, добавляемых в хранилище одним пакетом при загрузке """
+# endregion
+
+
+def _heights(store: bst.BlockStore, first: int, last: int | None) -> range:
+    """ Высоты блоков из диапазона [first, last), которые есть в хранилище """
+    return range(max(first, 0), len(store) if last is None else min(last, len(store)))
+
+
+def block_dicts(store: bst.BlockStore, first: int = 0, last: int | None = None):
+    """ Генератор словарных представлений блоков из диапазона высот [first, last) """
+    for height in _heights(store, first, last):
+        yield store.block_at(height).as_dict()
+
+
+def message_dicts(store: bst.BlockStore, first: int = 0, last: int | None = None):
+    """ Генератор словарных представлений сообщений из блоков диапазона высот [first, last); к каждому добавляются
+    высота блока ('height') и номер сообщения в нем ('position') """
+    for height in _heights(store, first, last):
+        for position, tx in enumerate(store.block_at(height).content.as_dict()['txs']):
+            tx['height'] = height
+            tx['position'] = position
+            yield tx
+
+
+def export_blocks(store: bst.BlockStore, stream, first: int = 0, last: int | None = None) -> int:
+    """ Выгрузка блоков из диапазона высот [first, last) в поток (двоичный файл) NDJSON; возвращает высоту, с которой
+    следует продолжить выгрузку """
+    heights = _heights(store, first, last)
+    jsonifier.JSON.pack_stream(block_dicts(store, heights.start, heights.stop), stream)
+    return max(heights.stop, heights.start)
+
+
+def export_messages(store: bst.BlockStore, stream, first: int = 0, last: int | None = None) -> int:
+    """ Выгрузка сообщений из блоков диапазона высот [first, last) в поток (двоичный файл) NDJSON; возвращает высоту,
+    с которой следует продолжить выгрузку """
+    heights = _heights(store, first, last)
+    jsonifier.JSON.pack_stream(message_dicts(store, heights.start, heights.stop), stream)
+    return max(heights.stop, heights.start)
+
+
+def import_blocks(store: bst.BlockStore, stream, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """ Загрузка блоков из потока (двоичного файла) NDJSON в хранилище пакетами по batch_size блоков; блоки ниже
+    текущей высоты хранилища пропускаются. Возвращает количество добавленных блоков """
+    blocks = (blk.Block.from_dict(source) for source in jsonifier.JSON.unpack_stream(stream)
+              if int(source['header']['height']) >= len(store))
+    added = 0
+    while batch := list(itertools.islice(blocks, batch_size)):
+        added += store.extend(batch)
+        store.sync()
+    return added
@@ -0,0 +1,218 @@
+"""
+Полная проверка цепочки блоков из хранилища.
+
+Независимые для каждого блока проверки (хэш заголовка, выполнение сложности, пересчет корня дерева Меркла по байтам
+транзакций, отсутствие повторяющихся транзакций) выполняются в пуле процессов; последовательно, в порядке высот,
+проверяются только дешевые связи между блоками (непрерывность высот, признак генезис-блока, совпадение prev_hash
+с хэшем предыдущего заголовка). Блоки читаются из хранилища «окнами» ограниченного размера, пока пул обрабатывает
+предыдущее окно.
+
+Блок с повторяющимися транзакциями считается поврежденным, даже если корень дерева Меркла в его заголовке совпадает
+(BlockTxs такие блоки не собирает).
+
+Если заданы контрольные точки (см. checkpoints), блоки до самой высокой из точек, которые есть в хранилище и хэш
+заголовка в которых совпадает, включительно проверяются только по связям и совпадению хэшей в контрольных точках
+(заголовки читаются прямо из хранилища, транзакции не разбираются); остальные блоки проверяются полностью
+"""
+
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.engines import block_store as bst
+from src.engines import checkpoints as chk
+from src.entities import block_header_wire as hdr_wire
+from src.entities import block_wire
+from src.entities import merkle_tree as mt
+from src.frontier import cryptographer
+from src.ground import cnst
+from src.ground import errs
+
+
+# region Константы
+WINDOW_SIZE: int = 1024
+""" Количество блоков, одновременно читаемых из хранилища и отправляемых в пул """
+
+CHUNK_SIZE: int = 64
+""" Количество блоков в одном задании для процесса пула """
+# endregion
+
+
+def _check_block(raw: bytes) -> tuple:
+    """ Независимые проверки одного блока (выполняются в процессе пула). Возвращает кортеж: высота, признак генезиса,
+    prev_hash и хэш заголовка («сырые» байты), признак выполнения сложности, признак совпадения корня дерева Меркла,
+    признак отсутствия повторяющихся транзакций (либо None, если блок не удалось разобрать) """
+    try:
+        view = hdr_wire.BlockHeaderView.from_buffer(raw, block_wire.HEADER_OFFSET)
+        digest = view.hash_bytes()
+        leaves = [cryptographer.sha256(tx) for tx in block_wire.tx_slices(raw)]
+        tree = mt.MerkleTree()
+        tree.extend(leaves)
+        return (view.height, view.genesis, view.prev_hash_bytes, digest,
+                cryptographer.meets_difficulty(digest, view.difficulty), tree.root_bytes() == view.merkle_root_bytes,
+                len(set(leaves)) == len(leaves))
+    except (ValueError, IndexError, struct.error):
+        return None
+
+
+class ValidationReport:
+    """ Результат проверки цепочки: количество проверенных блоков и найденные ошибки (высота, описание) """
+
+    def __init__(self) -> None:
+        self._checked: int = 0
+        self._trusted: int = 0
+        self._errors: list[tuple[int, str]] = []
+        self._elapsed: float = 0.0
+
+    def __repr__(self) -> str:
+        """ Репрезентация (человеко-понятное описание объекта) """
+        descr = f'The chain validation report (instance of {__class__.__name__})'
+        chc = f'checked blocks: {self._checked} (linkage only: {self._trusted})'
+        err = f'errors: {len(self._errors)}'
+        elp = f'elapsed: {self._elapsed:.3f} s'
+        return f'{descr}:\n ▪️ {chc};\n ▪️ {err};\n ▪️ {elp}.\n'
+
+    def add_error(self, height: int, reason: str) -> None:
+        """ Добавление ошибки """
+        self._errors.append((height, reason))
+
+    def add_checked(self, trusted: bool = False) -> None:
+        """ Учет очередного проверенного блока (trusted — проверенного только по связям) """
+        self._checked += 1
+        if trusted:
+            self._trusted += 1
+
+    def set_elapsed(self, elapsed: float) -> None:
+        """ Установка затраченного времени (в секундах) """
+        self._elapsed = elapsed
+
+    @property
+    def valid(self) -> bool:
+        """ Признак того, что ошибок не найдено """
+        return not self._errors
+
+    @property
+    def checked(self) -> int:
+        """ Количество проверенных блоков """
+        return self._checked
+
+    @property
+    def trusted(self) -> int:
+        """ Количество блоков, проверенных только по связям (до последней контрольной точки) """
+        return self._trusted
+
+    @property
+    def errors(self) -> list[tuple[int, str]]:
+        """ Найденные ошибки (высота, описание) """
+        return self._errors
+
+    @property
+    def elapsed(self) -> float:
+        """ Затраченное время (в секундах) """
+        return self._elapsed
+
+
+class ChainValidator:
+    """ Движок проверки цепочки: держит пул процессов для независимых проверок блоков (используйте как контекстный
+    менеджер) """
+
+    def __init__(self, workers: int | None = None) -> None:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError(errs.VALIDATOR_WORKERS_VALUE_ERROR)
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+
+    def __enter__(self) -> 'ChainValidator':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """ Остановка пула процессов """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def validate(self, store: bst.BlockStore, window: int = WINDOW_SIZE,
+                 checkpoints: chk.Checkpoints | None = None) -> ValidationReport:
+        """ Проверка всех блоков хранилища (до последней совпавшей контрольной точки, если они заданы, — только по
+        связям) """
+        if checkpoints is None:
+            checkpoints = chk.Checkpoints()
+        report = ValidationReport()
+        started = time.perf_counter()
+        trusted = _trusted_count(store, checkpoints)
+        prev_hash = _check_trusted(report, store, trusted, checkpoints)
+        pending = None
+        for start in range(trusted, len(store), window):
+            heights = range(start, min(start + window, len(store)))
+            raws = [bytes(store.raw_at(height)) for height in heights]
+            results = self._executor.map(_check_block, raws, chunksize=CHUNK_SIZE)
+            if pending is not None:
+                prev_hash = _check_links(report, *pending, prev_hash, checkpoints)
+            pending = (heights, results)
+        if pending is not None:
+            _check_links(report, *pending, prev_hash, checkpoints)
+        report.set_elapsed(time.perf_counter() - started)
+        return report
+
+
+def _check_linkage(report: ValidationReport, expected: int, height: int, genesis: bool, pv: bytes,
+                   prev_hash: bytes) -> None:
+    """ Проверка связи блока с цепочкой: высота, признак генезиса и prev_hash (хэш заголовка предыдущего блока) """
+    if height != expected:
+        report.add_error(expected, errs.CHAIN_HEIGHT_MISMATCH)
+    if genesis != (expected == cnst.GENESIS_HEIGHT):
+        report.add_error(expected, errs.CHAIN_GENESIS_MISMATCH)
+    if pv != prev_hash:
+        report.add_error(expected, errs.CHAIN_PREV_HASH_MISMATCH)
+
+
+def _trusted_count(store: bst.BlockStore, checkpoints: chk.Checkpoints) -> int:
+    """ Количество блоков, проверяемых только по связям: до самой высокой контрольной точки, которая есть в хранилище
+    и хэш заголовка в которой совпадает, включительно (0, если такой точки нет) """
+    for height, expected in sorted(checkpoints, reverse=True):
+        if height < len(store) and store.header_at(height).hash_bytes() == expected:
+            return height + 1
+    return 0
+
+
+def _check_trusted(report: ValidationReport, store: bst.BlockStore, count: int,
+                   checkpoints: chk.Checkpoints) -> bytes:
+    """ Проверка первых count блоков только по связям и контрольным точкам; возвращает хэш заголовка последнего из
+    них (для пустого диапазона — нулевой хэш) """
+    prev_hash = bytes(cnst.HASH_BYTE_LENGTH)
+    for height in range(count):
+        view = store.header_at(height)
+        digest = view.hash_bytes()
+        report.add_checked(trusted=True)
+        _check_linkage(report, height, view.height, view.genesis, view.prev_hash_bytes, prev_hash)
+        expected = checkpoints.hash_at(height)
+        if expected is not None and digest != expected:
+            report.add_error(height, errs.CHAIN_CHECKPOINT_MISMATCH)
+        prev_hash = digest
+    return prev_hash
+
+
+def _check_links(report: ValidationReport, heights: range, results, prev_hash: bytes,
+                 checkpoints: chk.Checkpoints) -> bytes:
+    """ Последовательная проверка связей между блоками окна; возвращает хэш заголовка последнего блока окна """
+    for expected, result in zip(heights, results):
+        report.add_checked()
+        if result is None:
+            report.add_error(expected, errs.CHAIN_BLOCK_CORRUPTED)
+            continue
+        height, genesis, pv, digest, pow_ok, merkle_ok, unique = result
+        _check_linkage(report, expected, height, genesis, pv, prev_hash)
+        if not unique:
+            report.add_error(expected, errs.CHAIN_BLOCK_CORRUPTED)
+        if not pow_ok:
+            report.add_error(expected, errs.CHAIN_DIFFICULTY_NOT_MET)
+        if not merkle_ok:
+            report.add_error(expected, errs.CHAIN_MERKLE_ROOT_MISMATCH)
+        checkpoint = checkpoints.hash_at(expected)
+        if checkpoint is not None and digest != checkpoint:
+            report.add_error(expected, errs.CHAIN_CHECKPOINT_MISMATCH)
+        prev_hash = digest
+    return prev_hash
@@ -0,0 +1,58 @@
+"""
+Контрольные точки цепочки: пары (высота, хэш заголовка) блоков, которым доверяют без проверки, — отдельный набор для
+каждой версии протокола. Блоки до самой высокой контрольной точки, которая есть в цепочке и хэш заголовка в которой
+совпадает, включительно проверяются только по связям (высоты, prev_hash и совпадение хэшей в контрольных точках), без
+проверки сложности и пересчета деревьев Меркла (см. chain_validator); цепочка, совпадающая с контрольной точкой,
+до нее совпадает с проверенной. Цепочке, не дошедшей ни до одной контрольной точки, не доверяют
+"""
+
+from src.entities import block_header_wire as hdr_wire
+from src.ground import cnst
+
+
+# region Константы
+CHECKPOINTS: dict[str, tuple[tuple[int, str], ...]] = {
+    cnst.CURRENT_PROTOCOL_VERSION: (),
+}
+""" Контрольные точки по версиям протокола: (высота, хэш заголовка) по возрастанию высоты """
+# endregion
+
+
+class Checkpoints:
+    """ Таблица контрольных точек (высота → хэш заголовка) """
+
+    __slots__ = ('_hashes', '_last_height')
+
+    def __init__(self, points=()) -> None:
+        """ Таблица из пар (высота, хэш заголовка в виде строки из шестнадцатеричных символов) """
+        self._hashes: dict[int, bytes] = {height: hdr_wire.hash_to_bytes(value) for height, value in points}
+        self._last_height: int = max(self._hashes, default=-1)
+
+    @classmethod
+    def for_version(cls, version: str = cnst.CURRENT_PROTOCOL_VERSION) -> 'Checkpoints':
+        """ Контрольные точки, закрепленные за версией протокола (для неизвестной версии — пустая таблица) """
+        return cls(CHECKPOINTS.get(version, ()))
+
+    def __repr__(self) -> str:
+        """ Репрезентация (человеко-понятное описание объекта) """
+        descr = f'The checkpoint table (instance of {__class__.__name__})'
+        cnt = f'count: {len(self)}'
+        lst = f'last height: {self._last_height}'
+        return f'{descr}:\n ▪️ {cnt};\n ▪️ {lst}.\n'
+
+    def __len__(self) -> int:
+        """ Количество контрольных точек """
+        return len(self._hashes)
+
+    def __iter__(self):
+        """ Пары (высота, хэш заголовка в виде «сырых» байтов) """
+        return iter(self._hashes.items())
+
+    def hash_at(self, height: int) -> bytes | None:
+        """ Хэш заголовка («сырые» байты) в контрольной точке на указанной высоте или None, если точки нет """
+        return self._hashes.get(height)
+
+    @property
+    def last_height(self) -> int:
+        """ Высота последней контрольной точки (-1, если точек нет) """
+        return self._last_height
@@ -0,0 +1,189 @@
+"""
+Пул неподтвержденных транзакций (mempool).
+
+Транзакции хранятся в словаре по хэшу (повтор отклоняется за O(1)) и упорядочиваются по приоритету — числу, которое
+возвращает подключаемая функция (больше — лучше); при равенстве приоритетов раньше идет транзакция с меньшей меткой
+гибридных логических часов (см. chronos.HybridLogicalClock), а при равенстве и меток — пришедшая в пул раньше
+(поэтому приоритет по умолчанию дает порядок FIFO). Порядок поддерживается двумя кучами (лучшие — для выборки
+в блок, худшие — для вытеснения) с «ленивым» удалением: удаленная транзакция остается в кучах, пока не окажется
+на вершине, а когда таких записей становится слишком много, кучи перестраиваются.
+
+Элементы куч — кортежи из чисел и байтов: сборщик мусора перестает их отслеживать, поэтому сотни тысяч записей
+не увеличивают паузы на сборку мусора. Суммарный размер транзакций (в формате блока, см. block_wire) ограничен:
+при превышении вытесняются транзакции с наименьшим приоритетом
+"""
+
+import heapq
+import itertools
+from typing import Callable
+
+from src.entities import block_wire
+from src.entities import tx_message as txm
+from src.ground import errs
+
+
+# region Константы
+DEFAULT_MAX_BYTES: int = 64 * 1024 * 1024
+""" Ограничение суммарного размера транзакций в пуле по умолчанию """
+
+MAX_SKIPPED: int = 64
+""" Сколько подряд (после последней выбранной) не поместившихся транзакций просматривается при выборке, прежде чем
+она прекращается; счетчик сбрасывается при каждой выбранной транзакции """
+
+COMPACT_FACTOR: int = 2
+""" Кучи перестраиваются, когда записей в них больше, чем транзакций в пуле, в COMPACT_FACTOR раз """
+
+COMPACT_MIN: int = 1024
+""" Количество записей в куче, меньше которого она не перестраивается """
+# endregion
+
+
+def fifo_priority(tx: txm.TxMessage) -> int:
+    """ Приоритет по умолчанию: одинаковый для всех транзакций (порядок определяется временем поступления) """
+    return 0
+
+
+class Mempool:
+    """ Пул неподтвержденных транзакций с защитой от повторов, приоритетами и ограничением размера """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES,
+                 priority: Callable[[txm.TxMessage], int | float] = fifo_priority) -> None:
+        if not isinstance(max_bytes, int) or max_bytes < 1:
+            raise ValueError(errs.MEMPOOL_SIZE_VALUE_ERROR)
+        self._max_bytes: int = max_bytes
+        self._priority = priority
+        self._entries: dict[bytes, tuple[txm.TxMessage, int, int]] = {}  # хэш → (транзакция, размер, номер)
+        self._best: list[tuple] = []                                     # (-приоритет, метка, номер, хэш)
+        self._worst: list[tuple] = []                                    # (приоритет, -метка, -номер, хэш)
+        self._seq = itertools.count()
+        self._size_in_bytes: int = 0
+
+    def __repr__(self) -> str:
+        """ Репрезентация (человеко-понятное описание объекта) """
+        descr = f'The mempool (instance of {__class__.__name__})'
+        cnt = f'count: {len(self)}'
+        sze = f'size in bytes: {self._size_in_bytes} of {self._max_bytes}'
+        return f'{descr}:\n ▪️ {cnt};\n ▪️ {sze}.\n'
+
+    def __len__(self) -> int:
+        """ Количество транзакций в пуле """
+        return len(self._entries)
+
+    def __contains__(self, tx: txm.TxMessage) -> bool:
+        """ Признак наличия транзакции в пуле (по хэшу) """
+        return tx.hash_bytes() in self._entries
+
+    def add(self, tx: txm.TxMessage) -> bool:
+        """ Добавление транзакции; False — если она уже есть в пуле, больше ограничения размера или сразу вытеснена """
+        key = tx.hash_bytes()
+        if key in self._entries:
+            return False
+        size = block_wire.tx_size(tx)
+        if size > self._max_bytes:
+            return False
+        seq = next(self._seq)
+        priority = self._priority(tx)
+        self._entries[key] = (tx, size, seq)
+        self._size_in_bytes += size
+        heapq.heappush(self._best, (-priority, tx.stamp, seq, key))
+        heapq.heappush(self._worst, (priority, -tx.stamp, -seq, key))
+        while self._size_in_bytes > self._max_bytes:
+            self._evict()
+        return key in self._entries
+
+    def add_many(self, txs) -> int:
+        """ Добавление нескольких транзакций; возвращает количество добавленных """
+        return sum(self.add(tx) for tx in txs)
+
+    def _live(self, item: tuple, seq: int) -> bool:
+        """ Признак того, что запись кучи относится к транзакции, которая все еще в пуле """
+        entry = self._entries.get(item[3])
+        return entry is not None and entry[2] == seq
+
+    def _evict(self) -> None:
+        """ Вытеснение транзакции с наименьшим приоритетом """
+        while True:
+            item = heapq.heappop(self._worst)
+            if self._live(item, -item[2]):
+                self._discard(item[3])
+                return
+
+    def _discard(self, key: bytes) -> txm.TxMessage:
+        """ Удаление транзакции из словаря (записи в кучах удаляются «лениво») """
+        tx, size, _ = self._entries.pop(key)
+        self._size_in_bytes -= size
+        if max(len(self._best), len(self._worst)) > max(COMPACT_MIN, COMPACT_FACTOR * len(self._entries)):
+            self._compact()
+        return tx
+
+    def _compact(self) -> None:
+        """ Перестроение куч без записей об удаленных транзакциях """
+        self._best = [item for item in self._best if self._live(item, item[2])]
+        self._worst = [item for item in self._worst if self._live(item, -item[2])]
+        heapq.heapify(self._best)
+        heapq.heapify(self._worst)
+
+    def remove(self, tx: txm.TxMessage) -> bool:
+        """ Удаление транзакции (например, попавшей в блок); False — если ее нет в пуле """
+        key = tx.hash_bytes()
+        if key not in self._entries:
+            return False
+        self._discard(key)
+        return True
+
+    def remove_many(self, txs) -> int:
+        """ Удаление нескольких транзакций; возвращает количество удаленных """
+        return sum(self.remove(tx) for tx in txs)
+
+    def _select(self, max_bytes: int) -> tuple[list[tuple], list[tuple]]:
+        """ Выборка лучших транзакций суммарным размером не более max_bytes: записи выбранных и пропущенных (не
+        поместившихся) транзакций; те и другие извлекаются из кучи лучших """
+        taken, skipped = [], []
+        budget = max_bytes
+        run = 0                                                # не поместившиеся подряд (после последней выбранной)
+        while self._best and run < MAX_SKIPPED:
+            item = heapq.heappop(self._best)
+            if not self._live(item, item[2]):
+                continue
+            if self._entries[item[3]][1] <= budget:
+                budget -= self._entries[item[3]][1]
+                taken.append(item)
+                run = 0
+            else:
+                skipped.append(item)
+                run += 1
+        return taken, skipped
+
+    def best(self, max_bytes: int) -> list[txm.TxMessage]:
+        """ Лучшие транзакции (по убыванию приоритета) суммарным размером не более max_bytes; пул не меняется """
+        if self._size_in_bytes <= max_bytes:                   # помещаются все: сортировка вместо извлечения из кучи
+            if len(self._best) > len(self._entries):
+                self._compact()
+            return [self._entries[item[3]][0] for item in sorted(self._best)]
+        taken, skipped = self._select(max_bytes)
+        result = [self._entries[item[3]][0] for item in taken]
+        for item in itertools.chain(taken, skipped):
+            heapq.heappush(self._best, item)
+        return result
+
+    def take(self, max_bytes: int) -> list[txm.TxMessage]:
+        """ Извлечение из пула лучших транзакций (по убыванию приоритета) суммарным размером не более max_bytes """
+        taken, skipped = self._select(max_bytes)
+        for item in skipped:
+            heapq.heappush(self._best, item)
+        return [self._discard(item[3]) for item in taken]
+
+    @property
+    def size_in_bytes(self) -> int:
+        """ Суммарный размер транзакций в пуле (в формате блока) """
+        return self._size_in_bytes
+
+    @property
+    def heap_records(self) -> int:
+        """ Количество записей в кучах (включая еще не удаленные записи об удаленных транзакциях) """
+        return max(len(self._best), len(self._worst))
+
+    @property
+    def max_bytes(self) -> int:
+        """ Ограничение суммарного размера транзакций """
+        return self._max_bytes
@@ -0,0 +1,160 @@
+""" Майнинг: параллельный (в пуле процессов) поиск nonce для заголовка блока """
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from src.entities import block_header as hdr
+from src.frontier import cryptographer
+from src.ground import errs
+
+
+# region Константы
+CHECK_INTERVAL: int = 4096
+""" Количество попыток, после которого процесс проверяет, не нашел ли решение кто-то другой """
+
+NOT_FOUND: int = -1
+""" Значение nonce, означающее, что решение в заданном диапазоне не найдено """
+# endregion
+
+
+# region Процесс-исполнитель
+_stop_event = None
+""" Флаг остановки (общий для всех процессов пула, устанавливается при инициализации процесса) """
+
+
+def _init_worker(stop_event) -> None:
+    """ Инициализация процесса пула: запоминаем общий флаг остановки """
+    global _stop_event
+    _stop_event = stop_event
+
+
+def _search(header: hdr.BlockHeader, first: int, step: int, last: int) -> tuple[int, int]:
+    """ Перебор nonce first, first + step, ... (не больше last) до первого решения либо до остановки извне. Префикс
+    заголовка хэшируется один раз (midstate), на каждую попытку «дописываются» только байты nonce. Возвращает
+    кортеж из найденного nonce (или NOT_FOUND) и количества сделанных попыток """
+    target = cryptographer.difficulty_target(header.difficulty)
+    midstate = header.midstate()
+    length = hdr.NONCE_BYTE_LENGTH
+    attempts = 0
+    chunk = step * CHECK_INTERVAL
+    for base in range(first, last + 1, chunk):
+        nonces = range(base, min(base + chunk, last + 1), step)
+        for nonce in nonces:
+            h = midstate.copy()
+            h.update(nonce.to_bytes(length, 'big'))
+            if int.from_bytes(h.digest(), 'big') < target:
+                _stop_event.set()
+                return nonce, attempts + nonces.index(nonce) + 1
+        attempts += len(nonces)
+        if _stop_event.is_set():
+            break
+    return NOT_FOUND, attempts
+# endregion
+
+
+class MiningResult:
+    """ Результат майнинга: найденный nonce, количество попыток, затраченное время и скорость перебора """
+
+    def __init__(self, nonce: int, attempts: int, elapsed: float) -> None:
+        self._nonce: int = nonce
+        self._attempts: int = attempts
+        self._elapsed: float = elapsed
+
+    def __repr__(self) -> str:
+        """ Репрезентация (человеко-понятное описание объекта) """
+        descr = f'The mining result (instance of {__class__.__name__})'
+        nnc = f'nonce: {self._nonce}' if self.found else 'nonce: 🚫 (not found)'
+        att = f'attempts: {self._attempts}'
+        elp = f'elapsed: {self._elapsed:.3f} s'
+        hsr = f'hashrate: {self.hashrate:.0f} H/s'
+        return f'{descr}:\n ▪️ {nnc};\n ▪️ {att};\n ▪️ {elp};\n ▪️ {hsr}.\n'
+
+    @property
+    def found(self) -> bool:
+        """ Признак того, что решение найдено """
+        return self._nonce != NOT_FOUND
+
+    @property
+    def nonce(self) -> int:
+        """ Найденный nonce (или NOT_FOUND) """
+        return self._nonce
+
+    @property
+    def attempts(self) -> int:
+        """ Общее количество попыток (по всем процессам) """
+        return self._attempts
+
+    @property
+    def elapsed(self) -> float:
+        """ Затраченное время (в секундах) """
+        return self._elapsed
+
+    @property
+    def hashrate(self) -> float:
+        """ Скорость перебора (хэшей в секунду) """
+        return self._attempts / self._elapsed if self._elapsed > 0 else 0.0
+
+
+class Miner:
+    """ Движок майнинга: держит пул процессов, между которыми делится пространство nonce (процесс номер i
+    перебирает значения i, i + n, i + 2n, ...). Как только один из процессов находит решение, остальные
+    останавливаются. Пул переиспользуется между вызовами mine (используйте как контекстный менеджер) """
+
+    def __init__(self, workers: int | None = None) -> None:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError(errs.MINER_WORKERS_VALUE_ERROR)
+        self._workers: int = workers
+        ctx = multiprocessing.get_context()
+        self._stop_event = ctx.Event()
+        self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                             initializer=_init_worker, initargs=(self._stop_event,))
+
+    def __enter__(self) -> 'Miner':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """ Остановка пула процессов """
+        self._stop_event.set()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    @property
+    def workers(self) -> int:
+        """ Количество процессов в пуле """
+        return self._workers
+
+    def mine(self, header: hdr.BlockHeader, first: int = 0, last: int = hdr.MAX_NONCE) -> MiningResult:
+        """ Поиск nonce в диапазоне [first; last], при котором хэш заголовка удовлетворяет его сложности. В случае
+        успеха найденный nonce записывается в заголовок """
+        if not 0 <= first <= last <= hdr.MAX_NONCE:
+            raise ValueError(errs.MINER_NONCE_RANGE_ERROR)
+        self._stop_event.clear()
+        started = time.perf_counter()
+        pending = {self._executor.submit(_search, header, first + i, self._workers, last)
+                   for i in range(min(self._workers, last - first + 1))}
+        nonce = NOT_FOUND
+        attempts = 0
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                found, tried = future.result()
+                attempts += tried
+                if found != NOT_FOUND and (nonce == NOT_FOUND or found < nonce):
+                    nonce = found
+                    self._stop_event.set()
+        elapsed = time.perf_counter() - started
+        if nonce != NOT_FOUND:
+            header.nonce = nonce
+        return MiningResult(nonce, attempts, elapsed)
+
+
+def mine(header: hdr.BlockHeader, workers: int | None = None) -> MiningResult:
+    """ Разовый майнинг заголовка (пул процессов создается и останавливается внутри) """
+    with Miner(workers) as miner:
+        return miner.mine(header)
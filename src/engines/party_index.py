@@ -0,0 +1,293 @@
+"""
+Инвертированный индекс транзакций по участникам: участник (отправитель или получатель) → список позиций его
+транзакций (высота блока, номер транзакции в блоке) по возрастанию.
+
+Список позиций хранится сжатым: для каждой позиции записываются приращение высоты и номер транзакции (если высота
+не изменилась — приращение номера), оба числа — в формате varint (7 бит на байт, старший бит — признак продолжения).
+Индекс пополняется по мере добавления блоков и умеет продолжать индексацию с первого не проиндексированного блока
+хранилища. На диске он состоит из снимка и журнала: при сохранении в журнал дописываются только позиции, добавленные
+после предыдущего сохранения (приращения в формате varint не зависят от того, что записано дальше, поэтому новые байты
+просто продолжают список), а снимок переписывается целиком (через временный файл) лишь тогда, когда журнал становится
+больше него, — в среднем сохранение стоит O(новых позиций). Списки позиций изменяемы и нужны целиком при индексации,
+поэтому при открытии индекс читается в память (O(размер индекса), один раз за сеанс).
+
+Постраничный запрос истории участника продолжает декодирование с места, на котором остановилась предыдущая страница,
+поэтому стоит O(размер страницы)
+"""
+
+import os
+import struct
+
+from src.engines import block_store as bst
+from src.entities import block as blk
+from src.ground import errs
+
+
+# region Константы
+INDEX_HEADER_STRUCT = struct.Struct('>QI')
+""" Заголовок файла индекса: количество проиндексированных блоков и количество участников """
+
+PARTY_RECORD_STRUCT = struct.Struct('>IIQII')
+""" Запись участника в файле индекса: длина имени (UTF-8), количество позиций, последняя позиция (высота и номер
+транзакции), длина сжатого списка позиций; за записью следуют имя и сам список """
+
+JOURNAL_SUFFIX: str = '.log'
+""" Суффикс имени файла журнала (к имени файла снимка) """
+
+JOURNAL_BATCH_STRUCT = struct.Struct('>QQQI')
+""" Заголовок пакета журнала (одно сохранение): длина пакета вслед за заголовком, количество проиндексированных блоков
+до и после пакета и количество записей участников (в формате PARTY_RECORD_STRUCT с добавленными позициями) """
+
+JOURNAL_COMPACT_RATIO: int = 1
+""" Снимок переписывается, когда журнал больше него в JOURNAL_COMPACT_RATIO раз """
+
+DEFAULT_PAGE_SIZE: int = 100
+""" Количество позиций на странице истории участника по умолчанию """
+
+FIRST_PAGE: tuple[int, int, int] = (0, 0, 0)
+""" Курсор первой страницы истории (смещение в сжатом списке, высота и номер транзакции предыдущей позиции) """
+
+VARINT_DATA_BITS: int = 7
+""" Количество бит данных в байте varint """
+
+VARINT_DATA_MASK: int = 0x7F
+""" Маска бит данных байта varint """
+
+VARINT_MORE_FLAG: int = 0x80
+""" Признак продолжения числа в следующем байте varint """
+# endregion
+
+
+def _put_varint(buf: bytearray, value: int) -> None:
+    """ Дописывание неотрицательного целого в формате varint """
+    while value > VARINT_DATA_MASK:
+        buf.append(value & VARINT_DATA_MASK | VARINT_MORE_FLAG)
+        value >>= VARINT_DATA_BITS
+    buf.append(value)
+
+
+def _get_varint(buf, pos: int) -> tuple[int, int]:
+    """ Чтение целого в формате varint; возвращает значение и смещение следующего числа """
+    value, shift = 0, 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & VARINT_DATA_MASK) << shift
+        if not byte & VARINT_MORE_FLAG:
+            return value, pos
+        shift += VARINT_DATA_BITS
+
+
+class _Postings:
+    """ Сжатый список позиций одного участника """
+
+    __slots__ = ('data', 'count', 'last_height', 'last_pos', 'saved_length', 'saved_count')
+
+    def __init__(self, data: bytearray | None = None, count: int = 0, last_height: int = 0, last_pos: int = 0) -> None:
+        self.data: bytearray = bytearray() if data is None else data
+        self.count: int = count
+        self.last_height: int = last_height
+        self.last_pos: int = last_pos
+        self.saved_length: int = len(self.data)                # сколько байтов и позиций уже сохранено на диске
+        self.saved_count: int = count
+
+    def extend(self, data, count: int, last_height: int, last_pos: int) -> None:
+        """ Продолжение списка уже закодированными позициями (например, из журнала) """
+        self.data += data
+        self.count += count
+        self.last_height, self.last_pos = last_height, last_pos
+        self.mark_saved()
+
+    def mark_saved(self) -> None:
+        """ Пометка всех позиций как сохраненных """
+        self.saved_length, self.saved_count = len(self.data), self.count
+
+    def append(self, height: int, pos: int) -> None:
+        """ Добавление позиции (позиции добавляются по возрастанию) """
+        delta = height - self.last_height
+        _put_varint(self.data, delta)
+        _put_varint(self.data, pos if delta else pos - self.last_pos)
+        self.count += 1
+        self.last_height, self.last_pos = height, pos
+
+
+class PartyIndex:
+    """ Инвертированный индекс участник → позиции транзакций (используйте как контекстный менеджер; при закрытии
+    индекс сохраняется) """
+
+    def __init__(self, path: str) -> None:
+        """ Открытие индекса, сохраненного в файле path (если файла нет — создается пустой индекс) """
+        self._path: str = path
+        self._journal_path: str = path + JOURNAL_SUFFIX
+        self._height: int = 0
+        self._saved_height: int = 0
+        self._postings: dict[str, _Postings] = {}
+        self._dirty: set[str] = set()                          # участники с несохраненными позициями
+        if os.path.exists(path):
+            self._load()
+        self._journal = open(self._journal_path, 'ab')
+        self._replay()
+
+    def __enter__(self) -> 'PartyIndex':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        """ Репрезентация (человеко-понятное описание объекта) """
+        descr = f'The party index (instance of {__class__.__name__}) at {self._path}'
+        hgt = f'indexed blocks: {self._height}'
+        prt = f'parties: {len(self._postings)}'
+        return f'{descr}:\n ▪️ {hgt};\n ▪️ {prt}.\n'
+
+    def __len__(self) -> int:
+        """ Количество участников в индексе """
+        return len(self._postings)
+
+    def __contains__(self, party: str) -> bool:
+        return party in self._postings
+
+    def _load(self) -> None:
+        """ Чтение снимка индекса """
+        with open(self._path, 'rb') as f:
+            buf = f.read()
+        self._height, parties = INDEX_HEADER_STRUCT.unpack_from(buf, 0)
+        pos = INDEX_HEADER_STRUCT.size
+        for _ in range(parties):
+            name_length, count, last_height, last_pos, length = PARTY_RECORD_STRUCT.unpack_from(buf, pos)
+            pos += PARTY_RECORD_STRUCT.size
+            name = str(buf[pos:pos + name_length], 'utf-8')
+            pos += name_length
+            self._postings[name] = _Postings(bytearray(buf[pos:pos + length]), count, last_height, last_pos)
+            pos += length
+        self._saved_height = self._height
+
+    def _replay(self) -> None:
+        """ Применение пакетов журнала, которых еще нет в снимке (незавершенный последний пакет отбрасывается) """
+        with open(self._journal_path, 'rb') as f:
+            buf = f.read()
+        pos = 0
+        while pos + JOURNAL_BATCH_STRUCT.size <= len(buf):
+            length, first, last, parties = JOURNAL_BATCH_STRUCT.unpack_from(buf, pos)
+            end = pos + JOURNAL_BATCH_STRUCT.size + length
+            if end > len(buf) or (first != self._height and last > self._height):
+                break
+            pos += JOURNAL_BATCH_STRUCT.size
+            for _ in range(parties):
+                name_length, count, last_height, last_pos, size = PARTY_RECORD_STRUCT.unpack_from(buf, pos)
+                pos += PARTY_RECORD_STRUCT.size
+                name = str(buf[pos:pos + name_length], 'utf-8')
+                pos += name_length
+                if last > self._height:                        # пакеты, уже вошедшие в снимок, пропускаются
+                    self._posting(name).extend(buf[pos:pos + size], count, last_height, last_pos)
+                pos += size
+            self._height = self._saved_height = max(self._height, last)
+        self._journal.truncate(pos)
+
+    def save(self) -> None:
+        """ Сохранение индекса: дописывание в журнал позиций, добавленных после предыдущего сохранения (если журнал
+        стал больше снимка — переписывание снимка) """
+        if self._height == self._saved_height:
+            return
+        batch = bytearray()
+        for party in self._dirty:
+            postings = self._postings[party]
+            name = party.encode()
+            batch += PARTY_RECORD_STRUCT.pack(len(name), postings.count - postings.saved_count, postings.last_height,
+                                              postings.last_pos, len(postings.data) - postings.saved_length)
+            batch += name
+            batch += postings.data[postings.saved_length:]
+        self._journal.write(JOURNAL_BATCH_STRUCT.pack(len(batch), self._saved_height, self._height, len(self._dirty)))
+        self._journal.write(batch)
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        for party in self._dirty:
+            self._postings[party].mark_saved()
+        self._dirty.clear()
+        self._saved_height = self._height
+        snapshot_size = os.path.getsize(self._path) if os.path.exists(self._path) else 0
+        if self._journal.tell() > JOURNAL_COMPACT_RATIO * snapshot_size:
+            self._compact()
+
+    def _compact(self) -> None:
+        """ Переписывание снимка (во временный файл, который затем подменяет прежний) и очистка журнала """
+        tmp_path = self._path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(INDEX_HEADER_STRUCT.pack(self._height, len(self._postings)))
+            for party, postings in self._postings.items():
+                name = party.encode()
+                f.write(PARTY_RECORD_STRUCT.pack(len(name), postings.count, postings.last_height, postings.last_pos,
+                                                 len(postings.data)))
+                f.write(name)
+                f.write(postings.data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._path)
+        self._journal.truncate(0)
+
+    def close(self) -> None:
+        """ Закрытие (с сохранением) индекса """
+        self.save()
+        self._journal.close()
+
+    def add_block(self, block: blk.Block) -> None:
+        """ Индексация очередного блока (его высота должна быть равна количеству проиндексированных блоков) """
+        height = block.header.height
+        if height != self._height:
+            raise ValueError(errs.PARTY_INDEX_HEIGHT_OUT_OF_ORDER)
+        txs = block.content.txs
+        parties, senders, acceptors = txs.parties, txs.senders, txs.acceptors
+        for pos in range(len(txs)):
+            self._posting(parties[senders[pos]]).append(height, pos)
+            if acceptors[pos] != senders[pos]:
+                self._posting(parties[acceptors[pos]]).append(height, pos)
+        self._dirty.update(parties[idx] for idx in set(senders) | set(acceptors))
+        self._height += 1
+
+    def update(self, store: bst.BlockStore) -> int:
+        """ Индексация блоков хранилища, еще не попавших в индекс; возвращает количество проиндексированных блоков """
+        first = self._height
+        for height in range(first, len(store)):
+            self.add_block(store.block_at(height))
+        return self._height - first
+
+    def _posting(self, party: str) -> _Postings:
+        """ Список позиций участника (при необходимости создается) """
+        postings = self._postings.get(party)
+        if postings is None:
+            postings = self._postings[party] = _Postings()
+        return postings
+
+    def count(self, party: str) -> int:
+        """ Количество транзакций участника """
+        postings = self._postings.get(party)
+        return 0 if postings is None else postings.count
+
+    def history(self, party: str, limit: int = DEFAULT_PAGE_SIZE,
+                cursor: tuple[int, int, int] = FIRST_PAGE) -> tuple[list[tuple[int, int]], tuple[int, int, int] | None]:
+        """ Страница истории участника: не более limit позиций (высота, номер транзакции), начиная с курсора, и курсор
+        следующей страницы (None, если страница последняя) """
+        postings = self._postings.get(party)
+        if postings is None:
+            return [], None
+        data = postings.data
+        offset, height, pos = cursor
+        result = []
+        while offset < len(data) and len(result) < limit:
+            delta, offset = _get_varint(data, offset)
+            value, offset = _get_varint(data, offset)
+            height += delta
+            pos = value if delta else pos + value
+            result.append((height, pos))
+        return result, ((offset, height, pos) if offset < len(data) else None)
+
+    @property
+    def height(self) -> int:
+        """ Количество проиндексированных блоков (высота следующего блока для индексации) """
+        return self._height
+
+    @property
+    def path(self) -> str:
+        """ Файл индекса """
+        return self._path
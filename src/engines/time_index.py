@@ -0,0 +1,207 @@
+"""
+Индекс блоков по дате/времени заголовка. Запрос «блоки между T1 и T2» не разбирает ни заголовки, ни их текстовые
+представления.
+
+Индекс хранится в двух файлах, которые при открытии не читаются целиком (они отображаются в память):
+ ▪️ журнал моментов — моменты заголовков (микросекунды с начала отсчета, 8 байт, старшие байты вперед) в порядке
+   высот; при добавлении блока момент просто дописывается в конец, поэтому сохранение стоит O(новых блоков);
+ ▪️ упорядоченный отрезок — высоты первых блоков журнала, отсортированные по моменту; границы диапазона находятся
+   в нем двоичным поиском.
+
+Блоки, еще не вошедшие в упорядоченный отрезок («хвост» журнала), просматриваются при запросе подряд; когда хвост
+становится длиннее доли отрезка (см. MERGE_RATIO), при сохранении он сливается с отрезком в новый файл, подменяющий
+прежний. Отрезок переписывается все реже по мере роста, поэтому в среднем добавление блока стоит O(1), а моменты,
+идущие не по порядку (например, при расхождении часов), не требуют вставок в середину массива.
+
+Индекс пополняется по мере добавления блоков (момент читается прямо из двоичного представления заголовка, см.
+BlockHeaderView) и может продолжить индексацию с первого не проиндексированного блока хранилища
+"""
+
+import bisect
+import heapq
+import mmap
+import os
+import struct
+from array import array
+
+from src.engines import block_store as bst
+from src.entities import block_timestamp as bts
+from src.frontier import chronos
+
+
+# region Константы
+MOMENT_STRUCT = bts.TIMESTAMP_STRUCT
+""" Запись журнала моментов: момент заголовка блока (высота записи равна ее номеру) """
+
+ORDER_RECORD_STRUCT = struct.Struct('>q')
+""" Запись упорядоченного отрезка: высота блока """
+
+ORDER_SUFFIX: str = '.order'
+""" Суффикс имени файла упорядоченного отрезка (к имени файла журнала моментов) """
+
+MERGE_MIN: int = 1024
+""" Длина хвоста журнала, меньше которой он не сливается с упорядоченным отрезком """
+
+MERGE_RATIO: int = 8
+""" Хвост сливается с отрезком, когда он длиннее 1 / MERGE_RATIO длины отрезка (и не короче MERGE_MIN) """
+# endregion
+
+
+class _Column:
+    """ Последовательность целых из отображенного в память файла записей фиксированной длины (для двоичного поиска) """
+
+    __slots__ = ('_map', '_struct', '_count')
+
+    def __init__(self, mapping, record: struct.Struct, count: int) -> None:
+        self._map = mapping
+        self._struct: struct.Struct = record
+        self._count: int = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, idx: int) -> int:
+        return self._struct.unpack_from(self._map, idx * self._struct.size)[0]
+
+
+class TimeIndex:
+    """ Индекс дата/время → высоты блоков (используйте как контекстный менеджер; при закрытии индекс сохраняется) """
+
+    def __init__(self, path: str) -> None:
+        """ Открытие индекса, сохраненного в файле path (если файла нет — создается пустой индекс) """
+        self._path: str = path
+        self._order_path: str = path + ORDER_SUFFIX
+        self._writer = open(path, 'ab')
+        size = os.path.getsize(path)
+        self._count: int = size // MOMENT_STRUCT.size
+        if self._count * MOMENT_STRUCT.size != size:
+            self._writer.truncate(self._count * MOMENT_STRUCT.size)  # незавершенная запись (например, при сбое)
+        self._map: mmap.mmap | None = None
+        self._order_map: mmap.mmap | None = None
+        self._merged: int = 0
+        if os.path.exists(self._order_path):
+            merged = os.path.getsize(self._order_path) // ORDER_RECORD_STRUCT.size
+            if merged <= self._count:                          # иначе отрезок будет построен заново при сохранении
+                self._merged = merged
+                self._order_map = _map_file(self._order_path)
+
+    def __enter__(self) -> 'TimeIndex':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        """ Репрезентация (человеко-понятное описание объекта) """
+        descr = f'The time index (instance of {__class__.__name__}) at {self._path}'
+        cnt = f'indexed blocks: {len(self)} (ordered: {self._merged})'
+        return f'{descr}:\n ▪️ {cnt}.\n'
+
+    def __len__(self) -> int:
+        """ Количество проиндексированных блоков (высота следующего блока для индексации) """
+        return self._count
+
+    def _refresh_map(self) -> None:
+        """ Обновление отображения журнала в память, если журнал вырос """
+        if self._map is None or len(self._map) < self._count * MOMENT_STRUCT.size:
+            _close_map(self._map)
+            self._writer.flush()
+            self._map = _map_file(self._path)
+
+    def add(self, moment_us: int) -> None:
+        """ Индексация очередного блока (с высотой, равной количеству проиндексированных блоков) по его моменту """
+        self._writer.write(MOMENT_STRUCT.pack(moment_us))
+        self._count += 1
+
+    def update(self, store: bst.BlockStore) -> int:
+        """ Индексация блоков хранилища, еще не попавших в индекс; возвращает количество проиндексированных блоков """
+        first = self._count
+        for height in range(first, len(store)):
+            self.add(store.header_at(height).moment_us)
+        return self._count - first
+
+    def heights_between_us(self, first_us: int, last_us: int) -> list[int]:
+        """ Высоты (по возрастанию) блоков с моментом из диапазона [first_us, last_us) (микросекунды с начала
+        отсчета) """
+        if not self._count:
+            return []
+        self._refresh_map()
+        moments = _Column(self._map, MOMENT_STRUCT, self._count)
+        result = []
+        if self._merged:
+            order = _Column(self._order_map, ORDER_RECORD_STRUCT, self._merged)
+            lo = bisect.bisect_left(order, first_us, key=moments.__getitem__)
+            hi = bisect.bisect_left(order, last_us, lo, key=moments.__getitem__)
+            result = [order[idx] for idx in range(lo, hi)]
+        tail = _unpack(self._map, self._merged, self._count)
+        result += [height for height, moment in enumerate(tail, self._merged) if first_us <= moment < last_us]
+        return sorted(result)
+
+    def heights_between(self, first, last) -> list[int]:
+        """ Высоты (по возрастанию) блоков с моментом из диапазона [first, last) (объекты datetime) """
+        return self.heights_between_us(chronos.moment_to_epoch_us(first), chronos.moment_to_epoch_us(last))
+
+    def messages_between(self, store: bst.BlockStore, first, last):
+        """ Сообщения блоков с моментом из диапазона [first, last) (объекты datetime): кортежи (высота, номер сообщения
+        в блоке, сообщение) """
+        for height in self.heights_between(first, last):
+            for pos, tx in enumerate(store.block_at(height).content.txs):
+                yield height, pos, tx
+
+    def save(self) -> None:
+        """ Сброс журнала на диск; если хвост журнала стал достаточно длинным — слияние его с упорядоченным отрезком """
+        self._writer.flush()
+        os.fsync(self._writer.fileno())
+        if self._count - self._merged > max(MERGE_MIN, self._merged // MERGE_RATIO):
+            self._merge()
+
+    def _merge(self) -> None:
+        """ Слияние хвоста журнала с упорядоченным отрезком (новый отрезок пишется во временный файл, который затем
+        подменяет прежний) """
+        self._refresh_map()
+        moments = _unpack(self._map, 0, self._count)
+        tail = sorted(range(self._merged, self._count), key=moments.__getitem__)
+        order = _unpack(self._order_map, 0, self._merged) if self._merged else array(bts.TIMESTAMP_ARRAY_TYPE)
+        merged = array(bts.TIMESTAMP_ARRAY_TYPE, heapq.merge(order, tail, key=moments.__getitem__))
+        tmp_path = self._order_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(bts.array_to_bytes(merged))
+            f.flush()
+            os.fsync(f.fileno())
+        _close_map(self._order_map)
+        os.replace(tmp_path, self._order_path)
+        self._order_map = _map_file(self._order_path)
+        self._merged = self._count
+
+    def close(self) -> None:
+        """ Закрытие (с сохранением) индекса """
+        self.save()
+        _close_map(self._map)
+        _close_map(self._order_map)
+        self._writer.close()
+
+    @property
+    def path(self) -> str:
+        """ Файл журнала моментов """
+        return self._path
+
+
+def _map_file(path: str) -> mmap.mmap | None:
+    """ Отображение файла в память для чтения (для пустого файла — None) """
+    if not os.path.getsize(path):
+        return None
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _close_map(mapping: mmap.mmap | None) -> None:
+    """ Закрытие отображения файла в память """
+    if mapping is not None:
+        mapping.close()
+
+
+def _unpack(mapping, first: int, last: int) -> array:
+    """ Записи с номерами из диапазона [first, last) файла целых по 8 байт (старшие байты вперед) """
+    if first >= last:
+        return array(bts.TIMESTAMP_ARRAY_TYPE)
+    return bts.bytes_to_array(mapping[first * MOMENT_STRUCT.size:last * MOMENT_STRUCT.size])
@@ -0,0 +1,58 @@
+"""
+Пакетный прием сообщений: записи (словари с полями sender, acceptor, content) превращаются в TxMessage целыми
+пакетами. На каждый пакет часы опрашиваются один раз и дата/время форматируется один раз, а метки гибридных
+логических часов (см. chronos.HybridLogicalClock) выделяются одним обращением к ним; значения полей проверяются
+по тем же правилам, что и в сеттерах TxMessage (непустая строка, иначе — значение по умолчанию)
+"""
+
+import json
+
+from src.entities import tx_message as txm
+from src.frontier import chronos
+
+
+# region Константы
+DEFAULT_BATCH_SIZE: int = 10_000
+""" Размер пакета по умолчанию при чтении потока NDJSON """
+# endregion
+
+
+def _field(record: dict, name: str, default: str) -> str:
+    """ Значение поля записи, если это непустая строка, иначе — значение по умолчанию """
+    value = record.get(name)
+    return value if type(value) is str and value else default
+
+
+def messages_from_records(records, moment=None) -> list[txm.TxMessage]:
+    """ Сообщения из итерируемого набора записей; все сообщения пакета получают одну и ту же дату/время (moment,
+    в любом часовом поясе — переводится в UTC, либо текущее время, полученное один раз) и последовательные метки
+    гибридных логических часов """
+    records = list(records)
+    if not records:
+        return []
+    first = chronos.CLOCK.reserve(len(records))
+    moment = chronos.this_moment() if moment is None else chronos.moment_to_utc(moment)
+    moment_str = chronos.moment_to_str(moment)
+    from_fields = txm.TxMessage.from_fields
+    return [from_fields(moment,
+                        _field(record, 'sender', txm.SENDER_UNDEFINED),
+                        _field(record, 'acceptor', txm.ACCEPTOR_UNDEFINED),
+                        _field(record, 'content', txm.EMPTY_MESSAGE),
+                        txm.NO_SIGNATURE,
+                        moment_str,
+                        stamp)
+            for stamp, record in enumerate(records, first)]
+
+
+def messages_from_ndjson(stream, batch_size: int = DEFAULT_BATCH_SIZE):
+    """ Генератор пакетов сообщений из потока NDJSON (одна запись на строку, пустые строки пропускаются). Каждый
+    пакет — не более batch_size сообщений с одной датой/временем на пакет """
+    batch = []
+    for line in stream:
+        if line.strip():
+            batch.append(json.loads(line))
+            if len(batch) >= batch_size:
+                yield messages_from_records(batch)
+                batch = []
+    if batch:
+        yield messages_from_records(batch)
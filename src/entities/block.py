@@ -1,5 +1,7 @@
 from src.entities import block_header as hdr
 from src.entities import block_txs as txs
+from src.entities import block_wire
+from src.frontier import jsonifier
 
 
 class Block:
@@ -7,3 +9,97 @@ class Block:
         self._magic_number: int = 0
         self._header = hdr.BlockHeader(genesis=genesis)
         self._content = txs.BlockTxs()
+        self._header.merkle_root = self._content.merkle_root
+
+    @classmethod
+    def from_buffer(cls, buf, offset: int = 0) -> 'Block':
+        """ Восстановление блока из двоичного представления (см. block_wire), записанного в буфере (bytes, mmap,
+        memoryview) начиная с offset """
+        block = cls.__new__(cls)
+        block._magic_number = block_wire.MAGIC_STRUCT.unpack_from(buf, offset)[0]
+        block._header = hdr.BlockHeader.from_buffer(buf, offset + block_wire.HEADER_OFFSET)
+        block._content = txs.BlockTxs.from_buffer(buf, offset + block_wire.COUNT_OFFSET)
+        return block
+
+    @classmethod
+    def from_dict(cls, source: dict) -> 'Block':
+        """ Восстановление блока из словарного представления (см. as_dict) """
+        block = cls.__new__(cls)
+        block._magic_number = int(source['magic_number'])
+        block._header = hdr.BlockHeader.from_dict(source['header'])
+        block._content = txs.BlockTxs.from_dict(source['content'])
+        return block
+
+    def as_dict(self) -> dict:
+        """ Словарное представление: магическое число, заголовок и список транзакций """
+        return {
+            'magic_number': self._magic_number,
+            'header': self._header.as_dict(),
+            'content': self._content.as_dict()
+        }
+
+    @classmethod
+    def from_record(cls, source: list) -> 'Block':
+        """ Восстановление блока из компактного представления (см. as_record) """
+        magic_number, header, content = source
+        block = cls.__new__(cls)
+        block._magic_number = magic_number
+        block._header = hdr.BlockHeader.from_record(header)
+        block._content = txs.BlockTxs.from_record(content)
+        return block
+
+    def as_record(self) -> list:
+        """ Компактное представление (для двоичных форматов): магическое число, заголовок и список транзакций """
+        return [self._magic_number, self._header.as_record(), self._content.as_record()]
+
+    @property
+    def magic_number(self) -> int:
+        """ Магическое число """
+        return self._magic_number
+
+    @property
+    def header(self) -> hdr.BlockHeader:
+        """ Заголовок блока """
+        return self._header
+
+    @property
+    def content(self) -> txs.BlockTxs:
+        """ Список транзакций блока """
+        return self._content
+
+    def add_tx(self, tx) -> None:
+        """ Добавление транзакции (корень дерева Меркла в заголовке обновляется) """
+        self._content.add_tx(tx)
+        self._header.merkle_root = self._content.merkle_root
+
+    def extend(self, txs) -> None:
+        """ Добавление множества транзакций (корень дерева Меркла в заголовке обновляется один раз) """
+        self._content.extend(txs)
+        self._header.merkle_root = self._content.merkle_root
+
+    def size_in_bytes(self) -> int:
+        """ Точный размер двоичного представления блока (см. block_wire), O(1) """
+        return block_wire.MAGIC_STRUCT.size + self._header.wire_size() + self._content.size_in_bytes()
+
+    def fits(self, tx, limit: int) -> bool:
+        """ Признак того, что после добавления транзакции размер блока не превысит limit байт """
+        return self.size_in_bytes() + block_wire.tx_size(tx) <= limit
+
+    def as_bytes(self) -> bytes:
+        """ Двоичное представление блока (см. block_wire) """
+        return block_wire.encode(self)
+
+
+def pack_blocks(blocks, stream, serializer: jsonifier.Serializer = jsonifier.MSGPACK) -> int:
+    """ Запись последовательности блоков в поток (двоичный файл) по одному; возвращает количество записанных блоков.
+    Текстовые форматы получают словарные представления блоков, двоичные — компактные (см. Serializer.compact) """
+    if serializer.compact:
+        return serializer.pack_stream((block.as_record() for block in blocks), stream)
+    return serializer.pack_stream((block.as_dict() for block in blocks), stream)
+
+
+def unpack_blocks(stream, serializer: jsonifier.Serializer = jsonifier.MSGPACK):
+    """ Генератор блоков, читаемых из потока (двоичного файла) по одному """
+    restore = Block.from_record if serializer.compact else Block.from_dict
+    for source in serializer.unpack_stream(stream):
+        yield restore(source)
@@ -1,6 +1,10 @@
+from src.entities import block_header_wire as wire
+from src.entities import block_timestamp as bts
+from src.entities.protocol_version import pv_observer as pvo
+from src.entities.protocol_version import pv_short as pvs
 from src.frontier import chronos
+from src.frontier import cryptographer
 from src.frontier import jsonifier
-from src.frontier import sysutils
 from src.ground import cnst
 
 
@@ -15,31 +19,64 @@ INIT_PREV_HASH: str = ''
 """ Значение хэша предыдущего блока, используемое при инициализации блока (означает, что блок не полностью 
 инициализирован) """
 
+MAX_NONCE: int = 2 ** 63 - 1
+""" Максимальное значение nonce (nonce должен помещаться в 8 байт со знаком) """
+
+NONCE_BYTE_LENGTH: int = 8
+""" Длина байтового представления nonce (используется при хэшировании заголовка) """
+
+DEFAULT_SHORT_VERSION_BYTE: int = 0
+""" «Краткая версия» протокола по умолчанию (+0.+0.+0), упакованная в один байт """
+
 HGH_REPR_LENGTH: int = 10
 """ Длина строкового представления текущей высоты (заполняется ведущими пробелами) """
 # endregion
 
 
+def nonce_as_bytes(nonce: int) -> bytes:
+    """ Байтовое представление nonce (фиксированной длины, старшие байты вперед) """
+    return nonce.to_bytes(NONCE_BYTE_LENGTH, 'big', signed=True)
+
+
+class _ShortVersionWatcher(pvo.PVObserver):
+    """ «Наблюдатель» за «Краткой версией» заголовка: при ее изменении сбрасывает кэш представлений заголовка """
+
+    __slots__ = ('_header',)
+
+    def __init__(self, header: 'BlockHeader') -> None:
+        self._header = header
+
+    def process_changing(self) -> None:
+        """ Обработка изменений в «Краткой версии» """
+        self._header._invalidate()
+
+
 class BlockHeader:
     """ Заголовок блока (служебная информация, включая высоту блока и текущий момент времени в UTC). Любой заголовок
     кроме генезис-блока содержит также хэш предыдущего блока, благодаря чему выстраивается криптографически защищенная
     устойчивая цепочка """
 
+    __slots__ = ('_short_version_byte', '_short_version', '_height', '_prev_hash', '_merkel_root', '_moment_us',
+                 '_difficulty', '_nonce', '_genesis', '_stamp',
+                 '_dict_cache', '_json_cache', '_bytes_cache', '_wire_cache', '_hash_cache')
+
     def __init__(self, genesis: bool = False) -> None:
         """ Инициализация частичная (установка начальных значений) """
-        self._version: str = cnst.CURRENT_PROTOCOL_VERSION
+        self._short_version_byte: int = DEFAULT_SHORT_VERSION_BYTE
+        self._short_version: pvs.PVShort | None = None  # объект создается «лениво» (см. свойство short_version)
         self._height: int = cnst.GENESIS_HEIGHT if genesis else INIT_HEIGHT
         self._prev_hash: str = cnst.ZERO_HASH if genesis else INIT_PREV_HASH
-        self._merkel_root: str = cnst.ZERO_HASH  # todo Это — заглушка
-        self._moment = chronos.this_moment()
-        self._moment_str: str = chronos.moment_to_str(self._moment)
+        self._merkel_root: str = cnst.ZERO_HASH  # корень пустого дерева (обновляется в Block по BlockTxs)
+        self._moment_us: int = chronos.now_epoch_us()  # объект datetime создается только по запросу
         self._difficulty: int = cnst.DEFAULT_DIFFICULTY
         self._nonce: int = INIT_NONCE
         self._genesis: bool = genesis
+        self._stamp: int = chronos.hlc_now()  # для упорядочивания, в представления (и хэш) не входит
+        self._invalidate()
 
     def __repr__(self):
         """ Репрезентация (человеко-понятное описание объекта) """
-        ver = f'protocol ver.: {self._version}'
+        ver = f'protocol ver.: {self.version}'
         hgh_repr = '🚫' if self._height == INIT_HEIGHT else str(self._height).zfill(HGH_REPR_LENGTH)
         hgh = f'height: {hgh_repr}'
         pr_h_repr = '🚫' if self._prev_hash == INIT_PREV_HASH else self._prev_hash
@@ -47,11 +84,11 @@ class BlockHeader:
         dfn = 'genesis' if self._genesis else 'regular'
         stts = 'partially initialized' if not self.fully_initialized() else 'fully initialized'
         descr = (f'The header of a {dfn} block (instance '
-                 f'of {__class__.__name__})\ncreated at {self._moment_str} and {stts}')
+                 f'of {__class__.__name__})\ncreated at {self.moment_str} and {stts}')
         mr = f'merkel root: {self._merkel_root}'
         nnc_repr = '🚫' if self._nonce == INIT_NONCE else str(self._nonce)
         nnc = f'nonce: {nnc_repr}'
-        sze = f'size in bytes: {self.dict_size_in_bytes_str()}'
+        sze = f'wire size in bytes: {self.wire_size_str()}'
         nom = f'number of members in dict: {self.number_of_members_str()}'
         dfft = f'difficulty: {str(self._difficulty)}'
         result = (f'{descr}:\n ▪️ {ver};\n ▪️ {hgh};\n ▪️ {pr_h};\n ▪️ {mr};\n ▪️ {nnc};\n ▪️ {dfft};'
@@ -60,6 +97,56 @@ class BlockHeader:
             result += f'⚠️ Please do not forget to fully initialize the object before using it!'
         return result
 
+    @classmethod
+    def from_buffer(cls, buf, offset: int = 0) -> 'BlockHeader':
+        """ Восстановление заголовка из двоичного представления (см. block_header_wire), записанного в буфере начиная
+        с offset. Для «ленивого» чтения отдельных полей без создания заголовка см. wire.BlockHeaderView """
+        ver, flags, difficulty, height, prev_hash, merkle_root, moment_us, nonce = wire.decode(buf, offset)
+        header = cls.__new__(cls)
+        header._short_version_byte = ver
+        header._short_version = None
+        header._height = height
+        header._prev_hash = prev_hash.hex()
+        header._merkel_root = merkle_root.hex()
+        header._moment_us = moment_us
+        header._difficulty = difficulty
+        header._nonce = nonce
+        header._genesis = bool(flags & wire.GENESIS_FLAG)
+        header._stamp = chronos.NO_STAMP
+        header._invalidate()
+        header._wire_cache = bytes(memoryview(buf)[offset:offset + wire.HEADER_SIZE])
+        return header
+
+    @classmethod
+    def from_dict(cls, source: dict) -> 'BlockHeader':
+        """ Восстановление заголовка из словарного представления (см. as_dict) """
+        header = cls.__new__(cls)
+        header._short_version_byte = int(source.get('short_version', DEFAULT_SHORT_VERSION_BYTE))
+        header._short_version = None
+        header._height = int(source['height'])
+        header._prev_hash = source['prev_hash']
+        header._merkel_root = source['merkle_root']
+        header._moment_us = chronos.moment_to_epoch_us(chronos.str_to_moment(source['moment']))
+        header._difficulty = int(source['difficulty'])
+        header._nonce = int(source['nonce'])
+        header._genesis = source['genesis'] == str(True)
+        header._stamp = chronos.NO_STAMP
+        header._invalidate()
+        return header
+
+    @classmethod
+    def from_record(cls, source: bytes) -> 'BlockHeader':
+        """ Восстановление заголовка из компактного представления (см. as_record) """
+        return cls.from_buffer(source)
+
+    def _invalidate(self) -> None:
+        """ Сброс кэша представлений (вызывается при изменении любого поля) """
+        self._dict_cache: dict | None = None
+        self._json_cache: str | None = None
+        self._bytes_cache: bytes | None = None
+        self._wire_cache: bytes | None = None
+        self._hash_cache: bytes | None = None
+
     def fully_initialized(self) -> bool:
         """ Признак того, чтоб объект полностью инициализирован """
         result = ((not self._height == INIT_HEIGHT) and
@@ -68,36 +155,80 @@ class BlockHeader:
         return result
 
     def as_dict(self) -> dict:
-        """ Преобразование внутренних данных в словарь """
-        result = {
-            'version': self.version,
-            'height': self.height_str,
-            'prev_hash': self.prev_hash,
-            'merkle_root': self.merkle_root,
-            'moment': self.moment_str,
-            'difficulty': self.difficulty_str,
-            'nonce': self.nonce_str,
-            'genesis': self.genesis_str
-        }
-        return result
+        """ Преобразование внутренних данных в словарь (кэшируется; ⚠️ возвращаемый словарь не изменять) """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'version': self.version,
+                'short_version': str(self.short_version_byte),
+                'height': self.height_str,
+                'prev_hash': self.prev_hash,
+                'merkle_root': self.merkle_root,
+                'moment': self.moment_str,
+                'difficulty': self.difficulty_str,
+                'nonce': self.nonce_str,
+                'genesis': self.genesis_str
+            }
+        return self._dict_cache
+
+    def as_record(self) -> bytes:
+        """ Компактное представление (для двоичных форматов) — двоичное представление заголовка (см. as_wire_bytes) """
+        return self.as_wire_bytes()
 
     def as_json(self) -> str:
-        """ Преобразование внутренних данных в JSON-строку """
-        return jsonifier.dict_to_json_str(self.as_dict())
+        """ Преобразование внутренних данных в JSON-строку (кэшируется) """
+        if self._json_cache is None:
+            self._json_cache = jsonifier.dict_to_json_str(self.as_dict())
+        return self._json_cache
 
     def as_bytes(self):
-        return self.as_json().encode()
+        """ Байтовое представление (JSON-строка в кодировке UTF-8, кэшируется) """
+        if self._bytes_cache is None:
+            self._bytes_cache = self.as_json().encode()
+        return self._bytes_cache
 
-    def size_in_bytes(self):
+    def size_in_bytes(self) -> int:
+        """ Размер байтового представления (as_bytes) в байтах """
         return len(self.as_bytes())
 
-    def dict_size_in_bytes(self) -> int:
-        """ Размер внутренних данных (в виде словаря) в байтах """
-        return sysutils.dict_size_in_bytes(self.as_dict())
-
-    def dict_size_in_bytes_str(self) -> str:
-        """ Строковое представление размера внутренних данных (в виде словаря) в байтах """
-        return str(self.dict_size_in_bytes())
+    def wire_size(self) -> int:
+        """ Размер двоичного представления (as_wire_bytes) в байтах (он фиксирован) """
+        return wire.HEADER_SIZE
+
+    def wire_size_str(self) -> str:
+        """ Строковое представление размера двоичного представления в байтах """
+        return str(self.wire_size())
+
+    def as_wire_bytes(self) -> bytes:
+        """ Двоичное представление фиксированной длины (см. block_header_wire, кэшируется) """
+        if self._wire_cache is None:
+            self._wire_cache = wire.encode(self.short_version_byte, self._genesis, self._difficulty,
+                                           self._height, self._prev_hash, self._merkel_root,
+                                           self._moment_us, self._nonce)
+        return self._wire_cache
+
+    def hashing_prefix(self) -> bytes:
+        """ Неизменная при переборе nonce часть данных, от которых считается хэш (двоичное представление без nonce) """
+        return self.as_wire_bytes()[:wire.NONCE_OFFSET]
+
+    def midstate(self):
+        """ Состояние SHA-256 после обработки hashing_prefix (для каждого nonce остается «дописать» только его байты,
+        см. cryptographer.sha256_from_midstate) """
+        return cryptographer.sha256_midstate(self.hashing_prefix())
+
+    def hash_bytes(self) -> bytes:
+        """ Хэш заголовка (SHA-256 от двоичного представления, т.е. от hashing_prefix и байтов nonce) в виде «сырых»
+        байтов (кэшируется) """
+        if self._hash_cache is None:
+            self._hash_cache = cryptographer.sha256(self.as_wire_bytes())
+        return self._hash_cache
+
+    def hash(self) -> str:
+        """ Хэш заголовка в виде строки из шестнадцатеричных символов """
+        return self.hash_bytes().hex()
+
+    def meets_difficulty(self) -> bool:
+        """ Признак того, что хэш заголовка удовлетворяет текущей сложности (майнинга) """
+        return cryptographer.meets_difficulty(self.hash_bytes(), self._difficulty)
 
     def number_of_members(self) -> int:
         """ Количество элементов в словаре """
@@ -110,7 +241,23 @@ class BlockHeader:
     @property
     def version(self) -> str:
         """ Текущая версия протокола """
-        return self._version
+        return cnst.CURRENT_PROTOCOL_VERSION
+
+    @property
+    def short_version(self) -> pvs.PVShort:
+        """ «Краткая версия» протокола (записывается в первый байт двоичного представления). Объект создается при
+        первом обращении; его изменения сбрасывают кэш представлений заголовка """
+        if self._short_version is None:
+            self._short_version = pvs.PVShort(bytearray([self._short_version_byte]))
+            self._short_version.observer = _ShortVersionWatcher(self)
+        return self._short_version
+
+    @property
+    def short_version_byte(self) -> int:
+        """ «Краткая версия» протокола, упакованная в один байт """
+        if self._short_version is None:
+            return self._short_version_byte
+        return self._short_version.as_bytes()[0]
 
     @property
     def height(self) -> int:
@@ -127,6 +274,7 @@ class BlockHeader:
         """ Установка высоты """
         if isinstance(value, int) and value > 0:
             self._height = value
+            self._invalidate()
 
     @property
     def prev_hash(self) -> str:
@@ -139,6 +287,7 @@ class BlockHeader:
         if isinstance(value, str) and True:
             # todo возможно, есть смысл как-то проверять полученный хэш
             self._prev_hash = value
+            self._invalidate()
 
     @property
     def merkle_root(self) -> str:
@@ -151,18 +300,35 @@ class BlockHeader:
         if isinstance(value, str) and True:
             # todo возможно, есть смысл как-то проверять полученный рут
             self._merkel_root = value
+            self._invalidate()
+
+    @property
+    def stamp(self) -> int:
+        """ Метка гибридных логических часов (для упорядочивания; NO_STAMP, если заголовок восстановлен из
+        представления) """
+        return self._stamp
 
     @property
     def moment(self):
-        """ Дата/время """
-        return self._moment
+        """ Дата/время (объект datetime создается при каждом обращении) """
+        return chronos.epoch_us_to_moment(self._moment_us)
+
+    @property
+    def moment_us(self) -> int:
+        """ Дата/время (микросекунды с начала отсчета) """
+        return self._moment_us
+
+    @property
+    def timestamp(self) -> bts.LargeHeaderTimestamp:
+        """ Временная метка заголовка """
+        return bts.LargeHeaderTimestamp.from_epoch_us(self._moment_us)
 
     # по идее, сеттер для moment не нужен (блок помечается соответствующей временной меткой во время создания
 
     @property
     def moment_str(self):
-        """ Текстовое представление даты/времени """
-        return self._moment_str
+        """ Текстовое представление даты/времени (формируется по запросу) """
+        return chronos.moment_to_str(self.moment)
 
     @property
     def difficulty(self) -> int:
@@ -177,27 +343,26 @@ class BlockHeader:
     @difficulty.setter
     def difficulty(self, value: int) -> None:
         """ Установка сложности (майнинга) """
-        if isinstance(value, int) and value >= cnst.MINIMAL_DIFFICULTY:
+        if isinstance(value, int) and cnst.MINIMAL_DIFFICULTY <= value <= cnst.MAXIMAL_DIFFICULTY:
             self._difficulty = value
+            self._invalidate()
 
     @property
     def nonce(self) -> int:
-        """ ... """
-        # todo Дать внятный комментарий (после того, как станет понятно, что именно здесь подразумевается под nonce)
+        """ Решение задачи майнинга (число, при котором хэш заголовка удовлетворяет текущей сложности) """
         return self._nonce
 
     @property
     def nonce_str(self) -> str:
-        """ Текстовое представление ... """
-        # todo Дать внятный комментарий (после того, как станет понятно, что именно здесь подразумевается под nonce)
+        """ Текстовое представление решения задачи майнинга """
         return str(self._nonce)
 
     @nonce.setter
     def nonce(self, value: int) -> None:
-        """ Установка значения для """
-        # todo Дать внятный комментарий (после того, как станет понятно, что именно здесь подразумевается под nonce)
-        if isinstance(value, int) and value >= 0:
+        """ Установка значения для решения задачи майнинга """
+        if isinstance(value, int) and 0 <= value <= MAX_NONCE:
             self._nonce = value
+            self._invalidate()
 
     @property
     def genesis(self) -> bool:
@@ -212,6 +377,3 @@ class BlockHeader:
     # По идее, сеттер для genesis не нужен (и даже невозможен)
 
 
-bh = BlockHeader(True)
-print(bh)
-
@@ -0,0 +1,181 @@
+"""
+Двоичный формат заголовка блока фиксированной длины (используется для хранения, хэширования и передачи по сети).
+
+Поля (все целые — старшие байты вперед):
+ ▪️ версия протокола — 1 байт («Краткая версия», см. PVShort);
+ ▪️ флаги — 1 байт (бит 0 — признак генезис-блока);
+ ▪️ сложность — 1 байт;
+ ▪️ высота — 8 байт (со знаком);
+ ▪️ хэш предыдущего блока — 32 байта;
+ ▪️ корень дерева Меркла — 32 байта;
+ ▪️ дата/время — 8 байт (микросекунды с 01.01.2024 00:00:00.0 UTC, со знаком);
+ ▪️ nonce — 8 байт (со знаком).
+
+Nonce записывается последним: все предшествующие ему байты — это префикс, который хэшируется один раз при майнинге
+"""
+
+import struct
+
+from src.entities.protocol_version import pv_short as pvs
+from src.frontier import chronos
+from src.frontier import cryptographer
+from src.ground import cnst
+from src.ground import errs
+
+
+# region Константы
+HEADER_STRUCT = struct.Struct('>BBBq32s32sqq')
+""" Раскладка полей заголовка """
+
+HEADER_SIZE: int = HEADER_STRUCT.size
+""" Длина заголовка в байтах """
+
+VERSION_OFFSET: int = 0
+""" Смещение байта версии протокола """
+
+FLAGS_OFFSET: int = 1
+""" Смещение байта флагов """
+
+DIFFICULTY_OFFSET: int = 2
+""" Смещение байта сложности """
+
+HEIGHT_OFFSET: int = 3
+""" Смещение высоты """
+
+PREV_HASH_OFFSET: int = HEIGHT_OFFSET + 8
+""" Смещение хэша предыдущего блока """
+
+MERKLE_ROOT_OFFSET: int = PREV_HASH_OFFSET + cnst.HASH_BYTE_LENGTH
+""" Смещение корня дерева Меркла """
+
+MOMENT_OFFSET: int = MERKLE_ROOT_OFFSET + cnst.HASH_BYTE_LENGTH
+""" Смещение даты/времени """
+
+NONCE_OFFSET: int = MOMENT_OFFSET + 8
+""" Смещение nonce (он же — длина префикса, неизменного при переборе nonce) """
+
+GENESIS_FLAG: int = 0b00000001
+""" Бит признака генезис-блока в байте флагов """
+
+INT64 = struct.Struct('>q')
+""" Целое число со знаком (8 байт) """
+# endregion
+
+
+def hash_to_bytes(value: str) -> bytes:
+    """ Преобразует хэш из строки шестнадцатеричных символов в 32 «сырых» байта """
+    if len(value) != cnst.HASH_STR_LENGTH:
+        raise ValueError(errs.HASH_STR_INCORRECT)
+    try:
+        return bytes.fromhex(value)
+    except ValueError:
+        raise ValueError(errs.HASH_STR_INCORRECT) from None
+
+
+def encode(short_version: int, genesis: bool, difficulty: int, height: int, prev_hash: str, merkle_root: str,
+           moment_us: int, nonce: int) -> bytes:
+    """ Упаковывает поля заголовка в двоичное представление длиной HEADER_SIZE байт """
+    return HEADER_STRUCT.pack(short_version, GENESIS_FLAG if genesis else 0, difficulty, height,
+                              hash_to_bytes(prev_hash), hash_to_bytes(merkle_root), moment_us, nonce)
+
+
+def decode(buf, offset: int = 0) -> tuple:
+    """ Разбирает все поля заголовка из буфера за один проход (хэши возвращаются в виде «сырых» байтов) """
+    if len(buf) - offset < HEADER_SIZE:
+        raise ValueError(errs.HEADER_BUFFER_TOO_SHORT)
+    return HEADER_STRUCT.unpack_from(buf, offset)
+
+
+class BlockHeaderView:
+    """ «Ленивое» представление заголовка поверх буфера (без копирования): каждое поле разбирается из memoryview
+    только при обращении к нему """
+
+    __slots__ = ('_buf',)
+
+    def __init__(self, buf: memoryview) -> None:
+        self._buf: memoryview = buf
+
+    @classmethod
+    def from_buffer(cls, buf, offset: int = 0) -> 'BlockHeaderView':
+        """ Представление заголовка, записанного в буфере (bytes, bytearray, mmap, memoryview) начиная с offset """
+        mv = memoryview(buf)[offset:offset + HEADER_SIZE]
+        if len(mv) != HEADER_SIZE:
+            raise ValueError(errs.HEADER_BUFFER_TOO_SHORT)
+        return cls(mv)
+
+    def __repr__(self) -> str:
+        """ Репрезентация (человеко-понятное описание объекта) """
+        return (f'The binary view of a block header (instance of {__class__.__name__}):'
+                f'\n ▪️ height: {self.height};\n ▪️ hash: {self.hash()}.\n')
+
+    @property
+    def buffer(self) -> memoryview:
+        """ Буфер с двоичным представлением заголовка """
+        return self._buf
+
+    @property
+    def short_version(self) -> pvs.PVShort:
+        """ «Краткая версия» протокола """
+        return pvs.PVShort(bytearray(self._buf[VERSION_OFFSET:VERSION_OFFSET + 1]))
+
+    @property
+    def genesis(self) -> bool:
+        """ Признак того, является ли данный блок генезис-блоком """
+        return bool(self._buf[FLAGS_OFFSET] & GENESIS_FLAG)
+
+    @property
+    def difficulty(self) -> int:
+        """ Сложность (майнинга) """
+        return self._buf[DIFFICULTY_OFFSET]
+
+    @property
+    def height(self) -> int:
+        """ Высота """
+        return INT64.unpack_from(self._buf, HEIGHT_OFFSET)[0]
+
+    @property
+    def prev_hash(self) -> str:
+        """ Хэш предыдущего блока """
+        return self._buf[PREV_HASH_OFFSET:MERKLE_ROOT_OFFSET].hex()
+
+    @property
+    def prev_hash_bytes(self) -> bytes:
+        """ Хэш предыдущего блока в виде «сырых» байтов """
+        return bytes(self._buf[PREV_HASH_OFFSET:MERKLE_ROOT_OFFSET])
+
+    @property
+    def merkle_root(self) -> str:
+        """ Корень дерева Меркла """
+        return self._buf[MERKLE_ROOT_OFFSET:MOMENT_OFFSET].hex()
+
+    @property
+    def merkle_root_bytes(self) -> bytes:
+        """ Корень дерева Меркла в виде «сырых» байтов """
+        return bytes(self._buf[MERKLE_ROOT_OFFSET:MOMENT_OFFSET])
+
+    @property
+    def moment_us(self) -> int:
+        """ Дата/время (микросекунды с начала отсчета) """
+        return INT64.unpack_from(self._buf, MOMENT_OFFSET)[0]
+
+    @property
+    def moment(self):
+        """ Дата/время """
+        return chronos.epoch_us_to_moment(self.moment_us)
+
+    @property
+    def nonce(self) -> int:
+        """ Решение задачи майнинга """
+        return INT64.unpack_from(self._buf, NONCE_OFFSET)[0]
+
+    def hash_bytes(self) -> bytes:
+        """ Хэш заголовка в виде «сырых» байтов (считается прямо по буферу) """
+        return cryptographer.sha256(self._buf)
+
+    def hash(self) -> str:
+        """ Хэш заголовка в виде строки из шестнадцатеричных символов """
+        return self.hash_bytes().hex()
+
+    def meets_difficulty(self) -> bool:
+        """ Признак того, что хэш заголовка удовлетворяет его сложности (майнинга) """
+        return cryptographer.meets_difficulty(self.hash_bytes(), self.difficulty)
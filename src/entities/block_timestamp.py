@@ -1,38 +1,132 @@
 """ Временная метка блока. Спецификация: https://clck.ru/38trLa """
 
+import struct
+import sys
+from array import array
+
 from multipledispatch import dispatch
-from datetime import datetime, timezone
 from pytz import timezone as tz
 
+from src.frontier import chronos
 from src.ground import cnst
 
 
+# region Константы
+TIMESTAMP_STRUCT = struct.Struct('>q')
+""" Двоичное представление метки: целое со знаком (8 байт, старшие байты вперед) """
+
+TIMESTAMP_ARRAY_TYPE: str = 'q'
+""" Код типа массива (array) меток """
+
+NATIVE_BIG_ENDIAN: bool = sys.byteorder == 'big'
+""" Признак того, что порядок байтов платформы совпадает с порядком байтов двоичного представления """
+# endregion
+
+
 class LargeHeaderTimestamp:
+    """ Временная метка: количество микросекунд, прошедших с 01.01.2024 00:00:00.0 UTC+0 (см. chronos.EPOCH). Объект
+    datetime и строковое представление создаются только по запросу """
+
+    __slots__ = ('_epoch_us',)
 
     @dispatch()
     def __init__(self) -> None:
-        """ Инициализация «по умолчанию» без параметров (берется текущее время в UTC) """
-        self._datetime: datetime = datetime.now(timezone.utc)
-        self._beginning: datetime = datetime.strptime(cnst.DATETIME_BEGINNING, cnst.DATETIME_FORMAT)
+        """ Инициализация «по умолчанию» без параметров (берется текущее время) """
+        self._epoch_us: int = chronos.now_epoch_us()
+
+    @dispatch(int)
+    def __init__(self, epoch_us: int) -> None:
+        """ Инициализация количеством микросекунд, прошедших с начала отсчета """
+        self._epoch_us: int = epoch_us
+
+    @classmethod
+    def from_epoch_us(cls, epoch_us: int) -> 'LargeHeaderTimestamp':
+        """ Метка по количеству микросекунд, прошедших с начала отсчета (без выбора перегрузки конструктора) """
+        timestamp = cls.__new__(cls)
+        timestamp._epoch_us = epoch_us
+        return timestamp
+
+    @classmethod
+    def from_moment(cls, moment) -> 'LargeHeaderTimestamp':
+        """ Метка по объекту datetime (с часовым поясом) """
+        return cls.from_epoch_us(chronos.moment_to_epoch_us(moment))
+
+    @classmethod
+    def from_bytes(cls, data, offset: int = 0) -> 'LargeHeaderTimestamp':
+        """ Метка из двоичного представления, записанного в буфере начиная с offset """
+        return cls.from_epoch_us(TIMESTAMP_STRUCT.unpack_from(data, offset)[0])
 
     def __repr__(self) -> str:
         """ Репрезентация (человеко-читаемое, наглядное представление объекта, который должен рассматриваться как
-        количество секунд, прошедших с 01.01.2024 00:00:00.0 UTC+0) """
+        количество микросекунд, прошедших с 01.01.2024 00:00:00.0 UTC+0) """
         # region Готовим «элементы»
         descr = f'The Large Header Timestamp (instance of {__class__.__name__}) is {self.as_str()}'
         mtz = tz(cnst.MOSCOW_TIMEZONE)
-        mdt = f'Moscow date/time: {self._datetime.astimezone(mtz)}'
+        mdt = f'Moscow date/time: {self.moment.astimezone(mtz)}'
+        eus = f'microseconds since the beginning: {self._epoch_us}'
         # endregion
         # region «Собираем» представление
         result = (f'{descr}:'
-                  f'\n ▪️ {mdt}.')
+                  f'\n ▪️ {mdt};'
+                  f'\n ▪️ {eus}.')
         # endregion
         return result
 
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LargeHeaderTimestamp):
+            return NotImplemented
+        return self._epoch_us == other._epoch_us
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, LargeHeaderTimestamp):
+            return NotImplemented
+        return self._epoch_us < other._epoch_us
+
+    def __hash__(self) -> int:
+        return hash(self._epoch_us)
+
+    @property
+    def epoch_us(self) -> int:
+        """ Количество микросекунд, прошедших с начала отсчета """
+        return self._epoch_us
+
+    @property
+    def moment(self):
+        """ Дата/время в виде объекта datetime (UTC; создается при каждом обращении) """
+        return chronos.epoch_us_to_moment(self._epoch_us)
+
     def as_str(self) -> str:
-        return datetime.strftime(self._datetime, cnst.DATETIME_FORMAT)
+        """ Строковое представление в формате DATETIME_FORMAT (формируется при каждом обращении) """
+        return chronos.moment_to_str(self.moment)
+
+    def to_bytes(self) -> bytes:
+        """ Двоичное представление (8 байт) """
+        return TIMESTAMP_STRUCT.pack(self._epoch_us)
+
+
+def to_array(timestamps) -> array:
+    """ Массив (array) количеств микросекунд для последовательности меток """
+    return array(TIMESTAMP_ARRAY_TYPE, (timestamp.epoch_us for timestamp in timestamps))
+
+
+def from_array(values) -> list[LargeHeaderTimestamp]:
+    """ Метки по последовательности (например, массиву) количеств микросекунд """
+    return [LargeHeaderTimestamp.from_epoch_us(value) for value in values]
+
 
+def array_to_bytes(values: array) -> bytes:
+    """ Двоичное представление массива меток: подряд по 8 байт (старшие байты вперед) """
+    if NATIVE_BIG_ENDIAN:
+        return values.tobytes()
+    swapped = array(TIMESTAMP_ARRAY_TYPE, values)
+    swapped.byteswap()
+    return swapped.tobytes()
 
-dt = LargeHeaderTimestamp()
-print(dt)
 
+def bytes_to_array(data) -> array:
+    """ Массив меток (количеств микросекунд) из двоичного представления (см. array_to_bytes) """
+    values = array(TIMESTAMP_ARRAY_TYPE)
+    values.frombytes(data)
+    if not NATIVE_BIG_ENDIAN:
+        values.byteswap()
+    return values
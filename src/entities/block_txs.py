@@ -1,14 +1,174 @@
+from src.entities import block_wire
+from src.entities import merkle_tree as mt
+from src.entities import tx_columns as txc
+from src.entities import tx_message as txm
+from src.frontier import chronos
+from src.frontier import cryptographer
+from src.frontier import jsonifier
+from src.ground import errs
+
+
 class BlockTxs:
+    """ Список транзакций блока (в колоночном хранилище) вместе с деревом Меркла их хэшей (дерево обновляется при
+    каждом добавлении) """
+
     def __init__(self):
-        self._txs: list = []
+        self._txs = txc.TxColumns()
+        self._tree = mt.MerkleTree()
+        self._positions: dict[bytes, int] | None = None  # строится при первом обращении (см. _index)
+        self._size_in_bytes: int = block_wire.EMPTY_TXS_SIZE
 
     def __repr__(self):
         descr = f'The list of transactions (instance of {__class__.__name__})'
         lgt = len(self._txs)
         cnt = f'count: {lgt}' if lgt > 0 else f'the list is empty'
+        mr = f'merkle root: {self.merkle_root}'
+        sze = f'size in bytes: {self._size_in_bytes}'
         result = (f'{descr}:'
-                  f'\n ▪️ {cnt}.\n')
+                  f'\n ▪️ {cnt};'
+                  f'\n ▪️ {mr};'
+                  f'\n ▪️ {sze}.\n')
         return result
 
+    @classmethod
+    def from_buffer(cls, buf, offset: int = 0) -> 'BlockTxs':
+        """ Восстановление списка транзакций из двоичного представления блока (см. block_wire), начиная с поля
+        количества транзакций по смещению offset. Транзакции разбираются прямо из буфера (без промежуточной копии
+        в bytes), хэши листьев считаются по тем же байтам, а дерево Меркла строится за один проход """
+        mv = memoryview(buf)
+        content = cls()
+        count = block_wire.COUNT_STRUCT.unpack_from(mv, offset)[0]
+        pos = offset + block_wire.COUNT_STRUCT.size
+        leaves = []
+        for _ in range(count):
+            length = block_wire.LENGTH_STRUCT.unpack_from(mv, pos)[0]
+            pos += block_wire.LENGTH_STRUCT.size
+            raw = mv[pos:pos + length]
+            if len(raw) != length:
+                raise ValueError(errs.BLOCK_BUFFER_CORRUPTED)
+            fields = jsonifier.json_str_to_dict(str(raw, 'utf-8'))
+            content._txs.append(txm.TxMessage.from_fields(chronos.str_to_moment(fields['moment']), fields['sender'],
+                                                          fields['acceptor'], fields['content'], fields['signature'],
+                                                          fields['moment']))
+            leaves.append(cryptographer.sha256(raw))
+            pos += length
+        content._tree.extend(leaves)
+        content._size_in_bytes = pos - offset
+        return content
+
+    @classmethod
+    def from_dict(cls, source: dict) -> 'BlockTxs':
+        """ Восстановление списка транзакций из словарного представления (см. as_dict); строковое представление
+        даты/времени разбирается один раз для одинаковых моментов (и берется в представления сообщений как есть, только
+        если совпадает с той, что строится по разобранному моменту, см. TxMessage.from_dict) """
+        content = cls()
+        moments = {}
+        messages = []
+        for tx in source['txs']:
+            moment = moments.get(tx['moment'])
+            if moment is None:
+                value = chronos.str_to_moment(tx['moment'])
+                canonical = tx['moment'] == chronos.moment_to_str(value)
+                moment = moments[tx['moment']] = (value, tx['moment'] if canonical else None)
+            messages.append(txm.TxMessage.from_fields(moment[0], tx['sender'], tx['acceptor'], tx['content'],
+                                                      tx['signature'], moment[1]))
+        content.extend(messages)
+        return content
+
+    def as_dict(self) -> dict:
+        """ Словарное представление: корень дерева Меркла и словарные представления транзакций """
+        return {
+            'merkle_root': self.merkle_root,
+            'txs': self._txs.dicts()
+        }
+
+    @classmethod
+    def from_record(cls, source: list) -> 'BlockTxs':
+        """ Восстановление списка транзакций из компактного представления (см. as_record). Дата/время и ее строковое
+        представление вычисляются один раз для всех транзакций с одинаковым моментом (например, принятых одним пакетом,
+        см. tx_ingest) """
+        content = cls()
+        moments = {}
+        messages = []
+        for moment_us, sender, acceptor, text, signature in source:
+            moment = moments.get(moment_us)
+            if moment is None:
+                value = chronos.epoch_us_to_moment(moment_us)
+                moment = moments[moment_us] = (value, chronos.moment_to_str(value))
+            messages.append(txm.TxMessage.from_fields(moment[0], sender, acceptor, text, signature, moment[1]))
+        content.extend(messages)
+        return content
+
+    def as_record(self) -> list:
+        """ Компактное представление (для двоичных форматов): компактные представления транзакций (собираются прямо
+        из колонок) """
+        return self._txs.records()
+
+    def __len__(self) -> int:
+        """ Количество транзакций """
+        return len(self._txs)
+
+    def _index(self) -> dict[bytes, int]:
+        """ Позиции транзакций по их хэшам (словарь строится при первом обращении) """
+        if self._positions is None:
+            self._positions = {}
+            for idx in range(len(self._tree)):
+                self._positions.setdefault(self._tree.leaf(idx), idx)
+        return self._positions
+
     def add_tx(self, tx):
+        """ Добавление транзакции (корень дерева Меркла пересчитывается за O(log n)); транзакция с хэшем, который уже
+        есть в блоке, не добавляется """
+        leaf = tx.hash_bytes()
+        positions = self._index()
+        if leaf in positions:
+            raise ValueError(errs.TX_ALREADY_IN_BLOCK)
+        positions[leaf] = len(self._txs)
         self._txs.append(tx)
+        self._tree.append(leaf)
+        self._size_in_bytes += block_wire.tx_size(tx)
+
+    def extend(self, txs) -> None:
+        """ Добавление множества транзакций сразу (колонки заполняются одним вызовом, дерево Меркла достраивается
+        за один проход, см. MerkleTree.extend); если хотя бы одна транзакция повторяется (в блоке или в самом пакете),
+        не добавляется ни одна """
+        txs = list(txs)
+        leaves = [tx.hash_bytes() for tx in txs]
+        positions = self._index()
+        added = {leaf: idx for idx, leaf in enumerate(leaves, len(self._txs))}
+        if len(added) != len(leaves) or not positions.keys().isdisjoint(added):
+            raise ValueError(errs.TX_ALREADY_IN_BLOCK)
+        positions.update(added)
+        self._txs.extend(txs)
+        self._tree.extend(leaves)
+        self._size_in_bytes += sum(map(block_wire.tx_size, txs))
+
+    def size_in_bytes(self) -> int:
+        """ Размер списка транзакций в двоичном представлении блока (поддерживается нарастающим итогом, O(1)) """
+        return self._size_in_bytes
+
+    def position_of(self, tx) -> int:
+        """ Позиция транзакции в блоке (по ее хэшу) """
+        try:
+            return self._index()[tx.hash_bytes()]
+        except KeyError:
+            raise KeyError(errs.TX_NOT_IN_BLOCK) from None
+
+    def proofs_for(self, txs) -> list[mt.MerkleProof]:
+        """ Доказательства включения для множества транзакций (за один проход по сохраненному дереву) """
+        return self._tree.proofs([self.position_of(tx) for tx in txs])
+
+    @property
+    def txs(self) -> txc.TxColumns:
+        """ Транзакции (в порядке добавления; объекты TxMessage создаются по запросу) """
+        return self._txs
+
+    @property
+    def tree(self) -> mt.MerkleTree:
+        """ Дерево Меркла хэшей транзакций """
+        return self._tree
+
+    @property
+    def merkle_root(self) -> str:
+        """ Корень дерева Меркла (для пустого списка — нулевой хэш) """
+        return self._tree.root()
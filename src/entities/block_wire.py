@@ -0,0 +1,75 @@
+"""
+Двоичный формат блока и точный подсчет размеров в этом формате.
+
+Блок записывается так (все целые — старшие байты вперед):
+ ▪️ магическое число — 4 байта;
+ ▪️ заголовок — HEADER_SIZE байт (см. block_header_wire);
+ ▪️ количество транзакций — 4 байта;
+ ▪️ для каждой транзакции — длина (4 байта) и байтовое представление (TxMessage.as_bytes).
+
+Размеры считаются по этому формату, поэтому их можно поддерживать нарастающим итогом при заполнении блока
+"""
+
+import struct
+
+from src.entities import block_header_wire as hdr_wire
+from src.ground import errs
+
+
+# region Константы
+MAGIC_STRUCT = struct.Struct('>I')
+""" Магическое число """
+
+COUNT_STRUCT = struct.Struct('>I')
+""" Количество транзакций """
+
+LENGTH_STRUCT = struct.Struct('>I')
+""" Длина байтового представления транзакции """
+
+HEADER_OFFSET: int = MAGIC_STRUCT.size
+""" Смещение заголовка от начала блока """
+
+COUNT_OFFSET: int = HEADER_OFFSET + hdr_wire.HEADER_SIZE
+""" Смещение количества транзакций от начала блока """
+
+TXS_OFFSET: int = COUNT_OFFSET + COUNT_STRUCT.size
+""" Смещение первой транзакции от начала блока """
+
+EMPTY_TXS_SIZE: int = COUNT_STRUCT.size
+""" Размер пустого списка транзакций """
+
+EMPTY_BLOCK_SIZE: int = TXS_OFFSET
+""" Размер блока без транзакций """
+# endregion
+
+
+def tx_size(tx) -> int:
+    """ Размер, который транзакция занимает в блоке (вместе с длиной) """
+    return LENGTH_STRUCT.size + len(tx.as_bytes())
+
+
+def encode(block) -> bytes:
+    """ Двоичное представление блока """
+    content = block.content
+    parts = [MAGIC_STRUCT.pack(block.magic_number), block.header.as_wire_bytes(), COUNT_STRUCT.pack(len(content))]
+    for tx in content.txs:
+        raw = tx.as_bytes()
+        parts.append(LENGTH_STRUCT.pack(len(raw)))
+        parts.append(raw)
+    return b''.join(parts)
+
+
+def tx_slices(buf, offset: int = COUNT_OFFSET):
+    """ Генератор байтовых представлений транзакций блока (срезы memoryview, без копирования); offset — смещение поля
+    количества транзакций """
+    mv = memoryview(buf)
+    count = COUNT_STRUCT.unpack_from(mv, offset)[0]
+    pos = offset + COUNT_STRUCT.size
+    for _ in range(count):
+        length = LENGTH_STRUCT.unpack_from(mv, pos)[0]
+        pos += LENGTH_STRUCT.size
+        raw = mv[pos:pos + length]
+        if len(raw) != length:
+            raise ValueError(errs.BLOCK_BUFFER_CORRUPTED)
+        yield raw
+        pos += length
@@ -0,0 +1,97 @@
+"""
+Фильтр Блума блока: компактное множество ключей (отправители, получатели и хэши транзакций), для которого проверка
+вхождения может ошибаться только в одну сторону — «возможно, есть» вместо «нет». Поэтому при поиске по диапазону
+блоков можно пропускать блоки, фильтр которых отвечает «нет», не разбирая их транзакции.
+
+Позиции ключа в битовом массиве получаются двойным хэшированием: из SHA-256 ключа берутся два 64-битных числа h1 и h2,
+i-я позиция — (h1 + i * h2) mod m. Пара (h1, h2) не зависит от размера фильтра, поэтому при просмотре многих блоков
+она вычисляется один раз (см. key_hashes и might_contain)
+"""
+
+from src.frontier import cryptographer
+
+
+# region Константы
+BITS_PER_KEY: int = 10
+""" Количество бит фильтра на один ключ (при HASH_COUNT = 7 доля ложных срабатываний около 1%) """
+
+HASH_COUNT: int = 7
+""" Количество позиций (хэш-функций) на один ключ """
+
+MIN_SIZE: int = 1
+""" Минимальный размер фильтра (в байтах) """
+
+HALF_HASH_SIZE: int = 8
+""" Размер каждого из двух чисел, получаемых из хэша ключа (в байтах) """
+# endregion
+
+
+def key_hashes(key: bytes) -> tuple[int, int]:
+    """ Пара чисел (h1, h2), из которых получаются позиции ключа в фильтре любого размера """
+    digest = cryptographer.sha256(key)
+    return (int.from_bytes(digest[:HALF_HASH_SIZE], 'big'),
+            int.from_bytes(digest[HALF_HASH_SIZE:2 * HALF_HASH_SIZE], 'big') | 1)
+
+
+def might_contain(bits, hashes: tuple[int, int]) -> bool:
+    """ Проверка ключа (по заранее вычисленной паре чисел) прямо по байтам фильтра (bytes, memoryview, mmap):
+    False — ключа в фильтре точно нет, True — ключ, возможно, есть """
+    m = len(bits) * 8
+    h1, h2 = hashes
+    for i in range(HASH_COUNT):
+        pos = (h1 + i * h2) % m
+        if not bits[pos >> 3] & (1 << (pos & 7)):
+            return False
+    return True
+
+
+class BloomFilter:
+    """ Фильтр Блума фиксированного размера """
+
+    __slots__ = ('_bits',)
+
+    def __init__(self, capacity: int) -> None:
+        """ Пустой фильтр, рассчитанный на capacity ключей """
+        self._bits = bytearray(max(MIN_SIZE, (capacity * BITS_PER_KEY + 7) // 8))
+
+    def __repr__(self) -> str:
+        """ Репрезентация (человеко-понятное описание объекта) """
+        descr = f'The Bloom filter (instance of {__class__.__name__})'
+        sze = f'size in bytes: {len(self._bits)}'
+        return f'{descr}:\n ▪️ {sze}.\n'
+
+    def __contains__(self, key: bytes) -> bool:
+        """ False — ключа в фильтре точно нет, True — ключ, возможно, есть """
+        return might_contain(self._bits, key_hashes(key))
+
+    @classmethod
+    def from_bytes(cls, data) -> 'BloomFilter':
+        """ Восстановление фильтра из байтового представления """
+        bloom = cls.__new__(cls)
+        bloom._bits = bytearray(data)
+        return bloom
+
+    @classmethod
+    def for_block(cls, block) -> 'BloomFilter':
+        """ Фильтр блока: отправители, получатели (в UTF-8) и хэши транзакций (листья дерева Меркла) """
+        content = block.content
+        columns = content.txs
+        parties = columns.parties
+        bloom = cls(len(parties) + len(columns))
+        for party in parties:
+            bloom.add(party.encode())
+        for idx in range(len(columns)):
+            bloom.add(content.tree.leaf(idx))
+        return bloom
+
+    def add(self, key: bytes) -> None:
+        """ Добавление ключа """
+        m = len(self._bits) * 8
+        h1, h2 = key_hashes(key)
+        for i in range(HASH_COUNT):
+            pos = (h1 + i * h2) % m
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def as_bytes(self) -> bytes:
+        """ Байтовое представление (битовый массив) """
+        return bytes(self._bits)
@@ -0,0 +1,181 @@
+"""
+Дерево Меркла (дерево хэшей транзакций) с сохранением всех внутренних уровней.
+
+Уровень 0 — хэши листьев (транзакций), уровень i + 1 — хэши пар узлов уровня i (SHA-256 от конкатенации «сырых»
+байтов). Если на уровне нечетное количество узлов, последний узел переносится на следующий уровень без изменений (а не
+образует пару сам с собой: иначе у списков [a, b, c] и [a, b, c, c] был бы один и тот же корень). Корень — единственный
+узел верхнего уровня. При добавлении листа пересчитывается только путь от него до корня (O(log n)).
+
+Доказательство включения листа — это его индекс и список «соседей» на каждом уровне (от листа к корню). Доказательства
+для многих листов строятся за один проход по сохраненным уровням, а проверяются пакетом: узлы, уже подтвержденные
+предыдущими доказательствами, повторно не хэшируются
+"""
+
+from src.frontier import cryptographer
+from src.ground import cnst
+from src.ground import errs
+
+
+# region Константы
+HASH_SIZE: int = cnst.HASH_BYTE_LENGTH
+""" Длина одного узла (хэша) в байтах """
+# endregion
+
+
+class MerkleProof:
+    """ Доказательство включения листа в дерево Меркла """
+
+    __slots__ = ('_index', '_siblings')
+
+    def __init__(self, index: int, siblings: tuple[bytes, ...]) -> None:
+        self._index: int = index
+        self._siblings: tuple[bytes, ...] = siblings
+
+    def __repr__(self) -> str:
+        """ Репрезентация (человеко-понятное описание объекта) """
+        return (f'The Merkle inclusion proof (instance of {__class__.__name__}):'
+                f'\n ▪️ leaf index: {self._index};\n ▪️ path length: {len(self._siblings)}.\n')
+
+    @property
+    def index(self) -> int:
+        """ Индекс листа """
+        return self._index
+
+    @property
+    def siblings(self) -> tuple[bytes, ...]:
+        """ «Соседи» на пути от листа к корню (в виде «сырых» байтов; пустые байты — на уровне, куда узел перенесен
+        без пары) """
+        return self._siblings
+
+
+class MerkleTree:
+    """ Дерево Меркла с инкрементальным добавлением листьев. Каждый уровень хранится одним непрерывным буфером
+    (узел номер i занимает байты с i * 32 по (i + 1) * 32), чтобы не держать отдельный объект на каждый хэш """
+
+    def __init__(self) -> None:
+        self._levels: list[bytearray] = [bytearray()]
+
+    def __repr__(self) -> str:
+        """ Репрезентация (человеко-понятное описание объекта) """
+        descr = f'The Merkle tree (instance of {__class__.__name__})'
+        lvs = f'leaves: {len(self)}'
+        hgh = f'levels: {len(self._levels)}'
+        rt = f'root: {self.root()}'
+        return f'{descr}:\n ▪️ {lvs};\n ▪️ {hgh};\n ▪️ {rt}.\n'
+
+    def __len__(self) -> int:
+        """ Количество листьев """
+        return len(self._levels[0]) // HASH_SIZE
+
+    @property
+    def levels(self) -> list[bytearray]:
+        """ Все уровни дерева (от листьев к корню), каждый — непрерывный буфер хэшей; ⚠️ не изменять """
+        return self._levels
+
+    def leaf(self, idx: int) -> bytes:
+        """ Лист (хэш транзакции) с указанным индексом """
+        return _node(self._levels[0], idx)
+
+    def append(self, leaf: bytes) -> None:
+        """ Добавление листа (хэша транзакции в виде «сырых» байтов) с пересчетом пути до корня """
+        levels = self._levels
+        levels[0] += leaf
+        idx = len(self) - 1
+        level = 0
+        while len(levels[level]) > HASH_SIZE:
+            nodes = levels[level]
+            left = (idx & ~1) * HASH_SIZE
+            pair = nodes[left:left + 2 * HASH_SIZE]
+            parent = cryptographer.sha256(pair) if len(pair) > HASH_SIZE else pair
+            if level + 1 == len(levels):
+                levels.append(bytearray())
+            upper = levels[level + 1]
+            idx >>= 1
+            pos = idx * HASH_SIZE
+            upper[pos:pos + HASH_SIZE] = parent
+            level += 1
+
+    def extend(self, leaves) -> None:
+        """ Добавление множества листьев сразу: уровни над новыми листьями пересчитываются за один проход по каждому
+        уровню (O(n) хэшей вместо O(n log n) при поочередном добавлении) """
+        levels = self._levels
+        sha256 = cryptographer.sha256
+        first = len(self)
+        for leaf in leaves:
+            levels[0] += leaf
+        level = 0
+        start = first & ~1
+        while len(levels[level]) > HASH_SIZE:
+            nodes = levels[level]
+            if level + 1 == len(levels):
+                levels.append(bytearray())
+            upper = levels[level + 1]
+            del upper[(start >> 1) * HASH_SIZE:]
+            for pos in range(start * HASH_SIZE, len(nodes), 2 * HASH_SIZE):
+                pair = nodes[pos:pos + 2 * HASH_SIZE]
+                upper += sha256(pair) if len(pair) > HASH_SIZE else pair
+            start = (start >> 1) & ~1
+            level += 1
+
+    def proofs(self, indices) -> list[MerkleProof]:
+        """ Доказательства включения для листов с указанными индексами (за один проход по уровням дерева) """
+        indices = list(indices)
+        current = list(indices)
+        count = len(self)
+        for idx in current:
+            if not (isinstance(idx, int) and 0 <= idx < count):
+                raise IndexError(errs.MERKLE_LEAF_INDEX_ERROR)
+        paths: list[list[bytes]] = [[] for _ in current]
+        for nodes in self._levels[:-1]:
+            last = len(nodes) // HASH_SIZE - 1
+            for k, idx in enumerate(current):
+                sibling = idx ^ 1
+                paths[k].append(_node(nodes, sibling) if sibling <= last else b'')
+                current[k] = idx >> 1
+        return [MerkleProof(idx, tuple(path)) for idx, path in zip(indices, paths)]
+
+    def root_bytes(self) -> bytes:
+        """ Корень дерева в виде «сырых» байтов (для пустого дерева — нулевой хэш) """
+        top = self._levels[-1]
+        return bytes(top) if top else bytes(HASH_SIZE)
+
+    def root(self) -> str:
+        """ Корень дерева в виде строки из шестнадцатеричных символов """
+        return self.root_bytes().hex()
+
+
+def _node(nodes: bytearray, idx: int) -> bytes:
+    """ Узел с указанным индексом из буфера уровня """
+    return bytes(nodes[idx * HASH_SIZE:(idx + 1) * HASH_SIZE])
+
+
+def verify_batch(root: str, items) -> list[bool]:
+    """ Пакетная проверка доказательств включения относительно корня (например, merkle_root из заголовка блока).
+    items — пары (хэш листа в виде «сырых» байтов, MerkleProof). Узлы, подтвержденные предыдущими доказательствами,
+    запоминаются: как только путь очередного доказательства выходит на такой узел, проверка завершается сравнением """
+    root_bytes = bytes.fromhex(root)
+    verified: dict[tuple[int, int, int], bytes] = {}
+    results = []
+    for leaf, proof in items:
+        depth = len(proof.siblings)
+        node = leaf
+        idx = proof.index
+        path = []
+        for level, sibling in enumerate(proof.siblings):
+            known = verified.get((depth, level, idx))
+            if known is not None:
+                ok = known == node
+                break
+            if not sibling and idx & 1:                        # без пары переносится только последний (четный) узел
+                ok = False
+                break
+            path.append(((depth, level, idx), node))
+            if sibling:
+                node = cryptographer.sha256(sibling + node if idx & 1 else node + sibling)
+            idx >>= 1
+        else:
+            ok = idx == 0 and node == root_bytes
+        if ok:
+            verified.update(path)
+        results.append(ok)
+    return results
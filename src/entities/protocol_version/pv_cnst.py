@@ -2,6 +2,8 @@
 Константы для версии протокола
 """
 
+from src.ground import bits
+
 UNDEF_MAJOR: int = -1
 """ «Мажор» не определен """
 
@@ -62,3 +64,6 @@ PATCH_FOR_SHORT_VERSION_MIN: int = 0
 PATCH_FOR_SHORT_VERSION_MAX: int = 7
 """ Максимальное значение «Патча» для «Краткой версии» """
 
+
+SHORT_VERSION_LAYOUT: bits.BitLayout = bits.BitLayout((2, 3, 3))
+""" Раскладка битов «Краткой версии» в одном байте: «Мажор» (биты 7 и 6), «Минор» (с 5 по 3), «Патч» (со 2 по 0) """
@@ -15,3 +15,6 @@ PVS_PATCH_VALUE_ERROR = ('Incorrect "Patch" value for the short version of the p
 
 NOT_AN_OBSERVER = 'The resulting object is not an inheritor of the class PVObserver'
 """ Сообщение об ошибке при попытке установить в качестве «Наблюдателя» экземпляр какого-то другого класса """
+
+PVS_LENGTHS_MISMATCH = 'The "Major", "Minor" and "Patch" arrays for the short versions must be of the same length'
+""" Сообщение об ошибке входных значений при упаковке массивов «Мажоров», «Миноров» и «Патчей» разной длины """
@@ -3,6 +3,7 @@
 """
 
 from src.entities.protocol_version import pv_cnst
+from src.entities.protocol_version import pv_errs
 
 
 def undefined_version() -> tuple[int, int, int]:
@@ -61,15 +62,14 @@ def patch_for_short_version_from_byte(b: int) -> int:
 
 def decode_short_version(b: int) -> tuple[int, int, int]:
     """
-    Позволяет получить «Краткую версию» («Минор», «Мажор» и «Патч») из байта
+    Позволяет получить «Краткую версию» («Минор», «Мажор» и «Патч») из байта (по раскладке
+    pv_cnst.SHORT_VERSION_LAYOUT)
 
     :param b: Исходный байт (в котором должны быть упакованы значения для «Краткой версии»)
     :return: Кортеж, содержащий «Минор», «Мажор» и «Патч»
     """
 
-    return (major_for_short_version_from_byte(b),
-            minor_for_short_version_from_byte(b),
-            patch_for_short_version_from_byte(b))
+    return pv_cnst.SHORT_VERSION_LAYOUT.unpack(b)
 
 
 def major_for_short_version_to_byte(value: int) -> int:
@@ -110,6 +110,7 @@ def patch_for_short_version_to_byte(value: int) -> int:
 def encode_short_version(major: int, minor: int, patch: int) -> int:
     """
     Позволяет закодировать в одном байте «Краткую версию» из соответствующих значений «Мажора», «Минора» и «Патча»
+    (по раскладке pv_cnst.SHORT_VERSION_LAYOUT; значение, не помещающееся в свое поле, вызывает ValueError)
 
     :param major: «Мажор»
     :param minor: «Минор»
@@ -117,9 +118,7 @@ def encode_short_version(major: int, minor: int, patch: int) -> int:
     :return: Возвращает 1 байт, где биты 7 и 6 — «Мажор», с 5 по 3-й биты — «Минор» и биты со 2 по 0 — «Патч»
     """
 
-    return (major_for_short_version_to_byte(major) +
-            minor_for_short_version_to_byte(minor) +
-            patch_for_short_version_to_byte(patch))
+    return pv_cnst.SHORT_VERSION_LAYOUT.pack(major, minor, patch)
 
 
 def major_for_short_version_is_correct(value: int) -> bool:
@@ -156,3 +155,75 @@ def patch_for_short_version_is_correct(value: int) -> bool:
 
     return (isinstance(value, int) and
             (pv_cnst.PATCH_FOR_SHORT_VERSION_MIN <= value <= pv_cnst.PATCH_FOR_SHORT_VERSION_MAX))
+
+
+# region Таблицы для массовой (де)кодировки «Краткой версии»
+MAJOR_FROM_BYTE_TABLE: bytes = bytes(decode_short_version(b)[0] for b in range(256))
+""" «Мажор» для каждого из 256 значений байта (таблица для bytes.translate) """
+
+MINOR_FROM_BYTE_TABLE: bytes = bytes(decode_short_version(b)[1] for b in range(256))
+""" «Минор» для каждого из 256 значений байта (таблица для bytes.translate) """
+
+PATCH_FROM_BYTE_TABLE: bytes = bytes(decode_short_version(b)[2] for b in range(256))
+""" «Патч» для каждого из 256 значений байта (таблица для bytes.translate) """
+
+MAJOR_TO_BYTE_TABLE: bytes = bytes(encode_short_version(v, 0, 0) if v <= pv_cnst.MAJOR_FOR_SHORT_VERSION_MAX else 0
+                                    for v in range(256))
+""" «Мажор», упакованный в биты 7 и 6, для каждого значения (корректны только значения от 0 до 3) """
+
+MINOR_TO_BYTE_TABLE: bytes = bytes(encode_short_version(0, v, 0) if v <= pv_cnst.MINOR_FOR_SHORT_VERSION_MAX else 0
+                                    for v in range(256))
+""" «Минор», упакованный в биты с 5 по 3, для каждого значения (корректны только значения от 0 до 7) """
+
+CORRECT_MAJORS: bytes = bytes(range(pv_cnst.MAJOR_FOR_SHORT_VERSION_MIN, pv_cnst.MAJOR_FOR_SHORT_VERSION_MAX + 1))
+""" Корректные значения «Мажора» (удаляются из массива при проверке) """
+
+CORRECT_MINORS: bytes = bytes(range(pv_cnst.MINOR_FOR_SHORT_VERSION_MIN, pv_cnst.MINOR_FOR_SHORT_VERSION_MAX + 1))
+""" Корректные значения «Минора» (удаляются из массива при проверке) """
+
+CORRECT_PATCHES: bytes = bytes(range(pv_cnst.PATCH_FOR_SHORT_VERSION_MIN, pv_cnst.PATCH_FOR_SHORT_VERSION_MAX + 1))
+""" Корректные значения «Патча» (удаляются из массива при проверке) """
+# endregion
+
+
+def decode_short_versions(data) -> tuple[bytes, bytes, bytes]:
+    """
+    Позволяет получить «Краткие версии» сразу для массива байтов (например, байтов версий всех заголовков, полученных
+    при синхронизации): каждый массив получается одним вызовом bytes.translate по таблице на 256 значений, без вызова
+    функций для каждого байта
+
+    :param data: Исходные байты (bytes, bytearray, memoryview), в каждом из которых упакована «Краткая версия»
+    :return: Кортеж из трех массивов (bytes) той же длины: «Мажоры», «Миноры» и «Патчи»
+    """
+
+    data = bytes(data)
+    return (data.translate(MAJOR_FROM_BYTE_TABLE),
+            data.translate(MINOR_FROM_BYTE_TABLE),
+            data.translate(PATCH_FROM_BYTE_TABLE))
+
+
+def encode_short_versions(majors, minors, patches) -> bytes:
+    """
+    Позволяет закодировать «Краткие версии» сразу для массивов «Мажоров», «Миноров» и «Патчей» (обратное
+    к decode_short_versions). Значения сдвигаются на свои позиции таблицами, после чего три массива объединяются
+    побитовым «или» как большие целые (поля не пересекаются, поэтому байты друг на друга не влияют)
+
+    :param majors: «Мажоры» (bytes или последовательность целых)
+    :param minors: «Миноры» (той же длины)
+    :param patches: «Патчи» (той же длины)
+    :return: Байты, в каждом из которых упакована «Краткая версия»
+    """
+
+    majors, minors, patches = bytes(majors), bytes(minors), bytes(patches)
+    if not len(majors) == len(minors) == len(patches):
+        raise ValueError(pv_errs.PVS_LENGTHS_MISMATCH)
+    if majors.translate(None, CORRECT_MAJORS):           # после удаления корректных значений что-то осталось
+        raise ValueError(pv_errs.PVS_MAJOR_VALUE_ERROR)
+    if minors.translate(None, CORRECT_MINORS):
+        raise ValueError(pv_errs.PVS_MINOR_VALUE_ERROR)
+    if patches.translate(None, CORRECT_PATCHES):
+        raise ValueError(pv_errs.PVS_PATCH_VALUE_ERROR)
+    packed = (int.from_bytes(majors.translate(MAJOR_TO_BYTE_TABLE), 'big') |
+              int.from_bytes(minors.translate(MINOR_TO_BYTE_TABLE), 'big') |
+              int.from_bytes(patches, 'big'))
+    return packed.to_bytes(len(majors), 'big')
@@ -21,6 +21,9 @@ class PVShort:
     отношению к «Полной версии». Записывается в первый байт «Малого» заголовка
     """
 
+    LAYOUT: bits.BitLayout = pv_cnst.SHORT_VERSION_LAYOUT
+    """ Раскладка битов «Мажора», «Минора» и «Патча» в байте """
+
     @dispatch(int, int, int)
     def __init__(self,
                  major: int = pv_cnst.DEF_MAJOR_SHIFT,
@@ -80,8 +83,7 @@ class PVShort:
         # endregion
         if pv_hlpr.bytearray_length_for_short_version_is_correct(raw_bytes):
             # region «Парсим» полученный байт и устанавливаем значения
-            b = raw_bytes[pv_cnst.FIRST_BYTE]
-            self._major, self._minor, self._patch = pv_hlpr.decode_short_version(b)
+            self._major, self._minor, self._patch = self.LAYOUT.from_bytes(raw_bytes, pv_cnst.FIRST_BYTE)
             # endregion
         else:
             # region Поднимаем исключение
@@ -144,7 +146,7 @@ class PVShort:
         :return: Один байт, в котором упакованы «Мажор», «Минор» и «Патч»
         """
 
-        return pv_hlpr.encode_short_version(self._major, self._minor, self._patch)
+        return self.LAYOUT.pack(self._major, self._minor, self._patch)
 
     def _notify_observer(self) -> None:
         """
@@ -0,0 +1,174 @@
+"""
+Колоночное хранилище транзакций блока («структура массивов» вместо списка объектов TxMessage):
+ ▪️ дата/время — массив целых (микросекунды с начала отсчета, см. chronos.moment_to_epoch_us);
+ ▪️ отправитель и получатель — массивы идентификаторов в общей таблице участников (каждое имя хранится один раз);
+ ▪️ содержимое и подпись — по одному непрерывному буферу UTF-8 и массиву смещений в нем.
+
+Объекты TxMessage создаются только по запросу (см. TxColumns.view)
+"""
+
+from array import array
+
+from src.entities import tx_message as txm
+from src.frontier import chronos
+
+
+class TxColumns:
+    """ Колоночное хранилище транзакций """
+
+    __slots__ = ('_moments', '_senders', '_acceptors', '_parties', '_party_ids',
+                 '_content', '_content_offsets', '_signature', '_signature_offsets')
+
+    def __init__(self) -> None:
+        self._moments = array('q')
+        self._senders = array('I')
+        self._acceptors = array('I')
+        self._parties: list[str] = []
+        self._party_ids: dict[str, int] = {}
+        self._content = bytearray()
+        self._content_offsets = array('Q', [0])
+        self._signature = bytearray()
+        self._signature_offsets = array('Q', [0])
+
+    def __repr__(self) -> str:
+        """ Репрезентация (человеко-понятное описание объекта) """
+        descr = f'The columnar transaction store (instance of {__class__.__name__})'
+        cnt = f'count: {len(self)}'
+        prt = f'distinct parties: {len(self._parties)}'
+        cnt_b = f'content bytes: {len(self._content)}'
+        return f'{descr}:\n ▪️ {cnt};\n ▪️ {prt};\n ▪️ {cnt_b}.\n'
+
+    def __len__(self) -> int:
+        """ Количество транзакций """
+        return len(self._moments)
+
+    def __getitem__(self, idx: int) -> txm.TxMessage:
+        """ Транзакция с указанным индексом (создается по запросу) """
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(idx)
+        return self.view(idx)
+
+    def __iter__(self):
+        """ Перебор транзакций (объекты создаются по одному) """
+        for idx in range(len(self)):
+            yield self.view(idx)
+
+    def _intern(self, party: str) -> int:
+        """ Идентификатор участника в общей таблице (при необходимости участник добавляется) """
+        pid = self._party_ids.get(party)
+        if pid is None:
+            pid = self._party_ids[party] = len(self._parties)
+            self._parties.append(party)
+        return pid
+
+    def append(self, tx: txm.TxMessage) -> None:
+        """ Добавление транзакции (ее поля раскладываются по колонкам) """
+        self._moments.append(chronos.moment_to_epoch_us(tx.moment))
+        self._senders.append(self._intern(tx.sender))
+        self._acceptors.append(self._intern(tx.acceptor))
+        self._content += tx.content.encode()
+        self._content_offsets.append(len(self._content))
+        self._signature += tx.signature.encode()
+        self._signature_offsets.append(len(self._signature))
+
+    def extend(self, txs) -> None:
+        """ Добавление множества транзакций (то же, что append для каждой, без повторного поиска атрибутов) """
+        moments, senders, acceptors, intern = self._moments, self._senders, self._acceptors, self._intern
+        content, content_offsets = self._content, self._content_offsets
+        signature, signature_offsets = self._signature, self._signature_offsets
+        to_epoch_us = chronos.moment_to_epoch_us
+        for tx in txs:
+            moments.append(to_epoch_us(tx.moment))
+            senders.append(intern(tx.sender))
+            acceptors.append(intern(tx.acceptor))
+            content += tx.content.encode()
+            content_offsets.append(len(content))
+            signature += tx.signature.encode()
+            signature_offsets.append(len(signature))
+
+    def view(self, idx: int) -> txm.TxMessage:
+        """ Транзакция с указанным индексом, собранная из колонок """
+        return txm.TxMessage.from_fields(chronos.epoch_us_to_moment(self._moments[idx]),
+                                         self._parties[self._senders[idx]],
+                                         self._parties[self._acceptors[idx]],
+                                         self.content_of(idx).decode(),
+                                         self._signature[self._signature_offsets[idx]:
+                                                         self._signature_offsets[idx + 1]].decode())
+
+    def records(self) -> list[list]:
+        """ Компактные представления всех транзакций (см. TxMessage.as_record), без создания объектов TxMessage """
+        parties, content, signature = self._parties, self._content, self._signature
+        co, so = self._content_offsets, self._signature_offsets
+        return [[self._moments[idx], parties[self._senders[idx]], parties[self._acceptors[idx]],
+                 content[co[idx]:co[idx + 1]].decode(), signature[so[idx]:so[idx + 1]].decode()]
+                for idx in range(len(self))]
+
+    def dicts(self) -> list[dict]:
+        """ Словарные представления всех транзакций (см. TxMessage.as_dict), без создания объектов TxMessage;
+        строковое представление даты/времени вычисляется один раз для одинаковых моментов """
+        parties, content, signature = self._parties, self._content, self._signature
+        co, so = self._content_offsets, self._signature_offsets
+        moments: dict[int, str] = {}
+        result = []
+        for idx in range(len(self)):
+            moment_us = self._moments[idx]
+            moment_str = moments.get(moment_us)
+            if moment_str is None:
+                moment_str = moments[moment_us] = chronos.moment_to_str(chronos.epoch_us_to_moment(moment_us))
+            result.append({
+                'moment': moment_str,
+                'sender': parties[self._senders[idx]],
+                'acceptor': parties[self._acceptors[idx]],
+                'content': content[co[idx]:co[idx + 1]].decode(),
+                'signature': signature[so[idx]:so[idx + 1]].decode()
+            })
+        return result
+
+    def content_of(self, idx: int) -> bytes:
+        """ Содержимое транзакции с указанным индексом (в кодировке UTF-8) """
+        return bytes(self._content[self._content_offsets[idx]:self._content_offsets[idx + 1]])
+
+    def moment_us_of(self, idx: int) -> int:
+        """ Дата/время транзакции с указанным индексом (микросекунды с начала отсчета) """
+        return self._moments[idx]
+
+    def positions_of_party(self, party: str) -> list[int]:
+        """ Индексы транзакций, в которых участник выступает отправителем или получателем (по возрастанию) """
+        pid = self._party_ids.get(party)
+        if pid is None:
+            return []
+        return sorted(set(_positions(self._senders, pid)) | set(_positions(self._acceptors, pid)))
+
+    @property
+    def moments(self) -> array:
+        """ Колонка даты/времени (микросекунды с начала отсчета); ⚠️ не изменять """
+        return self._moments
+
+    @property
+    def senders(self) -> array:
+        """ Колонка отправителей (идентификаторы в таблице участников); ⚠️ не изменять """
+        return self._senders
+
+    @property
+    def acceptors(self) -> array:
+        """ Колонка получателей (идентификаторы в таблице участников); ⚠️ не изменять """
+        return self._acceptors
+
+    @property
+    def parties(self) -> list[str]:
+        """ Таблица участников (индекс в списке — идентификатор); ⚠️ не изменять """
+        return self._parties
+
+
+def _positions(column: array, value: int) -> list[int]:
+    """ Индексы всех вхождений значения в колонку (поиск очередного вхождения выполняется средствами array) """
+    result = []
+    pos = -1
+    try:
+        while True:
+            pos = column.index(value, pos + 1)
+            result.append(pos)
+    except ValueError:
+        return result
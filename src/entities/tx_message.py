@@ -1,6 +1,6 @@
 from src.frontier import chronos
+from src.frontier import cryptographer
 from src.frontier import jsonifier
-from src.frontier import sysutils
 
 # region Константы
 SENDER_UNDEFINED: str = 'undefined'
@@ -18,51 +18,132 @@ NO_SIGNATURE: str = EMPTY_STR
 class TxMessage:
     """ Отдельная транзакция: сообщение """
 
+    __slots__ = ('_moment', '_sender', '_acceptor', '_content', '_signature', '_stamp',
+                 '_dict_cache', '_json_cache', '_bytes_cache', '_hash_cache')
+
     def __init__(self):
         self._moment = chronos.this_moment()
-        self._moment_str: str = chronos.moment_to_str(self._moment)
         self._sender: str = SENDER_UNDEFINED
         self._acceptor: str = ACCEPTOR_UNDEFINED
         self._content: str = EMPTY_MESSAGE
         self._signature: str = NO_SIGNATURE
-        # todo Может потребоваться еще хэш транзакции
+        self._stamp: int = chronos.hlc_now()  # для упорядочивания, в представления (и хэш) не входит
+        # region Кэш представлений (сбрасывается при изменении полей, см. _invalidate)
+        self._dict_cache: dict | None = None
+        self._json_cache: str | None = None
+        self._bytes_cache: bytes | None = None
+        self._hash_cache: bytes | None = None
+        # endregion
+
+    @classmethod
+    def from_fields(cls, moment, sender: str, acceptor: str, content: str, signature: str,
+                    moment_str: str | None = None, stamp: int = chronos.NO_STAMP) -> 'TxMessage':
+        """ Создание сообщения из уже известных (и проверенных) значений полей, без обращения к часам (используется,
+        например, при чтении из хранилища). Если передано уже отформатированное moment_str (например, одно на целый
+        пакет сообщений), словарное представление собирается сразу с ним, без повторного форматирования; stamp —
+        метка гибридных логических часов (см. chronos.HybridLogicalClock). Дата/время moment переводится в UTC (без
+        часового пояса — не принимается) """
+        msg = cls.__new__(cls)
+        msg._moment = chronos.moment_to_utc(moment)
+        msg._sender = sender
+        msg._acceptor = acceptor
+        msg._content = content
+        msg._signature = signature
+        msg._stamp = stamp
+        msg._invalidate()
+        if moment_str is not None:
+            msg._dict_cache = {
+                'moment': moment_str,
+                'sender': sender,
+                'acceptor': acceptor,
+                'content': content,
+                'signature': signature
+            }
+        return msg
+
+    @classmethod
+    def from_dict(cls, source: dict) -> 'TxMessage':
+        """ Восстановление сообщения из словарного представления (см. as_dict). Строка даты/времени берется в
+        представления как есть, только если она совпадает с той, что строится по разобранному моменту; иначе
+        (например, '...05.5' вместо '...05.500000') представления строятся заново, чтобы хэш зависел только от полей """
+        moment = chronos.str_to_moment(source['moment'])
+        moment_str = source['moment'] if source['moment'] == chronos.moment_to_str(moment) else None
+        return cls.from_fields(moment, source['sender'], source['acceptor'], source['content'], source['signature'],
+                               moment_str)
+
+    @classmethod
+    def from_record(cls, source) -> 'TxMessage':
+        """ Восстановление сообщения из компактного представления (см. as_record) """
+        moment_us, sender, acceptor, content, signature = source
+        return cls.from_fields(chronos.epoch_us_to_moment(moment_us), sender, acceptor, content, signature)
 
     def __repr__(self):
-        # todo Если появится хэш транзакции, то здесь его тоже надо будет отразить
         descr = (f'The "Message" type transaction (instance '
-                 f'of {__class__.__name__})\ncreated at {self._moment_str}')
+                 f'of {__class__.__name__})\ncreated at {self.moment_str}')
         cnt = f'content: {self._content}' if self._content else f'the content is not presented (empty)'
+        hsh = f'hash: {self.hash()}'
         result = (f'{descr}:'
-                  f'\n ▪️ {cnt}.\n')
+                  f'\n ▪️ {cnt};'
+                  f'\n ▪️ {hsh}.\n')
         return result
 
+    def _invalidate(self) -> None:
+        """ Сброс кэша представлений (вызывается при изменении любого поля, влияющего на хэш) """
+        self._dict_cache = None
+        self._json_cache = None
+        self._bytes_cache = None
+        self._hash_cache = None
+
     def fully_initialized(self) -> bool:                                                                                # noqa
         """ Признак того, чтоб объект полностью инициализирован """
         # todo Возможно, в будущем появится необходимость каким-либо образом дифференцировать
         return True
 
     def as_dict(self) -> dict:
-        """ Преобразование внутренних данных в словарь """
-        result = {
-            'moment': self.moment_str,
-            'sender': self.sender,
-            'acceptor': self.acceptor,
-            'content': self.content,
-            'signature': self.signature
-            # todo Если потребуется хэш транзакции, сюда его тоже надо будет добавить
-        }
-        return result
+        """ Преобразование внутренних данных в словарь (кэшируется; ⚠️ возвращаемый словарь не изменять) """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'moment': self.moment_str,
+                'sender': self.sender,
+                'acceptor': self.acceptor,
+                'content': self.content,
+                'signature': self.signature
+            }
+        return self._dict_cache
+
+    def as_record(self) -> list:
+        """ Компактное представление (для двоичных форматов): дата/время в микросекундах с начала отсчета и остальные
+        поля по порядку """
+        return [chronos.moment_to_epoch_us(self._moment), self._sender, self._acceptor, self._content, self._signature]
 
     def as_json(self) -> str:
-        """ Преобразование внутренних данных в JSON-строку """
-        return jsonifier.dict_to_json_str(self.as_dict())
+        """ Преобразование внутренних данных в JSON-строку (кэшируется) """
+        if self._json_cache is None:
+            self._json_cache = jsonifier.dict_to_json_str(self.as_dict())
+        return self._json_cache
+
+    def as_bytes(self) -> bytes:
+        """ Байтовое представление (JSON-строка в кодировке UTF-8, кэшируется) """
+        if self._bytes_cache is None:
+            self._bytes_cache = self.as_json().encode()
+        return self._bytes_cache
+
+    def hash_bytes(self) -> bytes:
+        """ Хэш транзакции (SHA-256 от байтового представления) в виде «сырых» байтов (кэшируется) """
+        if self._hash_cache is None:
+            self._hash_cache = cryptographer.sha256(self.as_bytes())
+        return self._hash_cache
+
+    def hash(self) -> str:
+        """ Хэш транзакции в виде строки из шестнадцатеричных символов """
+        return self.hash_bytes().hex()
 
     def size_in_bytes(self) -> int:
-        """ Размер внутренних данных (в виде словаря) в байтах """
-        return sysutils.dict_size_in_bytes(self.as_dict())
+        """ Размер байтового представления (as_bytes) в байтах """
+        return len(self.as_bytes())
 
     def size_in_bytes_str(self) -> str:
-        """ Строковое представление размера внутренних данных (в виде словаря) в байтах """
+        """ Строковое представление размера байтового представления в байтах """
         return str(self.size_in_bytes())
 
     def number_of_members(self) -> int:
@@ -73,6 +154,12 @@ class TxMessage:
         """ Строковое представление количества элементов в словаре """
         return str(self.number_of_members())
 
+    @property
+    def stamp(self) -> int:
+        """ Метка гибридных логических часов (для упорядочивания; NO_STAMP, если сообщение восстановлено из
+        представления) """
+        return self._stamp
+
     @property
     def moment(self):
         """ Дата/время """
@@ -82,8 +169,8 @@ class TxMessage:
 
     @property
     def moment_str(self) -> str:
-        """ Текстовое представление даты/времени """
-        return self._moment_str
+        """ Текстовое представление даты/времени (формируется по запросу) """
+        return chronos.moment_to_str(self._moment)
 
     @property
     def sender(self) -> str:
@@ -91,9 +178,9 @@ class TxMessage:
 
     @sender.setter
     def sender(self, value: str) -> None:
-        # todo Если появится хэш транзакции, то установка этого поля должна менять хэш
         if isinstance(value, str) and value:
             self._sender = value
+            self._invalidate()
 
     @property
     def acceptor(self) -> str:
@@ -101,9 +188,9 @@ class TxMessage:
 
     @acceptor.setter
     def acceptor(self, value: str) -> None:
-        # todo Если появится хэш транзакции, то установка этого поля должна менять хэш
         if isinstance(value, str) and value:
             self._acceptor = value
+            self._invalidate()
 
     @property
     def content(self) -> str:
@@ -111,18 +198,15 @@ class TxMessage:
 
     @content.setter
     def content(self, value: str):
-        # todo Если появится хэш транзакции, то установка этого поля должна менять хэш
         if isinstance(value, str) and value:
             self._content = value
+            self._invalidate()
 
     @property
     def signature(self) -> str:
         return self._signature
 
     # По идее установить "произвольную" сигнатуру должно быть нельзя: нужно определить метод "подписания" транзакции
-    # todo Если появится хэш транзакции, то подписание должно использовать хэш
+    # todo Подписание должно использовать хэш (и сбрасывать кэш представлений через _invalidate)
     # todo Определить метод подписания транзакции
 
-
-msg = TxMessage()
-print(msg)
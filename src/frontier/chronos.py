@@ -1,6 +1,51 @@
 import datetime
+import threading
+import time
 from datetime import datetime as dt
+from datetime import timedelta
 from src.ground import cnst
+from src.ground import errs
+
+
+EPOCH = dt.strptime(cnst.DATETIME_BEGINNING, cnst.DATETIME_FORMAT).replace(tzinfo=datetime.UTC)
+""" Начало отсчета (01.01.2024 00:00:00.0 UTC), разбирается один раз при импорте модуля """
+
+MICROSECONDS_IN_SECOND: int = 1_000_000
+""" Количество микросекунд в секунде """
+
+SECONDS_IN_DAY: int = 86_400
+""" Количество секунд в сутках """
+
+NANOSECONDS_IN_MICROSECOND: int = 1_000
+""" Количество наносекунд в микросекунде """
+
+EPOCH_UNIX_US: int = int(EPOCH.timestamp()) * MICROSECONDS_IN_SECOND
+""" Начало отсчета в микросекундах от начала эпохи Unix """
+
+NANOSECONDS_IN_MILLISECOND: int = 1_000_000
+""" Количество наносекунд в миллисекунде """
+
+MICROSECONDS_IN_MILLISECOND: int = 1_000
+""" Количество микросекунд в миллисекунде """
+
+EPOCH_UNIX_MS: int = EPOCH_UNIX_US // MICROSECONDS_IN_MILLISECOND
+""" Начало отсчета в миллисекундах от начала эпохи Unix """
+
+HLC_LOGICAL_BITS: int = 16
+""" Количество младших бит гибридной логической метки, отведенных под логический счетчик """
+
+HLC_LOGICAL_MASK: int = (1 << HLC_LOGICAL_BITS) - 1
+""" Маска логического счетчика гибридной логической метки """
+
+HLC_MAX_DRIFT_MS: int = 60_000
+""" Насколько (в миллисекундах) физическая часть полученной извне метки может опережать локальные часы """
+
+NO_STAMP: int = 0
+""" Отсутствующая гибридная логическая метка (например, у объекта, прочитанного из хранилища) """
+
+MOMENT_STR_LENGTH: int = 26
+""" Длина строки даты/времени в формате DATETIME_FORMAT (с шестью знаками микросекунд), которую moment_to_str
+возвращает для любого момента """
 
 
 def this_moment():
@@ -8,6 +53,128 @@ def this_moment():
     return dt.now(datetime.UTC)
 
 
+def now_epoch_us() -> int:
+    """ Возвращает текущее время в виде целого числа микросекунд, прошедших с начала отсчета (EPOCH), без создания
+    объекта datetime """
+    return time.time_ns() // NANOSECONDS_IN_MICROSECOND - EPOCH_UNIX_US
+
+
+def moment_to_utc(moment):
+    """ Возвращает дату/время в часовом поясе UTC (объект datetime без часового пояса не принимается: представления
+    и хэши сообщений строятся по времени UTC) """
+    if moment.tzinfo is datetime.UTC:
+        return moment
+    if moment.utcoffset() is None:
+        raise ValueError(errs.MOMENT_WITHOUT_TIMEZONE)
+    return moment.astimezone(datetime.UTC)
+
+
 def moment_to_str(moment):
     """ Возвращает дату/время в виде строки в формате, определяемом в константе DATETIME_FORMAT """
     return moment.strftime(cnst.DATETIME_FORMAT)
+
+
+def str_to_moment(value: str):
+    """ Возвращает объект datetime (UTC) по строке в формате DATETIME_FORMAT. Строки, которые возвращает moment_to_str
+    (поля фиксированной ширины на своих местах), разбираются срезами, без strptime; остальные (например, с
+    сокращенной дробной частью секунд) — через strptime, который и отвергает некорректные строки (ValueError) """
+    if (len(value) == MOMENT_STR_LENGTH and value[2] == value[5] == value[19] == '.' and value[10] == ' '
+            and value[13] == value[16] == ':'):
+        digits = value[0:2] + value[3:5] + value[6:10] + value[11:13] + value[14:16] + value[17:19] + value[20:26]
+        if digits.isascii() and digits.isdigit():
+            return dt(int(value[6:10]), int(value[3:5]), int(value[0:2]),
+                      int(value[11:13]), int(value[14:16]), int(value[17:19]), int(value[20:26]), tzinfo=datetime.UTC)
+    return dt.strptime(value, cnst.DATETIME_FORMAT).replace(tzinfo=datetime.UTC)
+
+
+def moment_to_epoch_us(moment) -> int:
+    """ Возвращает дату/время в виде целого числа микросекунд, прошедших с начала отсчета (EPOCH) """
+    delta = moment - EPOCH
+    return (delta.days * SECONDS_IN_DAY + delta.seconds) * MICROSECONDS_IN_SECOND + delta.microseconds
+
+
+def epoch_us_to_moment(value: int):
+    """ Возвращает объект datetime (UTC) по количеству микросекунд, прошедших с начала отсчета (EPOCH) """
+    return EPOCH + timedelta(microseconds=value)
+
+
+def _physical() -> int:
+    """ Физическая часть новой метки гибридных логических часов: текущее время в миллисекундах с начала отсчета,
+    сдвинутое в старшие биты """
+    return (time.time_ns() // NANOSECONDS_IN_MILLISECOND - EPOCH_UNIX_MS) << HLC_LOGICAL_BITS
+
+
+class HybridLogicalClock:
+    """ Гибридные логические часы: метка — целое 64-битное число (миллисекунды с начала отсчета в старших битах,
+    логический счетчик в младших HLC_LOGICAL_BITS битах). Метки одних часов строго возрастают (даже если системные
+    часы «отстали») и уникальны; сравнение меток как чисел дает полный порядок событий, в том числе между потоками """
+
+    __slots__ = ('_last', '_lock')
+
+    def __init__(self) -> None:
+        self._last: int = NO_STAMP
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """ Репрезентация (человеко-понятное описание объекта) """
+        descr = f'The hybrid logical clock (instance of {__class__.__name__})'
+        lst = f'last stamp: {self._last} ({hlc_physical_ms(self._last)} ms, logical {hlc_logical(self._last)})'
+        return f'{descr}:\n ▪️ {lst}.\n'
+
+    def now(self) -> int:
+        """ Новая метка (строго больше всех выданных ранее) """
+        physical = _physical()
+        with self._lock:
+            stamp = self._last = physical if physical > self._last else self._last + 1
+        return stamp
+
+    def reserve(self, count: int) -> int:
+        """ Первая из count (не меньше одной) последовательных новых меток (метки пакета выдаются за одно обращение
+        к часам) """
+        if not isinstance(count, int) or count < 1:
+            raise ValueError(errs.HLC_COUNT_VALUE_ERROR)
+        physical = _physical()
+        with self._lock:
+            first = physical if physical > self._last else self._last + 1
+            self._last = first + count - 1
+        return first
+
+    def update(self, remote: int) -> int:
+        """ Новая метка с учетом полученной извне (например, из сообщения другого узла): больше и ее, и всех
+        выданных ранее. Метка, опережающая локальные часы больше чем на HLC_MAX_DRIFT_MS, не принимается (иначе
+        одна ошибочная метка навсегда «увела» бы часы вперед) """
+        physical = _physical()
+        if hlc_physical_ms(remote) - hlc_physical_ms(physical) > HLC_MAX_DRIFT_MS:
+            raise ValueError(errs.HLC_REMOTE_DRIFT_ERROR)
+        with self._lock:
+            stamp = self._last = max(physical, self._last + 1, remote + 1)
+        return stamp
+
+    @property
+    def last(self) -> int:
+        """ Последняя выданная метка """
+        return self._last
+
+
+CLOCK = HybridLogicalClock()
+""" Гибридные логические часы процесса (общие для всех потоков) """
+
+
+def hlc_now() -> int:
+    """ Новая метка гибридных логических часов процесса """
+    return CLOCK.now()
+
+
+def hlc_physical_ms(stamp: int) -> int:
+    """ Физическая часть метки: миллисекунды с начала отсчета (EPOCH) """
+    return stamp >> HLC_LOGICAL_BITS
+
+
+def hlc_logical(stamp: int) -> int:
+    """ Логическая часть метки (счетчик событий в пределах одной миллисекунды) """
+    return stamp & HLC_LOGICAL_MASK
+
+
+def hlc_to_moment(stamp: int):
+    """ Физическая часть метки в виде объекта datetime (UTC) """
+    return epoch_us_to_moment(hlc_physical_ms(stamp) * MICROSECONDS_IN_MILLISECOND)
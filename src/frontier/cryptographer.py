@@ -0,0 +1,39 @@
+""" Криптографические примитивы (хэширование и проверка сложности майнинга) """
+
+import hashlib
+
+from src.ground import cnst
+
+
+def sha256(data: bytes) -> bytes:
+    """ Возвращает хэш SHA-256 полученных данных (в виде «сырых» байтов) """
+    return hashlib.sha256(data).digest()
+
+
+def sha256_hex(data: bytes) -> str:
+    """ Возвращает хэш SHA-256 полученных данных (в виде строки из шестнадцатеричных символов) """
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_midstate(prefix: bytes):
+    """ Возвращает состояние SHA-256 после обработки неизменного префикса (чтобы не хэшировать его повторно) """
+    return hashlib.sha256(prefix)
+
+
+def sha256_from_midstate(midstate, tail: bytes) -> bytes:
+    """ Возвращает хэш SHA-256 (в виде «сырых» байтов) от префикса, уже обработанного в midstate, и «хвоста» tail
+    (сам midstate при этом не меняется) """
+    h = midstate.copy()
+    h.update(tail)
+    return h.digest()
+
+
+def difficulty_target(difficulty: int) -> int:
+    """ Возвращает границу для заданной сложности: хэш (как целое число) должен быть строго меньше этой границы,
+    чтобы начинаться не менее, чем с difficulty нулей в шестнадцатеричном представлении """
+    return 1 << (cnst.HASH_BIT_LENGTH - cnst.HEX_DIGIT_BIT_LENGTH * difficulty)
+
+
+def meets_difficulty(digest: bytes, difficulty: int) -> bool:
+    """ Признак того, что хэш (в виде «сырых» байтов) удовлетворяет заданной сложности майнинга """
+    return int.from_bytes(digest, 'big') < difficulty_target(difficulty)
@@ -1,7 +1,133 @@
+"""
+Сериализация представлений сущностей (см. as_dict / from_dict) с подключаемым форматом:
+ ▪️ JSON — текст (поток: по одному объекту в строке, NDJSON);
+ ▪️ MessagePack — двоичный формат (поток: объекты подряд), компактнее и быстрее JSON.
+
+Для двоичных форматов сущности предоставляют компактные представления (as_record / from_record: списки из чисел,
+строк и байтов вместо словарей со строковыми значениями) — см. Serializer.compact.
+
+Сериализаторы доступны по имени формата (см. serializer)
+"""
+
 import json
+from abc import ABC, abstractmethod
+
+import msgpack
+
+from src.ground import errs
+
+
+# region Константы
+NEWLINE: bytes = b'\n'
+""" Разделитель объектов в потоке JSON (NDJSON) """
+
+STREAM_READ_SIZE: int = 64 * 1024
+""" Размер порции, читаемой из потока при разборе MessagePack """
+# endregion
 
 
 def dict_to_json_str(source: dict) -> str:
     """ Возвращает полученный объект в виде строки JSON """
     # todo Реализовать проверки и перехват возможных исключений
     return json.dumps(source)
+
+
+def json_str_to_dict(source: str | bytes) -> dict:
+    """ Возвращает словарь, полученный разбором строки JSON """
+    return json.loads(source)
+
+
+class Serializer(ABC):
+    """ Формат сериализации (отдельных объектов и потоков объектов) """
+
+    name: str = ''
+    """ Имя формата """
+
+    compact: bool = False
+    """ Признак того, что формат предназначен для компактных представлений сущностей (as_record), а не словарных """
+
+    @abstractmethod
+    def dumps(self, source) -> bytes:
+        """ Байтовое представление объекта """
+        ...
+
+    @abstractmethod
+    def loads(self, data: bytes):
+        """ Объект, восстановленный из байтового представления """
+        ...
+
+    @abstractmethod
+    def pack_stream(self, objects, stream) -> int:
+        """ Запись объектов в поток (двоичный файл) по одному; возвращает количество записанных объектов """
+        ...
+
+    @abstractmethod
+    def unpack_stream(self, stream):
+        """ Генератор объектов, читаемых из потока (двоичного файла) по одному """
+        ...
+
+
+class JsonSerializer(Serializer):
+    """ JSON (в потоке — NDJSON: по одному объекту в строке) """
+
+    name = 'json'
+
+    def dumps(self, source) -> bytes:
+        return json.dumps(source, ensure_ascii=False, separators=(',', ':')).encode()
+
+    def loads(self, data: bytes):
+        return json.loads(data)
+
+    def pack_stream(self, objects, stream) -> int:
+        count = 0
+        for obj in objects:
+            stream.write(self.dumps(obj) + NEWLINE)
+            count += 1
+        return count
+
+    def unpack_stream(self, stream):
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+class MsgpackSerializer(Serializer):
+    """ MessagePack (в потоке — объекты подряд, без разделителей) """
+
+    name = 'msgpack'
+    compact = True
+
+    def dumps(self, source) -> bytes:
+        return msgpack.packb(source, use_bin_type=True)
+
+    def loads(self, data: bytes):
+        return msgpack.unpackb(data, raw=False)
+
+    def pack_stream(self, objects, stream) -> int:
+        packer = msgpack.Packer(use_bin_type=True)
+        count = 0
+        for obj in objects:
+            stream.write(packer.pack(obj))
+            count += 1
+        return count
+
+    def unpack_stream(self, stream):
+        yield from msgpack.Unpacker(stream, raw=False, read_size=STREAM_READ_SIZE)
+
+
+JSON: Serializer = JsonSerializer()
+""" Сериализатор JSON """
+
+MSGPACK: Serializer = MsgpackSerializer()
+""" Сериализатор MessagePack """
+
+SERIALIZERS: dict[str, Serializer] = {s.name: s for s in (JSON, MSGPACK)}
+""" Сериализаторы по именам форматов """
+
+
+def serializer(name: str) -> Serializer:
+    """ Сериализатор формата с указанным именем ('json' или 'msgpack') """
+    try:
+        return SERIALIZERS[name]
+    except KeyError:
+        raise ValueError(errs.SERIALIZER_UNKNOWN) from None
@@ -1,9 +1,17 @@
 """ Операции с отдельными битами и битовыми строками """
 
-import array
 from src.ground import errs
 
 
+# region Константы
+BITS_IN_BYTE: int = 8
+""" Количество битов в байте """
+
+BITS_TABLE: tuple[str, ...] = tuple(format(value, '08b') for value in range(256))
+""" Битовые строки (с ведущими нулями) для каждого из 256 значений байта """
+# endregion
+
+
 def byte_bits_to_int(byte_bits: str):
     if len(byte_bits) <= 8:                                    # отбрасываем, что не поместится в беззнаковый байт
         i = int(byte_bits, 2)                                  # преобразуем в целое (основание = 2)
@@ -20,11 +28,115 @@ def get_bit(value: int, pos: int) -> str:
 def byte_as_bits_str(value: int) -> str:
     """ Получить битовую строку длинной в один байт (с ведущими нулями) """
     if 0 <= value <= 255:                                      # отбрасываем, что не поместится в беззнаковый байт
-        result = 'XXXXXXXX'                                    # резервируем шаблон длиной 8 символов
-        for pos in range(8):                                   # для всех значений от 0 до 7:
-            bit = get_bit(value, pos)                          # - получаем бит
-            np = 7 - pos                                       # - инвертируем позицию
-            result = result[:np] + bit + result[np + 1:]       # - записываем в инвертированную позицию в шаблоне
-        return result
+        return BITS_TABLE[value]
     else:
         raise ValueError(errs.BITS_NOT_BYTE)
+
+
+def bytes_as_bits_str(data, sep: str = '') -> str:
+    """ Получить битовую строку для буфера (bytes, bytearray, memoryview): по 8 символов на байт, байты разделяются
+    строкой sep """
+    return sep.join(map(BITS_TABLE.__getitem__, memoryview(data).cast('B')))
+
+
+class BitLayout:
+    """ Раскладка битовых полей: ширины полей (в битах) от старших битов к младшим, например, (2, 3, 3) — два бита,
+    затем три и еще три. Суммарная ширина должна быть кратна байту. Для однобайтовых раскладок распаковка выполняется
+    по таблице на 256 значений """
+
+    __slots__ = ('_widths', '_shifts', '_masks', '_size', '_table')
+
+    def __init__(self, widths: tuple[int, ...]) -> None:
+        if not widths or not all(isinstance(w, int) and w > 0 for w in widths):
+            raise ValueError(errs.BITS_LAYOUT_WIDTH_ERROR)
+        total = sum(widths)
+        if total % BITS_IN_BYTE:
+            raise ValueError(errs.BITS_LAYOUT_NOT_ALIGNED)
+        self._widths: tuple[int, ...] = tuple(widths)
+        self._masks: tuple[int, ...] = tuple((1 << w) - 1 for w in widths)
+        shifts, shift = [], total
+        for w in widths:
+            shift -= w
+            shifts.append(shift)
+        self._shifts: tuple[int, ...] = tuple(shifts)
+        self._size: int = total // BITS_IN_BYTE
+        self._table: tuple[tuple[int, ...], ...] | None = None
+        if self._size == 1:
+            self._table = tuple(self._split(value) for value in range(256))
+
+    def __repr__(self) -> str:
+        """ Репрезентация (человеко-понятное описание объекта) """
+        descr = f'The bit layout (instance of {__class__.__name__})'
+        wdt = f'field widths: {self._widths}'
+        sze = f'size in bytes: {self._size}'
+        return f'{descr}:\n ▪️ {wdt};\n ▪️ {sze}.\n'
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BitLayout):
+            return NotImplemented
+        return self._widths == other._widths
+
+    def __hash__(self) -> int:
+        return hash(self._widths)
+
+    def _split(self, value: int) -> tuple[int, ...]:
+        """ Значения полей, выделенные из целого сдвигами и масками """
+        return tuple(value >> shift & mask for shift, mask in zip(self._shifts, self._masks))
+
+    def fits(self, index: int, value: int) -> bool:
+        """ Признак того, что значение помещается в поле с номером index """
+        return isinstance(value, int) and 0 <= value <= self._masks[index]
+
+    def pack(self, *values: int) -> int:
+        """ Упаковка значений полей (в порядке раскладки) в одно целое """
+        if len(values) != len(self._widths):
+            raise ValueError(errs.BITS_LAYOUT_FIELDS_COUNT)
+        result = 0
+        for value, shift, mask in zip(values, self._shifts, self._masks):
+            if not isinstance(value, int) or not 0 <= value <= mask:
+                raise ValueError(errs.BITS_FIELD_OUT_OF_RANGE)
+            result |= value << shift
+        return result
+
+    def unpack(self, value: int) -> tuple[int, ...]:
+        """ Значения полей (в порядке раскладки), упакованных в целое """
+        if not 0 <= value < 1 << self._size * BITS_IN_BYTE:
+            raise ValueError(errs.BITS_FIELD_OUT_OF_RANGE)
+        return self._split(value) if self._table is None else self._table[value]
+
+    def to_bytes(self, *values: int) -> bytes:
+        """ Двоичное представление (size байт, старшие байты вперед) упакованных значений полей """
+        return self.pack(*values).to_bytes(self._size, 'big')
+
+    def from_bytes(self, data, offset: int = 0) -> tuple[int, ...]:
+        """ Значения полей, упакованных в буфере начиная с offset """
+        view = memoryview(data).cast('B')
+        if not 0 <= offset <= len(view) - self._size:
+            raise ValueError(errs.BITS_BUFFER_TOO_SHORT)
+        if self._table is not None:
+            return self._table[view[offset]]
+        return self._split(int.from_bytes(view[offset:offset + self._size], 'big'))
+
+    def unpack_many(self, data) -> list[tuple[int, ...]]:
+        """ Значения полей для каждой записи буфера, состоящего из записей по size байт подряд (без остатка) """
+        view = memoryview(data).cast('B')
+        if len(view) % self._size:
+            raise ValueError(errs.BITS_BUFFER_TOO_SHORT)
+        if self._table is not None:
+            return list(map(self._table.__getitem__, view))
+        return [self._split(int.from_bytes(view[pos:pos + self._size], 'big'))
+                for pos in range(0, len(view), self._size)]
+
+    def as_bits_str(self, value: int, sep: str = ' ') -> str:
+        """ Битовая строка упакованного значения, в которой поля разделены строкой sep (для отладки) """
+        return sep.join(format(field, f'0{width}b') for field, width in zip(self.unpack(value), self._widths))
+
+    @property
+    def widths(self) -> tuple[int, ...]:
+        """ Ширины полей (в битах) """
+        return self._widths
+
+    @property
+    def size(self) -> int:
+        """ Размер упакованного значения в байтах """
+        return self._size
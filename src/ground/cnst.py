@@ -8,7 +8,13 @@ GENESIS_HEIGHT: int = 0
 HASH_BIT_LENGTH: int = 256
 """ Длина используемых хэшей (в битах) """
 
-HASH_STR_LENGTH: int = int(HASH_BIT_LENGTH / 8)
+HEX_DIGIT_BIT_LENGTH: int = 4
+""" Количество бит, кодируемых одним шестнадцатеричным символом """
+
+HASH_BYTE_LENGTH: int = HASH_BIT_LENGTH // 8
+""" Длина хэшей в байтах """
+
+HASH_STR_LENGTH: int = HASH_BIT_LENGTH // HEX_DIGIT_BIT_LENGTH
 """ Длина хэшей в строковом (шестнадцатеричном) представлении """
 
 ZERO: str = '0'
@@ -32,4 +38,10 @@ MOSCOW_TIMEZONE: str = 'Europe/Moscow'
 
 MINIMAL_DIFFICULTY: int = 1
 """ Минимальная сложность """
+
+MAXIMAL_DIFFICULTY: int = HASH_STR_LENGTH
+""" Максимальная сложность (все символы хэша — нули) """
+
+MAX_BLOCK_SIZE: int = 1024 * 1024
+""" Максимальный размер блока в двоичном представлении (в байтах) """
 # endregion
@@ -3,6 +3,30 @@
 BITS_NOT_BYTE = 'The resulting value goes beyond the byte'
 """ Сообщение об ошибке при попытке получить битовое представление длинной в байт для значения, превышающего байт """
 
+MOMENT_WITHOUT_TIMEZONE = 'The date/time must have a timezone (it is converted to UTC)'
+""" Сообщение об ошибке при передаче объекта datetime без часового пояса (его нельзя однозначно перевести в UTC) """
+
+HLC_COUNT_VALUE_ERROR = 'The number of reserved clock stamps must be a positive integer'
+""" Сообщение об ошибке при попытке зарезервировать меньше одной метки гибридных логических часов """
+
+HLC_REMOTE_DRIFT_ERROR = 'The remote clock stamp is too far ahead of the local clock'
+""" Сообщение об ошибке при получении метки, опережающей локальные часы больше допустимого (см. HLC_MAX_DRIFT_MS) """
+
+BITS_LAYOUT_WIDTH_ERROR = 'The bit layout must consist of positive integer field widths'
+""" Сообщение об ошибке при создании раскладки битовых полей с пустым списком или некорректными ширинами полей """
+
+BITS_LAYOUT_NOT_ALIGNED = 'The total width of the bit layout must be a multiple of 8 bits'
+""" Сообщение об ошибке при создании раскладки битовых полей, суммарная ширина которой не кратна байту """
+
+BITS_LAYOUT_FIELDS_COUNT = 'The number of values does not match the number of fields in the bit layout'
+""" Сообщение об ошибке при упаковке количества значений, отличного от количества полей раскладки """
+
+BITS_FIELD_OUT_OF_RANGE = 'The value does not fit into the bit field'
+""" Сообщение об ошибке при упаковке (распаковке) значения, не помещающегося в битовое поле (раскладку) """
+
+BITS_BUFFER_TOO_SHORT = 'The buffer is too short for the bit layout'
+""" Сообщение об ошибке при распаковке из буфера, в котором не хватает байтов до целой записи раскладки """
+
 PVF_MAJOR_VALUE_ERROR = ('Incorrect "major" value for the full version of the protocol '
                          '(a value between 0 and 255 is expected)')
 """ Сообщение об ошибке входного значения при попытке установить «мажор» для полной версии протокола """
@@ -19,4 +43,68 @@ PVF_BYTE_ARRAY_HAS_INCORRECT_LENGTH = 'Incorrect length of bytearray (exactly 2
 """ Сообщение об ошибке входного значения при попытке установить версию через массив байтов 
 (требуется ровно 2 байта) """
 
+MINER_WORKERS_VALUE_ERROR = 'Incorrect number of mining workers (a positive integer is expected)'
+""" Сообщение об ошибке при попытке создать движок майнинга с некорректным количеством процессов """
+
+VALIDATOR_WORKERS_VALUE_ERROR = 'Incorrect number of validation workers (a positive integer is expected)'
+""" Сообщение об ошибке при попытке создать движок проверки цепочки с некорректным количеством процессов """
+
+MINER_NONCE_RANGE_ERROR = 'Incorrect nonce range for mining (0 <= first <= last <= MAX_NONCE is expected)'
+""" Сообщение об ошибке при попытке майнинга в некорректном диапазоне nonce """
+
+HASH_STR_INCORRECT = 'Incorrect hash string (exactly 64 hexadecimal characters are expected)'
+""" Сообщение об ошибке при попытке преобразовать в байты некорректную строку хэша """
+
+HEADER_BUFFER_TOO_SHORT = 'The buffer is too short to contain a block header'
+""" Сообщение об ошибке при попытке прочитать заголовок блока из слишком короткого буфера """
+
+MERKLE_LEAF_INDEX_ERROR = 'Incorrect leaf index for the Merkle tree'
+""" Сообщение об ошибке при попытке получить доказательство включения для несуществующего листа """
+
+TX_NOT_IN_BLOCK = 'The transaction is not included in the block'
+""" Сообщение об ошибке при попытке получить доказательство включения для транзакции, отсутствующей в блоке """
+
+TX_ALREADY_IN_BLOCK = 'The transaction is already included in the block'
+""" Сообщение об ошибке при попытке повторно добавить в блок транзакцию с тем же хэшем """
+
+BLOCK_BUFFER_CORRUPTED = 'The buffer does not contain a correctly encoded block'
+""" Сообщение об ошибке при попытке прочитать блок из поврежденного (или обрезанного) буфера """
+
+BLOCK_NOT_IN_STORE = 'There is no block with such height in the store'
+""" Сообщение об ошибке при попытке прочитать из хранилища блок, которого там нет """
+
+BLOCK_HEIGHT_OUT_OF_ORDER = 'The height of the appended block must be equal to the number of blocks in the store'
+""" Сообщение об ошибке при попытке добавить в хранилище блок с неподходящей высотой """
+
+CHAIN_HEIGHT_MISMATCH = 'The block height does not match its position in the chain'
+""" Сообщение о нарушении непрерывности высот при проверке цепочки """
+
+CHAIN_PREV_HASH_MISMATCH = 'The previous block hash does not match the hash of the previous header'
+""" Сообщение о нарушении связи с предыдущим блоком при проверке цепочки """
+
+CHAIN_GENESIS_MISMATCH = 'The genesis flag is inconsistent with the block height'
+""" Сообщение о некорректном признаке генезис-блока при проверке цепочки """
+
+CHAIN_DIFFICULTY_NOT_MET = 'The header hash does not meet the header difficulty'
+""" Сообщение о невыполненном доказательстве работы при проверке цепочки """
+
+CHAIN_MERKLE_ROOT_MISMATCH = 'The Merkle root in the header does not match the block transactions'
+""" Сообщение о несовпадении корня дерева Меркла при проверке цепочки """
+
+CHAIN_BLOCK_CORRUPTED = 'The block cannot be decoded or contains repeated transactions'
+""" Сообщение о блоке, который не удалось разобрать (или в котором повторяются транзакции) при проверке цепочки """
+
+PARTY_INDEX_HEIGHT_OUT_OF_ORDER = 'The height of the indexed block must be equal to the number of indexed blocks'
+""" Сообщение об ошибке при попытке проиндексировать блок с неподходящей высотой """
+
+MEMPOOL_SIZE_VALUE_ERROR = 'Incorrect mempool size limit (a positive integer number of bytes is expected)'
+""" Сообщение об ошибке при попытке создать пул транзакций с некорректным ограничением размера """
+
+BLOCK_SIZE_LIMIT_TOO_SMALL = 'The block size limit is smaller than the size of an empty block'
+""" Сообщение об ошибке при попытке собрать блок с ограничением размера меньше размера пустого блока """
+
+CHAIN_CHECKPOINT_MISMATCH = 'The header hash does not match the checkpoint at this height'
+""" Сообщение о несовпадении хэша заголовка с контрольной точкой при проверке цепочки """
 
+SERIALIZER_UNKNOWN = 'Unknown serialization format (json or msgpack is expected)'
+""" Сообщение об ошибке при запросе сериализатора неизвестного формата """
@@ -0,0 +1,43 @@
+from pytest import fixture
+
+from src.entities import block
+from src.entities import tx_message
+
+
+def _message(height: int, i: int, moment) -> tx_message.TxMessage:
+    """ Сообщение номер i блока height: отправитель 'sender i', получатель — 'bank' (нечетные i) либо сам отправитель;
+    с фиксированным moment хэш сообщения (а значит, и фильтры Блума) не зависит от запуска """
+    sender = f'sender {i}'
+    acceptor = 'bank' if i % 2 else sender
+    content = f'content {height}/{i}'
+    if moment is not None:
+        return tx_message.TxMessage.from_fields(moment, sender, acceptor, content, tx_message.NO_SIGNATURE)
+    msg = tx_message.TxMessage()
+    msg.sender = sender
+    msg.acceptor = acceptor
+    msg.content = content
+    return msg
+
+
+def build_chain(count: int, txs: int = 2, moment=None, difficulty: int | None = None) -> list[block.Block]:
+    """ Цепочка из count связанных блоков по txs сообщений; если задана сложность difficulty, блоки майнятся """
+    blocks = []
+    for height in range(count):
+        b = block.Block(height == 0)
+        if height:
+            b.header.height = height
+            b.header.prev_hash = blocks[-1].header.hash()
+        for i in range(txs):
+            b.add_tx(_message(height, i, moment))
+        if difficulty is not None:
+            b.header.difficulty = difficulty
+            while not b.header.meets_difficulty():
+                b.header.nonce += 1
+        blocks.append(b)
+    return blocks
+
+
+@fixture
+def make_chain():
+    """ Фабрика цепочек блоков (см. build_chain) """
+    return build_chain
@@ -0,0 +1,48 @@
+from pytest import raises
+
+from src.engines import assembler
+from src.engines import mempool
+from src.entities import block
+from src.entities import block_wire
+from src.entities import tx_message
+from src.frontier import chronos
+
+
+def _pool(count: int) -> mempool.Mempool:
+    pool = mempool.Mempool()
+    moment = chronos.this_moment()
+    pool.add_many(tx_message.TxMessage.from_fields(moment, 'sender', 'acceptor', f'content {i:05d}', '')
+                  for i in range(count))
+    return pool
+
+
+def test_p_fills_up_to_limit():
+    pool = _pool(1000)
+    tx_size = pool.size_in_bytes // len(pool)
+    limit = block_wire.EMPTY_BLOCK_SIZE + 100 * tx_size + tx_size // 2
+    b = assembler.assemble(pool, max_bytes=limit)
+    assert len(b.content) == 100
+    assert b.size_in_bytes() == len(b.as_bytes()) <= limit
+    assert b.header.genesis
+    reference = block.Block(True)
+    for tx in b.content.txs:
+        reference.add_tx(tx)
+    assert b.header.merkle_root == reference.header.merkle_root
+    assert len(pool) == 1000
+
+
+def test_p_continues_tip():
+    pool = _pool(5)
+    genesis = assembler.assemble(pool, difficulty=1)
+    pool.remove_many(genesis.content.txs)
+    b = assembler.assemble(pool, tip=genesis.header)
+    assert len(b.content) == 0
+    assert b.header.height == 1
+    assert b.header.prev_hash == genesis.header.hash()
+    assert b.header.difficulty == 1
+    assert not b.header.genesis
+
+
+def test_n_limit_too_small():
+    with raises(ValueError):
+        assembler.assemble(_pool(1), max_bytes=block_wire.EMPTY_BLOCK_SIZE - 1)
@@ -0,0 +1,136 @@
+import datetime
+
+from pytest import raises
+
+from src.engines import block_index
+from src.engines import block_store
+from src.entities import block
+from src.entities import tx_message
+from src.frontier import cryptographer
+
+
+FIXED_MOMENT = datetime.datetime(2024, 6, 1, tzinfo=datetime.UTC)
+
+
+def test_p_append_and_read(tmp_path, make_chain):
+    blocks = make_chain(4)
+    with block_store.BlockStore(str(tmp_path), segment_max_size=300) as store:
+        for b in blocks:
+            store.append(b)
+        assert len(store) == 4
+        assert bytes(store.raw_at(2)) == blocks[2].as_bytes()
+        assert store.block_at(3).content.merkle_root == blocks[3].header.merkle_root
+        assert store.header_at(1).prev_hash == blocks[0].header.hash()
+    assert len(list(tmp_path.glob('blocks_*.dat'))) > 1
+
+
+def test_p_lookup_by_hash(tmp_path, make_chain):
+    blocks = make_chain(5)
+    with block_store.BlockStore(str(tmp_path)) as store:
+        for b in blocks:
+            store.append(b)
+        assert store.height_of(blocks[3].header.hash()) == 3
+        assert store.block_by_hash(blocks[4].header.hash()).header.height == 4
+        assert store.height_of('ab' * 32) is None
+
+
+def test_p_reopen_recovers_unindexed_tail(tmp_path, make_chain):
+    blocks = make_chain(3)
+    with block_store.BlockStore(str(tmp_path)) as store:
+        for b in blocks:
+            store.append(b)
+    with open(tmp_path / block_store.HEIGHT_INDEX_NAME, 'r+b') as f:
+        f.truncate(block_index.HEIGHT_RECORD_STRUCT.size)  # индекс «отстал» от сегментов
+    with open(tmp_path / block_store.SEGMENT_NAME_TEMPLATE.format(0), 'ab') as f:
+        f.write(b'\x00\x00\x10')                               # незавершенная запись
+    with block_store.BlockStore(str(tmp_path)) as store:
+        assert len(store) == 3
+        assert [b.header.hash() for b in store] == [b.header.hash() for b in blocks]
+        assert store.height_of(blocks[2].header.hash()) == 2
+
+
+def test_p_hash_index_grows(tmp_path):
+    index = block_index.HashIndex(str(tmp_path / 'h.idx'))
+    keys = [cryptographer.sha256(str(i).encode()) for i in range(3000)]
+    for height, key in enumerate(keys):
+        index.put(key, height)
+    index.close()
+    index = block_index.HashIndex(str(tmp_path / 'h.idx'))
+    assert len(index) == 3000
+    assert all(index.get(key) == height for height, key in enumerate(keys))
+    index.close()
+
+
+def test_n_hash_index_grow_interrupted(tmp_path, monkeypatch):
+    path = str(tmp_path / 'h.idx')
+    index = block_index.HashIndex(path)
+    keys = [cryptographer.sha256(str(i).encode()) for i in range(512)]
+    for height, key in enumerate(keys):
+        index.put(key, height)
+    index.sync()
+
+    def replace_and_crash(src, dst):                           # сбой сразу после подмены файла таблицы
+        replace(src, dst)
+        raise OSError
+    replace = block_index.os.replace
+    monkeypatch.setattr(block_index.os, 'replace', replace_and_crash)
+    with raises(OSError):
+        index.put(cryptographer.sha256(b'one more'), 512)
+    monkeypatch.undo()
+    index = block_index.HashIndex(path)
+    assert all(index.get(key) == height for height, key in enumerate(keys))
+    index.close()
+
+
+def test_n_read_missing_block(tmp_path):
+    with block_store.BlockStore(str(tmp_path)) as store:
+        with raises(IndexError):
+            store.block_at(0)
+
+
+def test_n_append_out_of_order(tmp_path, make_chain):
+    blocks = make_chain(2)
+    with block_store.BlockStore(str(tmp_path)) as store:
+        with raises(ValueError):
+            store.append(blocks[1])
+
+
+def test_p_bloom_scans(tmp_path, make_chain):
+    blocks = make_chain(20, moment=FIXED_MOMENT)
+    msg = tx_message.TxMessage.from_fields(FIXED_MOMENT, 'rare sender', tx_message.ACCEPTOR_UNDEFINED, 'rare content',
+                                           tx_message.NO_SIGNATURE)
+    rare = block.Block(False)
+    rare.header.height = 20
+    rare.header.prev_hash = blocks[-1].header.hash()
+    rare.add_tx(msg)
+    with block_store.BlockStore(str(tmp_path)) as store:
+        for b in blocks + [rare]:
+            store.append(b)
+        assert list(store.candidates(b'rare sender')) == [20]
+        found = list(store.messages_of('rare sender', first=10))
+        assert [(h, p) for h, p, _ in found] == [(20, 0)]
+        assert found[0][2].content == 'rare content'
+        assert store.find_tx(msg.hash()) == (20, 0)
+        assert store.find_tx(msg.hash(), last=20) is None
+        assert len(list(store.messages_of('sender 1', 5, 8))) == 3
+
+
+def test_p_bloom_index_recovered(tmp_path, make_chain):
+    blocks = make_chain(3)
+    with block_store.BlockStore(str(tmp_path)) as store:
+        for b in blocks:
+            store.append(b)
+    with open(tmp_path / block_store.HEIGHT_INDEX_NAME, 'r+b') as f:
+        f.truncate(block_index.HEIGHT_RECORD_STRUCT.size)
+    with block_store.BlockStore(str(tmp_path)) as store:
+        assert list(store.candidates(b'sender 0')) == [0, 1, 2]
+
+
+def test_n_extend_stops_at_height_gap(tmp_path, make_chain):
+    blocks = make_chain(4)
+    with block_store.BlockStore(str(tmp_path)) as store:
+        with raises(ValueError):
+            store.extend([blocks[0], blocks[1], blocks[3]])
+        assert len(store) == 2
+        assert store.extend(blocks[2:]) == 2
+        assert store.height_of(blocks[3].header.hash()) == 3
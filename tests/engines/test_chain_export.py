@@ -0,0 +1,39 @@
+import io
+import json
+
+from src.engines import block_store
+from src.engines import chain_export
+
+
+def test_p_export_import_resumable(tmp_path, make_chain):
+    blocks = make_chain(10)
+    with block_store.BlockStore(str(tmp_path / 'source')) as source:
+        source.extend(blocks)
+        stream = io.BytesIO()
+        assert chain_export.export_blocks(source, stream, last=4) == 4
+        assert chain_export.export_blocks(source, stream, first=4) == 10
+    assert len(stream.getvalue().splitlines()) == 10
+    with block_store.BlockStore(str(tmp_path / 'target')) as target:
+        target.extend(blocks[:3])
+        stream.seek(0)
+        assert chain_export.import_blocks(target, stream, batch_size=3) == 7
+        assert [b.header.hash() for b in target] == [b.header.hash() for b in blocks]
+        assert target.block_at(9).as_bytes() == blocks[9].as_bytes()
+
+
+def test_p_export_messages(tmp_path, make_chain):
+    with block_store.BlockStore(str(tmp_path)) as store:
+        store.extend(make_chain(3, txs=3))
+        stream = io.BytesIO()
+        assert chain_export.export_messages(store, stream, first=1) == 3
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(m['height'], m['position']) for m in lines] == [(h, p) for h in (1, 2) for p in range(3)]
+    assert lines[0]['content'] == 'content 1/0'
+
+
+def test_n_export_past_the_tip(tmp_path, make_chain):
+    with block_store.BlockStore(str(tmp_path)) as store:
+        store.extend(make_chain(2))
+        stream = io.BytesIO()
+        assert chain_export.export_blocks(store, stream, first=5) == 5
+    assert stream.getvalue() == b''
@@ -0,0 +1,154 @@
+from pytest import raises
+
+from src.engines import block_store
+from src.engines import chain_validator
+from src.engines import checkpoints
+from src.entities import block_wire
+from src.entities import merkle_tree
+from src.ground import errs
+
+
+def _validate(tmp_path, blocks, window=chain_validator.WINDOW_SIZE):
+    with block_store.BlockStore(str(tmp_path)) as store:
+        for b in blocks:
+            store.append(b)
+        with chain_validator.ChainValidator(workers=2) as validator:
+            return validator.validate(store, window)
+
+
+def _with_duplicated_tail(raw: bytes) -> bytes:
+    """ Двоичное представление блока с повторенной последней транзакцией (заголовок не меняется) """
+    last = bytes(list(block_wire.tx_slices(raw))[-1])
+    count = block_wire.COUNT_STRUCT.unpack_from(raw, block_wire.COUNT_OFFSET)[0]
+    return (raw[:block_wire.COUNT_OFFSET] + block_wire.COUNT_STRUCT.pack(count + 1) + raw[block_wire.TXS_OFFSET:]
+            + block_wire.LENGTH_STRUCT.pack(len(last)) + last)
+
+
+def _validate_forged(tmp_path, blocks, raw: bytes):
+    """ Проверка хранилища, в котором за блоками blocks записан блок в двоичном представлении raw (в обход BlockTxs) """
+    with block_store.BlockStore(str(tmp_path)) as store:
+        store.extend(blocks)
+    with open(tmp_path / block_store.SEGMENT_NAME_TEMPLATE.format(0), 'ab') as f:
+        f.write(block_store.RECORD_LENGTH_STRUCT.pack(len(raw)) + raw)
+    with block_store.BlockStore(str(tmp_path)) as store:
+        with chain_validator.ChainValidator(workers=1) as validator:
+            return validator.validate(store)
+
+
+def test_p_valid_chain(tmp_path, make_chain):
+    report = _validate(tmp_path, make_chain(7, difficulty=1), window=3)
+    assert report.valid
+    assert report.checked == 7
+
+
+def test_p_empty_store(tmp_path):
+    report = _validate(tmp_path, [])
+    assert report.valid
+    assert report.checked == 0
+
+
+def test_n_broken_link(tmp_path, make_chain):
+    blocks = make_chain(4, difficulty=1)
+    blocks[2].header.prev_hash = 'ab' * 32
+    while not blocks[2].header.meets_difficulty():
+        blocks[2].header.nonce += 1
+    report = _validate(tmp_path, blocks, window=2)
+    assert (2, errs.CHAIN_PREV_HASH_MISMATCH) in report.errors
+    assert (3, errs.CHAIN_PREV_HASH_MISMATCH) in report.errors
+
+
+def test_n_difficulty_and_merkle(tmp_path, make_chain):
+    blocks = make_chain(3, difficulty=1)
+    blocks[1].header.difficulty = 8
+    blocks[2].header.merkle_root = 'cd' * 32
+    report = _validate(tmp_path, blocks)
+    assert (1, errs.CHAIN_DIFFICULTY_NOT_MET) in report.errors
+    assert (2, errs.CHAIN_MERKLE_ROOT_MISMATCH) in report.errors
+    assert not report.valid
+
+
+def test_n_truncated_block(make_chain):
+    raw = block_wire.encode(make_chain(1, difficulty=1)[0])
+    assert chain_validator._check_block(raw) is not None
+    for size in (block_wire.HEADER_OFFSET + 2, block_wire.COUNT_OFFSET + 2, block_wire.TXS_OFFSET + 2):
+        assert chain_validator._check_block(raw[:size]) is None
+
+
+def test_n_duplicated_trailing_tx(tmp_path, make_chain):
+    blocks = make_chain(2, txs=3, difficulty=1)
+    with raises(ValueError):
+        blocks[1].add_tx(blocks[1].content.txs[-1])
+    report = _validate_forged(tmp_path, blocks[:1], _with_duplicated_tail(blocks[1].as_bytes()))
+    assert report.checked == 2
+    assert (1, errs.CHAIN_MERKLE_ROOT_MISMATCH) in report.errors
+    assert (1, errs.CHAIN_BLOCK_CORRUPTED) in report.errors
+
+
+def test_n_duplicated_tx_with_matching_root(tmp_path, make_chain):
+    blocks = make_chain(2, txs=1, difficulty=1)
+    leaf = blocks[1].content.txs[0].hash_bytes()
+    tree = merkle_tree.MerkleTree()
+    tree.extend([leaf, leaf])
+    blocks[1].header.merkle_root = tree.root()                 # заголовок согласован с повторенной транзакцией
+    while not blocks[1].header.meets_difficulty():
+        blocks[1].header.nonce += 1
+    report = _validate_forged(tmp_path, blocks[:1], _with_duplicated_tail(blocks[1].as_bytes()))
+    assert report.errors == [(1, errs.CHAIN_BLOCK_CORRUPTED)]
+
+
+def test_n_workers():
+    with raises(ValueError):
+        chain_validator.ChainValidator(workers=0)
+
+
+def test_p_checkpoints_skip_proof_of_work(tmp_path, make_chain):
+    blocks = make_chain(6, difficulty=1)
+    blocks[1].header.difficulty = 8                            # ниже контрольной точки сложность не проверяется
+    for height in range(2, 6):
+        blocks[height].header.prev_hash = blocks[height - 1].header.hash()
+        while not blocks[height].header.meets_difficulty():
+            blocks[height].header.nonce += 1
+    table = checkpoints.Checkpoints([(3, blocks[3].header.hash())])
+    with block_store.BlockStore(str(tmp_path)) as store:
+        for b in blocks:
+            store.append(b)
+        with chain_validator.ChainValidator(workers=1) as validator:
+            report = validator.validate(store, checkpoints=table)
+            assert report.valid
+            assert report.checked == 6
+            assert report.trusted == 4
+            assert not validator.validate(store).valid
+
+
+def test_n_checkpoint_mismatch(tmp_path, make_chain):
+    blocks = make_chain(3, difficulty=1)
+    table = checkpoints.Checkpoints([(1, 'ab' * 32)])
+    with block_store.BlockStore(str(tmp_path)) as store:
+        for b in blocks:
+            store.append(b)
+        with chain_validator.ChainValidator(workers=1) as validator:
+            report = validator.validate(store, checkpoints=table)
+    assert report.errors == [(1, errs.CHAIN_CHECKPOINT_MISMATCH)]
+    assert report.trusted == 0
+
+
+def test_n_checkpoint_beyond_chain(tmp_path, make_chain):
+    blocks = make_chain(5, difficulty=1)
+    for height in range(5):                                    # связанные блоки без доказательства работы
+        blocks[height].header.difficulty = 64
+        if height:
+            blocks[height].header.prev_hash = blocks[height - 1].header.hash()
+    table = checkpoints.Checkpoints([(1000, 'ab' * 32)])
+    with block_store.BlockStore(str(tmp_path)) as store:
+        for b in blocks:
+            store.append(b)
+        with chain_validator.ChainValidator(workers=1) as validator:
+            report = validator.validate(store, checkpoints=table)
+    assert not report.valid
+    assert report.trusted == 0
+    assert (0, errs.CHAIN_DIFFICULTY_NOT_MET) in report.errors
+
+
+def test_p_checkpoints_for_version():
+    assert checkpoints.Checkpoints.for_version().last_height == -1
+    assert len(checkpoints.Checkpoints.for_version('unknown')) == 0
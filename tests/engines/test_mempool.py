@@ -0,0 +1,90 @@
+from pytest import raises
+
+from src.engines import mempool
+from src.entities import block_wire
+from src.entities import tx_message
+from src.frontier import chronos
+
+
+def _messages(count: int) -> list[tx_message.TxMessage]:
+    moment = chronos.this_moment()
+    return [tx_message.TxMessage.from_fields(moment, 'sender', 'acceptor', f'content {i:03d}', '')
+            for i in range(count)]
+
+
+def test_p_fifo_and_duplicates():
+    pool = mempool.Mempool()
+    messages = _messages(10)
+    assert pool.add_many(messages) == 10
+    assert not pool.add(tx_message.TxMessage.from_fields(messages[3].moment, 'sender', 'acceptor', 'content 003', ''))
+    assert messages[3] in pool
+    assert pool.best(10 ** 6) == messages
+    size = block_wire.tx_size(messages[0])
+    assert pool.take(3 * size) == messages[:3]
+    assert len(pool) == 7
+    assert pool.size_in_bytes == 7 * size
+
+
+def test_p_priority_and_eviction():
+    messages = _messages(10)
+    size = block_wire.tx_size(messages[0])
+    pool = mempool.Mempool(max_bytes=4 * size, priority=lambda tx: int(tx.content[-3:]))
+    pool.add_many(messages)
+    assert len(pool) == 4
+    assert pool.best(10 * size) == messages[:5:-1]
+    assert not pool.add(messages[0])
+
+
+def test_p_remove_and_compact():
+    messages = _messages(3000)
+    pool = mempool.Mempool()
+    pool.add_many(messages)
+    assert pool.remove_many(messages[:2900]) == 2900
+    assert not pool.remove(messages[0])
+    assert pool.heap_records < 2 * mempool.COMPACT_MIN
+    assert pool.take(10 ** 6) == messages[2900:]
+    assert pool.size_in_bytes == 0
+
+
+def test_p_heaps_bounded_after_take():
+    pool = mempool.Mempool()
+    for _ in range(50):
+        messages = _messages(1000)
+        pool.add_many(messages)
+        assert pool.take(10 ** 9) == messages
+        assert len(pool) == 0
+    assert pool.heap_records <= mempool.COMPACT_MIN + 1000
+    messages = _messages(10)
+    pool.add_many(messages)
+    pool.remove_many(messages[:5])
+    assert pool.best(10 ** 9) == messages[5:]
+
+
+def test_p_interleaved_oversized_txs():
+    moment = chronos.this_moment()
+    small = _messages(100)
+    large = [tx_message.TxMessage.from_fields(moment, 'sender', 'acceptor', f'{i:03d}' + 'x' * 100_000, '')
+             for i in range(100)]
+    pool = mempool.Mempool()
+    for big, msg in zip(large, small):                          # по приоритету: большая, малая, большая...
+        pool.add(big)
+        pool.add(msg)
+    budget = sum(map(block_wire.tx_size, small))
+    assert pool.best(budget) == small
+    assert pool.take(budget) == small
+    assert len(pool) == 100
+
+
+def test_n_size_limit():
+    with raises(ValueError):
+        mempool.Mempool(max_bytes=0)
+    assert not mempool.Mempool(max_bytes=10).add(_messages(1)[0])
+
+
+def test_p_stamp_breaks_priority_ties():
+    moment = chronos.this_moment()
+    messages = [tx_message.TxMessage.from_fields(moment, 'sender', 'acceptor', f'content {i}', '', stamp=10 - i)
+                for i in range(5)]
+    pool = mempool.Mempool()
+    pool.add_many(messages)
+    assert pool.best(10 ** 6) == messages[::-1]
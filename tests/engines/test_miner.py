@@ -0,0 +1,38 @@
+from pytest import raises
+
+from src.entities import block_header
+from src.engines import miner
+
+
+def test_p_mining_finds_nonce():
+    bh = block_header.BlockHeader(True)
+    bh.difficulty = 2
+    with miner.Miner(2) as mnr:
+        result = mnr.mine(bh)
+    assert result.found
+    assert bh.nonce == result.nonce
+    assert bh.meets_difficulty()
+    assert bh.hash().startswith('00')
+    assert result.attempts >= 1
+
+
+def test_p_mining_not_found_in_range():
+    bh = block_header.BlockHeader(True)
+    bh.difficulty = 16
+    with miner.Miner(2) as mnr:
+        result = mnr.mine(bh, 0, 99)
+    assert not result.found
+    assert result.attempts == 100
+    assert bh.nonce == block_header.INIT_NONCE
+
+
+def test_n_mining_incorrect_workers():
+    with raises(ValueError):
+        miner.Miner(0)
+
+
+def test_n_mining_incorrect_range():
+    bh = block_header.BlockHeader(True)
+    with miner.Miner(1) as mnr:
+        with raises(ValueError):
+            mnr.mine(bh, 10, 5)
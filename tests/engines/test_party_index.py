@@ -0,0 +1,75 @@
+import os
+
+from pytest import raises
+
+from src.engines import block_store
+from src.engines import party_index
+
+
+def test_p_history_pages(tmp_path, make_chain):
+    index = party_index.PartyIndex(str(tmp_path / 'parties.idx'))
+    for b in make_chain(200, txs=3):
+        index.add_block(b)
+    assert index.count('sender 0') == 200
+    assert index.count('bank') == 200
+    page, cursor = index.history('sender 1', limit=3)
+    assert page == [(0, 1), (1, 1), (2, 1)]
+    collected = page
+    while cursor is not None:
+        page, cursor = index.history('sender 1', limit=64, cursor=cursor)
+        collected += page
+    assert collected == [(h, 1) for h in range(200)]
+    assert index.history('nobody') == ([], None)
+
+
+def test_p_persist_and_update(tmp_path, make_chain):
+    blocks = make_chain(6, txs=3)
+    path = str(tmp_path / 'parties.idx')
+    with block_store.BlockStore(str(tmp_path / 'store')) as store:
+        for b in blocks[:4]:
+            store.append(b)
+        with party_index.PartyIndex(path) as index:
+            assert index.update(store) == 4
+        for b in blocks[4:]:
+            store.append(b)
+        with party_index.PartyIndex(path) as index:
+            assert index.height == 4
+            assert index.update(store) == 2
+            assert index.history('sender 2', limit=10)[0] == [(h, 2) for h in range(6)]
+
+
+def test_n_height_out_of_order(tmp_path, make_chain):
+    index = party_index.PartyIndex(str(tmp_path / 'parties.idx'))
+    with raises(ValueError):
+        index.add_block(make_chain(2, txs=3)[1])
+
+
+def test_p_saves_append_to_journal(tmp_path, make_chain, monkeypatch):
+    monkeypatch.setattr(party_index, 'JOURNAL_COMPACT_RATIO', 100)
+    blocks = make_chain(30, txs=3)
+    path = str(tmp_path / 'parties.idx')
+    journal = path + party_index.JOURNAL_SUFFIX
+    index = party_index.PartyIndex(path)
+    index.add_block(blocks[0])
+    index.save()                                               # первый пакет сразу переносится в снимок
+    snapshot_size = os.path.getsize(path)
+    assert os.path.getsize(journal) == 0
+    for b in blocks[1:3]:
+        index.add_block(b)
+        index.save()
+    assert os.path.getsize(path) == snapshot_size
+    assert os.path.getsize(journal) > 0
+    monkeypatch.undo()
+    for b in blocks[3:]:
+        index.add_block(b)
+        index.save()
+    assert os.path.getsize(journal) <= os.path.getsize(path)
+    index.close()
+    with open(journal, 'ab') as f:
+        f.write(b'\x00\x01')                                   # незавершенный пакет (например, при сбое)
+    with party_index.PartyIndex(path) as index:
+        assert index.height == 30
+        assert index.history('bank', limit=100)[0] == [(h, 1) for h in range(30)]
+        index.add_block(make_chain(31, txs=3)[30])
+    with party_index.PartyIndex(path) as index:
+        assert index.count('sender 0') == 31
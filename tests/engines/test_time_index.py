@@ -0,0 +1,56 @@
+import os
+
+from src.engines import block_store
+from src.engines import time_index
+
+
+def test_p_heights_between_us(tmp_path):
+    index = time_index.TimeIndex(str(tmp_path / 'times.idx'))
+    for moment_us in (10, 20, 30, 25, 40, 20):
+        index.add(moment_us)
+    assert len(index) == 6
+    assert index.heights_between_us(20, 30) == [1, 3, 5]
+    assert index.heights_between_us(0, 100) == list(range(6))
+    assert index.heights_between_us(41, 100) == []
+    assert index.heights_between_us(30, 20) == []
+
+
+def test_p_persist_update_and_messages(tmp_path, make_chain):
+    blocks = make_chain(6)
+    path = str(tmp_path / 'times.idx')
+    with block_store.BlockStore(str(tmp_path / 'store')) as store:
+        for b in blocks[:4]:
+            store.append(b)
+        with time_index.TimeIndex(path) as index:
+            assert index.update(store) == 4
+        for b in blocks[4:]:
+            store.append(b)
+        with time_index.TimeIndex(path) as index:
+            assert len(index) == 4
+            assert index.update(store) == 2
+            first, last = blocks[2].header.moment, blocks[5].header.moment
+            assert index.heights_between(first, last) == [h for h in range(6)
+                                                          if first <= blocks[h].header.moment < last]
+            messages = list(index.messages_between(store, first, last))
+            assert [tx.content for _, _, tx in messages] == [f'content {h}/{p}' for h, p, _ in messages]
+
+
+def test_p_merge_keeps_answers(tmp_path, monkeypatch):
+    monkeypatch.setattr(time_index, 'MERGE_MIN', 4)
+    path = str(tmp_path / 'times.idx')
+    moments = [(h * 7919) % 101 for h in range(60)]           # моменты не по порядку
+    index = time_index.TimeIndex(path)
+    for count, moment_us in enumerate(moments, 1):
+        index.add(moment_us)
+        if count % 5 == 0:
+            index.save()
+    index.add(50)
+    moments.append(50)
+    index.close()
+    assert os.path.getsize(path + time_index.ORDER_SUFFIX) > 0
+    with open(path, 'ab') as f:
+        f.write(b'\x00\x01')                                   # незавершенная запись (например, при сбое)
+    with time_index.TimeIndex(path) as index:
+        assert len(index) == 61
+        for first, last in ((0, 101), (10, 20), (50, 51), (100, 200)):
+            assert index.heights_between_us(first, last) == [h for h, m in enumerate(moments) if first <= m < last]
@@ -0,0 +1,51 @@
+import datetime
+import io
+
+from src.engines import tx_ingest
+from src.entities import block
+from src.entities import tx_message
+
+
+def test_p_batch_shares_moment():
+    records = [{'sender': 'alice', 'acceptor': 'bob', 'content': f'm{i}'} for i in range(5)]
+    msgs = tx_ingest.messages_from_records(records)
+    assert len(msgs) == 5
+    assert len({msg.moment for msg in msgs}) == 1
+    assert msgs[3].content == 'm3'
+    assert msgs[0].as_dict()['moment'] == msgs[0].moment_str
+
+
+def test_p_batch_matches_single_construction():
+    msg = tx_ingest.messages_from_records([{'sender': 'alice', 'acceptor': 'bob', 'content': 'hi'}])[0]
+    single = tx_message.TxMessage.from_fields(msg.moment, 'alice', 'bob', 'hi', tx_message.NO_SIGNATURE)
+    assert msg.as_bytes() == single.as_bytes()
+
+
+def test_n_batch_incorrect_fields_fall_back_to_defaults():
+    msg = tx_ingest.messages_from_records([{'sender': 5, 'content': ''}])[0]
+    assert msg.sender == tx_message.SENDER_UNDEFINED
+    assert msg.acceptor == tx_message.ACCEPTOR_UNDEFINED
+    assert msg.content == tx_message.EMPTY_MESSAGE
+
+
+def test_p_ndjson_batches():
+    stream = io.StringIO('\n'.join('{"sender": "s%d", "content": "c"}' % i for i in range(7)) + '\n\n')
+    batches = list(tx_ingest.messages_from_ndjson(stream, batch_size=3))
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert batches[2][0].sender == 's6'
+
+
+def test_p_batch_gets_consecutive_stamps():
+    msgs = tx_ingest.messages_from_records([{'sender': 'a'}, {'sender': 'b'}, {'sender': 'c'}])
+    assert [m.stamp - msgs[0].stamp for m in msgs] == [0, 1, 2]
+    assert tx_message.TxMessage().stamp > msgs[-1].stamp
+
+
+def test_p_non_utc_moment_survives_block():
+    moment = datetime.datetime(2024, 6, 1, 15, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=3)))
+    msg = tx_ingest.messages_from_records([{'sender': 'alice', 'content': 'hi'}], moment)[0]
+    assert msg.moment == moment
+    assert msg.moment.tzinfo is datetime.UTC
+    b = block.Block(True)
+    b.add_tx(msg)
+    assert b.content.txs[0].hash() == msg.hash()
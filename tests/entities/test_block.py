@@ -0,0 +1,91 @@
+import io
+
+from src.entities import block
+from src.entities import block_wire
+from src.entities import tx_message
+from src.frontier import jsonifier
+
+
+def _message(i: int) -> tx_message.TxMessage:
+    msg = tx_message.TxMessage()
+    msg.sender = 'alice'
+    msg.acceptor = 'bob'
+    msg.content = 'сообщение ' * i
+    return msg
+
+
+def test_p_empty_block_size():
+    b = block.Block(True)
+    assert b.size_in_bytes() == block_wire.EMPTY_BLOCK_SIZE
+    assert len(b.as_bytes()) == b.size_in_bytes()
+
+
+def test_p_running_size_matches_encoding():
+    b = block.Block(True)
+    for i in range(1, 6):
+        b.add_tx(_message(i))
+        assert len(b.as_bytes()) == b.size_in_bytes()
+
+
+def test_p_fits():
+    b = block.Block(True)
+    msg = _message(3)
+    limit = b.size_in_bytes() + block_wire.tx_size(msg)
+    assert b.fits(msg, limit)
+    assert not b.fits(msg, limit - 1)
+
+
+def test_p_block_round_trip():
+    b = block.Block(True)
+    for i in range(1, 4):
+        b.add_tx(_message(i))
+    raw = b'\x00' * 5 + b.as_bytes()
+    restored = block.Block.from_buffer(memoryview(raw), 5)
+    assert restored.header.hash() == b.header.hash()
+    assert restored.content.merkle_root == b.content.merkle_root
+    assert restored.size_in_bytes() == b.size_in_bytes()
+    assert [tx.as_dict() for tx in restored.content.txs] == [tx.as_dict() for tx in b.content.txs]
+
+
+def test_p_extend_matches_add_tx():
+    messages = []
+    for i in range(7):
+        msg = tx_message.TxMessage()
+        msg.sender = f'sender {i % 3}'
+        msg.content = f'content {i}'
+        messages.append(msg)
+    one_by_one, bulk = block.Block(True), block.Block(True)
+    for msg in messages:
+        one_by_one.add_tx(msg)
+    bulk.add_tx(messages[0])
+    bulk.extend(messages[1:])
+    assert bulk.header.merkle_root == one_by_one.header.merkle_root
+    assert bulk.size_in_bytes() == one_by_one.size_in_bytes() == len(bulk.as_bytes())
+    assert bulk.content.position_of(messages[5]) == 5
+
+
+def test_p_dict_round_trip():
+    b = block.Block(True)
+    b.header.short_version.major = 1
+    for i in range(5):
+        b.add_tx(_message(i))
+    restored = block.Block.from_dict(b.as_dict())
+    assert restored.as_bytes() == b.as_bytes()
+    assert restored.header.hash() == b.header.hash()
+    assert restored.content.merkle_root == b.header.merkle_root
+
+
+def test_p_pack_unpack_blocks():
+    blocks = []
+    for height in range(3):
+        b = block.Block(height == 0)
+        b.header.height = height
+        b.header.prev_hash = blocks[-1].header.hash() if blocks else b.header.prev_hash
+        for i in range(height + 1):
+            b.add_tx(_message(i))
+        blocks.append(b)
+    for serializer in (jsonifier.JSON, jsonifier.MSGPACK):
+        stream = io.BytesIO()
+        assert block.pack_blocks(blocks, stream, serializer) == 3
+        stream.seek(0)
+        assert [b.as_bytes() for b in block.unpack_blocks(stream, serializer)] == [b.as_bytes() for b in blocks]
@@ -0,0 +1,73 @@
+from pytest import raises
+
+from src.entities import block_header
+from src.entities import block_header_wire as wire
+from src.frontier import cryptographer
+
+
+def test_p_hash_via_midstate():
+    bh = block_header.BlockHeader(True)
+    bh.nonce = 12345
+    tail = block_header.nonce_as_bytes(bh.nonce)
+    assert cryptographer.sha256_from_midstate(bh.midstate(), tail) == bh.hash_bytes()
+
+
+def test_p_hash_depends_on_nonce():
+    bh = block_header.BlockHeader(True)
+    bh.nonce = 1
+    first = bh.hash()
+    bh.nonce = 2
+    assert bh.hash() != first
+    assert len(first) == 64
+
+
+def test_p_wire_round_trip():
+    bh = block_header.BlockHeader(True)
+    bh.nonce = 42
+    raw = bh.as_wire_bytes()
+    assert len(raw) == wire.HEADER_SIZE
+    restored = block_header.BlockHeader.from_buffer(raw)
+    assert restored.as_dict() == bh.as_dict()
+    assert restored.hash() == bh.hash()
+
+
+def test_p_wire_view_is_lazy_and_zero_copy():
+    bh = block_header.BlockHeader(True)
+    bh.nonce = 7
+    buf = bytearray(b'\xff' * 3) + bh.as_wire_bytes()
+    view = wire.BlockHeaderView.from_buffer(buf, 3)
+    assert view.buffer.obj is buf
+    assert view.height == bh.height
+    assert view.nonce == 7
+    assert view.genesis is True
+    assert view.moment == bh.moment
+    assert view.hash_bytes() == bh.hash_bytes()
+
+
+def test_n_wire_view_short_buffer():
+    with raises(ValueError):
+        wire.BlockHeaderView.from_buffer(bytes(10))
+
+
+def test_n_wire_incorrect_hash():
+    bh = block_header.BlockHeader()
+    with raises(ValueError):
+        bh.as_wire_bytes()
+
+
+def test_p_cached_forms_invalidated_by_setters():
+    bh = block_header.BlockHeader(True)
+    assert bh.as_dict() is bh.as_dict()
+    first = bh.hash()
+    bh.nonce = 1
+    assert bh.as_dict()['nonce'] == '1'
+    assert bh.hash() != first
+    second = bh.hash()
+    bh.short_version.patch = 1
+    assert bh.hash() != second
+
+
+def test_p_sizes():
+    bh = block_header.BlockHeader(True)
+    assert bh.size_in_bytes() == len(bh.as_bytes())
+    assert bh.wire_size() == len(bh.as_wire_bytes()) == wire.HEADER_SIZE
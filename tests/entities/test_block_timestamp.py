@@ -0,0 +1,36 @@
+from array import array
+
+from src.entities import block_timestamp
+from src.frontier import chronos
+
+
+def test_p_default_is_now():
+    before = chronos.now_epoch_us()
+    ts = block_timestamp.LargeHeaderTimestamp()
+    assert before <= ts.epoch_us <= chronos.now_epoch_us()
+
+
+def test_p_epoch_and_formatting():
+    ts = block_timestamp.LargeHeaderTimestamp(1_500_000)
+    assert ts.as_str() == '01.01.2024 00:00:01.500000'
+    assert ts.moment == chronos.epoch_us_to_moment(1_500_000)
+    assert block_timestamp.LargeHeaderTimestamp.from_moment(ts.moment) == ts
+    assert 'Moscow date/time: 2024-01-01 03:00:01.500000+03:00' in repr(ts)
+
+
+def test_p_bytes_round_trip():
+    ts = block_timestamp.LargeHeaderTimestamp(123_456_789)
+    data = ts.to_bytes()
+    assert len(data) == block_timestamp.TIMESTAMP_STRUCT.size
+    assert block_timestamp.LargeHeaderTimestamp.from_bytes(b'\x00' + data, 1) == ts
+    assert block_timestamp.LargeHeaderTimestamp(-1) < ts
+
+
+def test_p_bulk_conversion():
+    stamps = [block_timestamp.LargeHeaderTimestamp(v) for v in (0, 1, 2 ** 40, -5)]
+    values = block_timestamp.to_array(stamps)
+    assert values == array('q', [0, 1, 2 ** 40, -5])
+    data = block_timestamp.array_to_bytes(values)
+    assert data == b''.join(s.to_bytes() for s in stamps)
+    assert block_timestamp.bytes_to_array(data) == values
+    assert block_timestamp.from_array(values) == stamps
@@ -0,0 +1,31 @@
+from src.entities import block
+from src.entities import bloom_filter
+from src.entities import tx_message
+
+
+def test_p_no_false_negatives():
+    bloom = bloom_filter.BloomFilter(1000)
+    keys = [f'key {i}'.encode() for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f'other {i}'.encode() in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_p_for_block_round_trip():
+    b = block.Block(True)
+    msg = tx_message.TxMessage()
+    msg.sender = 'alice'
+    msg.acceptor = 'bob'
+    b.add_tx(msg)
+    bloom = bloom_filter.BloomFilter.from_bytes(bloom_filter.BloomFilter.for_block(b).as_bytes())
+    assert b'alice' in bloom
+    assert b'bob' in bloom
+    assert msg.hash_bytes() in bloom
+    assert bloom_filter.might_contain(bloom.as_bytes(), bloom_filter.key_hashes(b'bob'))
+
+
+def test_n_empty_filter():
+    bloom = bloom_filter.BloomFilter(0)
+    assert b'anything' not in bloom
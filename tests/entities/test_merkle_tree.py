@@ -0,0 +1,115 @@
+from pytest import raises
+
+from src.entities import block
+from src.entities import merkle_tree
+from src.entities import tx_message
+from src.frontier import cryptographer
+from src.ground import cnst
+
+
+def _naive_root(leaves: list[bytes]) -> bytes:
+    level = list(leaves)
+    while len(level) > 1:
+        level = [cryptographer.sha256(level[i] + level[i + 1]) if i + 1 < len(level) else level[i]
+                 for i in range(0, len(level), 2)]
+    return level[0]
+
+
+def test_p_empty_tree():
+    tree = merkle_tree.MerkleTree()
+    assert tree.root() == cnst.ZERO_HASH
+
+
+def test_p_incremental_root_matches_full_rebuild():
+    tree = merkle_tree.MerkleTree()
+    leaves = []
+    for i in range(33):
+        leaf = cryptographer.sha256(str(i).encode())
+        leaves.append(leaf)
+        tree.append(leaf)
+        assert tree.root_bytes() == _naive_root(leaves)
+
+
+def test_p_block_keeps_merkle_root_in_header():
+    b = block.Block(True)
+    for i in range(3):
+        msg = tx_message.TxMessage()
+        msg.content = f'message {i}'
+        b.add_tx(msg)
+    assert len(b.content) == 3
+    assert b.header.merkle_root == b.content.merkle_root
+    assert b.header.merkle_root == _naive_root([tx.hash_bytes() for tx in b.content.txs]).hex()
+
+
+def test_p_batch_proofs_verify():
+    tree = merkle_tree.MerkleTree()
+    leaves = [cryptographer.sha256(str(i).encode()) for i in range(13)]
+    for leaf in leaves:
+        tree.append(leaf)
+    proofs = tree.proofs(range(13))
+    assert merkle_tree.verify_batch(tree.root(), zip(leaves, proofs)) == [True] * 13
+
+
+def test_n_batch_proofs_wrong_leaf():
+    tree = merkle_tree.MerkleTree()
+    leaves = [cryptographer.sha256(str(i).encode()) for i in range(6)]
+    for leaf in leaves:
+        tree.append(leaf)
+    proofs = tree.proofs([0, 1, 5])
+    items = [(leaves[0], proofs[0]), (leaves[2], proofs[1]), (leaves[5], proofs[2])]
+    assert merkle_tree.verify_batch(tree.root(), items) == [True, False, True]
+
+
+def test_p_block_txs_proofs_against_header():
+    b = block.Block(True)
+    msgs = []
+    for i in range(5):
+        msg = tx_message.TxMessage()
+        msg.content = f'message {i}'
+        msgs.append(msg)
+        b.add_tx(msg)
+    proofs = b.content.proofs_for(msgs[1:4])
+    items = [(msg.hash_bytes(), proof) for msg, proof in zip(msgs[1:4], proofs)]
+    assert merkle_tree.verify_batch(b.header.merkle_root, items) == [True, True, True]
+
+
+def test_p_extend_matches_incremental():
+    leaves = [cryptographer.sha256(str(i).encode()) for i in range(41)]
+    for split in (0, 1, 2, 7, 16, 40):
+        tree = merkle_tree.MerkleTree()
+        for leaf in leaves[:split]:
+            tree.append(leaf)
+        tree.extend(leaves[split:])
+        assert tree.root_bytes() == _naive_root(leaves)
+        tree.append(leaves[0])
+        assert tree.root_bytes() == _naive_root(leaves + leaves[:1])
+
+
+def test_n_duplicated_tail_changes_root():
+    leaves = [cryptographer.sha256(str(i).encode()) for i in range(3)]
+    tree = merkle_tree.MerkleTree()
+    tree.extend(leaves)
+    forged = merkle_tree.MerkleTree()
+    forged.extend(leaves + leaves[-1:])
+    assert tree.root() != forged.root()
+
+
+def test_n_block_rejects_duplicate_tx():
+    b = block.Block(True)
+    msgs = []
+    for i in range(3):
+        msg = tx_message.TxMessage()
+        msg.content = f'message {i}'
+        msgs.append(msg)
+    b.extend(msgs)
+    root = b.header.merkle_root
+    with raises(ValueError):
+        b.add_tx(msgs[-1])
+    with raises(ValueError):
+        b.extend([msgs[0]])
+    fresh = tx_message.TxMessage()
+    fresh.content = 'fresh'
+    with raises(ValueError):
+        b.extend([fresh, fresh])
+    assert len(b.content) == 3
+    assert b.header.merkle_root == root
@@ -0,0 +1,47 @@
+import datetime
+
+from pytest import raises
+
+from src.entities import tx_columns
+from src.entities import tx_message
+
+
+def _message(sender: str, acceptor: str, content: str) -> tx_message.TxMessage:
+    msg = tx_message.TxMessage()
+    msg.sender = sender
+    msg.acceptor = acceptor
+    msg.content = content
+    return msg
+
+
+def test_p_views_match_originals():
+    store = tx_columns.TxColumns()
+    originals = [_message('alice', 'bob', 'привет'), _message('bob', 'alice', 'hi'), _message('carol', 'bob', 'x')]
+    for msg in originals:
+        store.append(msg)
+    assert len(store) == 3
+    assert len(store.parties) == 3
+    for original, view in zip(originals, store):
+        assert view.as_dict() == original.as_dict()
+        assert view.hash() == original.hash()
+    assert store[-1].sender == 'carol'
+    assert store.content_of(0).decode() == 'привет'
+
+
+def test_p_non_utc_moment_round_trip():
+    moment = datetime.datetime(2024, 6, 1, 15, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=3)))
+    original = tx_message.TxMessage.from_fields(moment, 'alice', 'bob', 'hi', '')
+    assert original.moment_str == '01.06.2024 12:30:00.000000'
+    store = tx_columns.TxColumns()
+    store.append(original)
+    assert store[0].hash() == original.hash()
+    with raises(ValueError):
+        tx_message.TxMessage.from_fields(moment.replace(tzinfo=None), 'alice', 'bob', 'hi', '')
+
+
+def test_p_positions_of_party():
+    store = tx_columns.TxColumns()
+    for sender, acceptor in (('alice', 'bob'), ('bob', 'carol'), ('carol', 'alice'), ('dave', 'erin')):
+        store.append(_message(sender, acceptor, 'x'))
+    assert store.positions_of_party('alice') == [0, 2]
+    assert store.positions_of_party('zed') == []
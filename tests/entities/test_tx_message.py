@@ -0,0 +1,53 @@
+from src.entities import tx_message
+
+
+def test_p_cached_forms():
+    msg = tx_message.TxMessage()
+    assert msg.as_dict() is msg.as_dict()
+    assert msg.as_bytes() is msg.as_bytes()
+    assert msg.number_of_members() == 5
+
+
+def test_p_setters_invalidate_cache():
+    msg = tx_message.TxMessage()
+    first = msg.hash()
+    msg.sender = 'alice'
+    second = msg.hash()
+    assert second != first
+    msg.acceptor = 'bob'
+    msg.content = 'hello'
+    assert msg.as_dict()['content'] == 'hello'
+    assert msg.hash() != second
+
+
+def test_n_ignored_setter_keeps_cache():
+    msg = tx_message.TxMessage()
+    cached = msg.as_bytes()
+    msg.content = ''
+    assert msg.as_bytes() is cached
+
+
+def test_p_compact_representation():
+    msg = tx_message.TxMessage()
+    assert not hasattr(msg, '__dict__')
+    assert msg.moment_str == msg.as_dict()['moment']
+
+
+def test_p_dict_and_record_round_trip():
+    msg = tx_message.TxMessage()
+    msg.sender = 'alice'
+    msg.content = 'привет'
+    for restored in (tx_message.TxMessage.from_dict(msg.as_dict()), tx_message.TxMessage.from_record(msg.as_record())):
+        assert restored.as_bytes() == msg.as_bytes()
+        assert restored.hash() == msg.hash()
+
+
+def test_p_dict_round_trip_non_canonical_moment():
+    source = {'moment': '01.02.2024 03:04:05.5', 'sender': 'alice', 'acceptor': 'bob', 'content': 'привет',
+              'signature': tx_message.NO_SIGNATURE}
+    msg = tx_message.TxMessage.from_dict(source)
+    assert msg.moment.microsecond == 500000
+    assert msg.as_dict()['moment'] == '01.02.2024 03:04:05.500000'
+    rebuilt = tx_message.TxMessage.from_fields(msg.moment, 'alice', 'bob', 'привет', tx_message.NO_SIGNATURE)
+    assert msg.hash() == rebuilt.hash()
+    assert tx_message.TxMessage.from_dict(msg.as_dict()).hash() == msg.hash()
@@ -0,0 +1,65 @@
+import datetime
+import threading
+
+from pytest import raises
+
+from src.frontier import chronos
+
+
+def test_p_epoch_us_round_trip():
+    moment = chronos.this_moment()
+    assert chronos.epoch_us_to_moment(chronos.moment_to_epoch_us(moment)) == moment
+    assert chronos.str_to_moment(chronos.moment_to_str(moment)) == moment
+
+
+def test_p_str_to_moment_short_fraction():
+    expected = datetime.datetime(2024, 2, 1, 3, 4, 5, 500000, tzinfo=datetime.UTC)
+    assert chronos.str_to_moment('01.02.2024 03:04:05.5') == expected
+    assert chronos.str_to_moment('01.02.2024 03:04:05.500000') == expected
+
+
+def test_n_str_to_moment_malformed():
+    for value in ('01x02y2024z03:04:05.123456abc', '01x02y2024z03:04:05.123456', '01.02.2024 03:04:05.12345+',
+                  '01.02.2024 03:04:05', ''):
+        with raises(ValueError):
+            chronos.str_to_moment(value)
+
+
+def test_p_hlc_monotonic_and_unique_across_threads():
+    clock = chronos.HybridLogicalClock()
+    stamps = []
+
+    def worker():
+        local = [clock.now() for _ in range(2000)]
+        assert local == sorted(local)
+        stamps.extend(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(set(stamps)) == 8000
+    assert max(stamps) == clock.last
+
+
+def test_p_hlc_update_and_reserve():
+    clock = chronos.HybridLogicalClock()
+    remote = clock.now() + (10 << chronos.HLC_LOGICAL_BITS)  # часы другого узла «спешат» на 10 мс
+    assert clock.update(remote) == remote + 1
+    first = clock.reserve(5)
+    assert first == remote + 2
+    assert clock.now() == first + 5
+    assert chronos.hlc_logical(first) == chronos.hlc_logical(remote) + 2
+    assert abs(chronos.hlc_to_moment(first) - chronos.this_moment()).total_seconds() < 1
+
+
+def test_n_hlc_reserve_and_drift():
+    clock = chronos.HybridLogicalClock()
+    for count in (0, -1):
+        with raises(ValueError):
+            clock.reserve(count)
+    last = clock.now()
+    with raises(ValueError):
+        clock.update(last + ((chronos.HLC_MAX_DRIFT_MS + 1000) << chronos.HLC_LOGICAL_BITS))
+    assert clock.last == last
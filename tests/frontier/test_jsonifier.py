@@ -0,0 +1,31 @@
+import io
+
+from pytest import raises
+
+from src.frontier import jsonifier
+
+
+def test_p_round_trip():
+    source = {'text': 'привет', 'number': 42, 'items': [1, 2, 3]}
+    for name in ('json', 'msgpack'):
+        s = jsonifier.serializer(name)
+        assert s.loads(s.dumps(source)) == source
+
+
+def test_p_streams():
+    objects = [{'n': i, 'text': f'line {i}\nwith newline'} for i in range(100)]
+    for s in (jsonifier.JSON, jsonifier.MSGPACK):
+        stream = io.BytesIO()
+        assert s.pack_stream(objects, stream) == 100
+        stream.seek(0)
+        assert list(s.unpack_stream(stream)) == objects
+
+
+def test_p_msgpack_is_smaller():
+    source = {'moment': '01.01.2024 00:00:00.000000', 'height': 12345, 'nonce': 2 ** 40}
+    assert len(jsonifier.MSGPACK.dumps(source)) < len(jsonifier.JSON.dumps(source))
+
+
+def test_n_unknown_serializer():
+    with raises(ValueError):
+        jsonifier.serializer('xml')
@@ -0,0 +1,72 @@
+from pytest import raises
+
+from src.ground import bits
+
+
+def test_p_byte_as_bits_str():
+    assert bits.byte_as_bits_str(0) == '00000000'
+    assert bits.byte_as_bits_str(0b10100101) == '10100101'
+    assert [bits.byte_as_bits_str(b) for b in range(256)] == [format(b, '08b') for b in range(256)]
+
+
+def test_n_byte_as_bits_str():
+    with raises(ValueError):
+        bits.byte_as_bits_str(256)
+    with raises(ValueError):
+        bits.byte_as_bits_str(-1)
+
+
+def test_p_byte_bits_to_int_and_get_bit():
+    assert bits.byte_bits_to_int('101') == 5
+    assert bits.get_bit(0b100, 2) == '1'
+    with raises(ValueError):
+        bits.byte_bits_to_int('101010101')
+
+
+def test_p_bytes_as_bits_str():
+    assert bits.bytes_as_bits_str(b'\x01\xff') == '0000000111111111'
+    assert bits.bytes_as_bits_str(memoryview(bytearray(b'\x80\x00')), ' ') == '10000000 00000000'
+    assert bits.bytes_as_bits_str(b'') == ''
+
+
+def test_p_layout_single_byte():
+    layout = bits.BitLayout((2, 3, 3))
+    assert layout.size == 1
+    assert layout.pack(1, 1, 1) == 0b01001001
+    assert layout.to_bytes(3, 7, 0) == b'\xf8'
+    assert layout.unpack(0b01001001) == (1, 1, 1)
+    assert layout.from_bytes(b'\x00\xf8', 1) == (3, 7, 0)
+    assert layout.unpack_many(bytes(range(256))) == [layout.unpack(b) for b in range(256)]
+    assert layout.as_bits_str(0b01001001) == '01 001 001'
+
+
+def test_p_layout_multi_byte():
+    layout = bits.BitLayout((8, 4, 4))
+    assert layout.size == 2
+    assert layout.to_bytes(255, 1, 15) == b'\xff\x1f'
+    assert layout.from_bytes(b'\xff\x1f') == (255, 1, 15)
+    assert layout.unpack_many(b'\xff\x1f\x01\x23') == [(255, 1, 15), (1, 2, 3)]
+    assert layout.fits(1, 15) and not layout.fits(1, 16)
+
+
+def test_n_layout():
+    with raises(ValueError):
+        bits.BitLayout((2, 3))
+    with raises(ValueError):
+        bits.BitLayout((0, 8))
+    with raises(ValueError):
+        bits.BitLayout(())
+    layout = bits.BitLayout((2, 3, 3))
+    with raises(ValueError):
+        layout.pack(4, 0, 0)
+    with raises(ValueError):
+        layout.pack(0, 0)
+    with raises(ValueError):
+        layout.unpack(256)
+    with raises(ValueError):
+        layout.from_bytes(b'\x01', 1)
+    wide = bits.BitLayout((8, 4, 4))
+    with raises(ValueError):
+        wide.from_bytes(b'\xff\x1f\x01', 2)
+    with raises(ValueError):
+        wide.unpack_many(b'\xff\x1f\x01')
@@ -90,3 +90,25 @@ def test_n_checking_patch_for_short_version():
     assert pv_hlpr.patch_for_short_version_is_correct(ph) is False
 
 
+def test_p_decoding_short_versions_in_bulk():
+    data = bytes(range(256))
+    majors, minors, patches = pv_hlpr.decode_short_versions(memoryview(data))
+    assert list(zip(majors, minors, patches)) == [pv_hlpr.decode_short_version(b) for b in data]
+
+
+def test_p_encoding_short_versions_in_bulk():
+    majors, minors, patches = pv_hlpr.decode_short_versions(bytes(range(256)))
+    assert pv_hlpr.encode_short_versions(majors, minors, patches) == bytes(range(256))
+    assert pv_hlpr.encode_short_versions([0, 3], [1, 7], [2, 0]) == bytes([0b00001010, 0b11111000])
+    assert pv_hlpr.encode_short_versions(b'', b'', b'') == b''
+
+
+def test_n_encoding_short_versions_in_bulk():
+    with raises(ValueError):
+        pv_hlpr.encode_short_versions([0, 4], [0, 0], [0, 0])
+    with raises(ValueError):
+        pv_hlpr.encode_short_versions([0, 0], [0, 8], [0, 0])
+    with raises(ValueError):
+        pv_hlpr.encode_short_versions([0, 0], [0, 0], [0, 8])
+    with raises(ValueError):
+        pv_hlpr.encode_short_versions([0], [0, 0], [0, 0])